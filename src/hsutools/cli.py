@@ -1,27 +1,21 @@
 from __future__ import annotations
 
+import json
 import os
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import click
 import typer
 
-from typer.main import get_command
-
 from . import __version__
-from .config import DEFAULT_IGNORE_NAMES, DEFAULT_OUTPUT_FILE, DOCX_EXTENSION
-from .core import (
-    categorize_files,
-    check_opencc_available,
-    convert_docx_directory,
-    convert_s2tw_recursive,
-    generate_path_md,
-    replace_names,
-    resize_images,
-)
+from .config import DEFAULT_IGNORE_NAMES, DEFAULT_OUTPUT_FILE, DEFAULT_RESIZE_PROFILE, DOCX_EXTENSION, RESIZE_PROFILES
 from .utils import build_executable, resolve_directory, resolve_path, iter_files
 from .i18n import ENV_LANG, get_lang, set_lang, tr
+from .profiling import span
 
 
 class LocalizedGroup(typer.core.TyperGroup):
@@ -36,11 +30,17 @@ class LocalizedGroup(typer.core.TyperGroup):
             lang_value = os.getenv(ENV_LANG)
         if lang_value:
             set_lang(lang_value)
-        _apply_locale_to_command(self)
+        ctx.meta["hsu.argv"] = list(args)
         return super().parse_args(ctx, args)
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
-        _apply_locale_to_command(self)
+        _apply_locale_to_command(ctx.find_root().command)
+        return super().format_help(ctx, formatter)
+
+
+class LocalizedCommand(typer.core.TyperCommand):
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        _apply_locale_to_command(ctx.find_root().command)
         return super().format_help(ctx, formatter)
 
 
@@ -54,20 +54,26 @@ COMMAND_HELP_KEYS = {
     "rename": "rename.help",
     "topdf": "topdf.help",
     "resize": "resize.help",
+    "resize-bench": "resizebench.help",
     "build-exe": "buildexe.help",
     "s2tw": "s2tw.help",
+    "serve": "serve.help",
 }
 
 OPTION_HELP_KEYS = {
     "app": {
         "lang": "option.lang",
         "version": "option.version",
+        "remote": "option.remote",
+        "profile": "option.profile",
+        "profile_dump": "option.profile_dump",
     },
     "cpath": {
         "path": "cpath.path",
         "output": "cpath.output",
         "max_depth": "cpath.max_depth",
         "ignore": "cpath.ignore",
+        "metrics_file": "option.metrics_file",
     },
     "filem": {
         "path": "filem.path",
@@ -106,6 +112,31 @@ OPTION_HELP_KEYS = {
         "recursive": "resize.recursive",
         "include_hidden": "resize.include_hidden",
         "ignore": "resize.ignore",
+        "jobs": "resize.jobs",
+        "max_pixels": "resize.max_pixels",
+        "passthrough": "resize.passthrough",
+        "dry_run": "resize.dry_run",
+        "encoder_profile": "resize.encoder_profile",
+        "checkpoint": "resize.checkpoint",
+        "watch": "resize.watch",
+        "settle": "resize.settle",
+        "report": "resize.report",
+        "output_archive": "resize.output_archive",
+        "dedup": "resize.dedup",
+        "metrics_file": "option.metrics_file",
+    },
+    "resize-bench": {
+        "input": "resize.input",
+        "sample": "resizebench.sample",
+        "width": "resize.width",
+        "height": "resize.height",
+        "max_width": "resize.max_width",
+        "max_height": "resize.max_height",
+        "quality": "resize.quality",
+        "output_format": "resize.format",
+        "recursive": "resize.recursive",
+        "include_hidden": "resize.include_hidden",
+        "ignore": "resize.ignore",
     },
     "build-exe": {
         "extra": "buildexe.extra",
@@ -114,44 +145,76 @@ OPTION_HELP_KEYS = {
         "path": "s2tw.path",
         "backup_dir": "s2tw.backup_dir",
         "no_backup": "s2tw.no_backup",
+        "backup_mode": "s2tw.backup_mode",
+        "office": "s2tw.office",
         "convert_names": "s2tw.convert_names",
         "ignore": "s2tw.ignore",
         "include_hidden": "s2tw.include_hidden",
+        "jobs": "s2tw.jobs",
+        "engine": "s2tw.engine",
+        "manifest": "s2tw.manifest",
+        "check": "s2tw.check",
+        "json_output": "s2tw.json",
+        "metrics_file": "option.metrics_file",
+    },
+    "serve": {
+        "socket_path": "serve.socket",
     },
 }
 
 
-def _apply_locale_to_command(cmd: typer.models.CommandInfo | typer.core.TyperCommand) -> None:
+# Typer/Click built-in options, localized on every command that has them.
+BUILTIN_OPTION_HELP_KEYS = {
+    "install_completion": "option.install_completion",
+    "show_completion": "option.show_completion",
+}
+
+
+@lru_cache(maxsize=None)
+def _localized_help(lang: str) -> dict[str, tuple[str | None, dict[str, str]]]:
+    """Command help and option help by name for every command, in ``lang``."""
+    table: dict[str, tuple[str | None, dict[str, str]]] = {}
+    for command_name in COMMAND_HELP_KEYS.keys() | OPTION_HELP_KEYS.keys():
+        help_key = COMMAND_HELP_KEYS.get(command_name)
+        option_keys = {**BUILTIN_OPTION_HELP_KEYS, **OPTION_HELP_KEYS.get(command_name, {})}
+        table[command_name] = (
+            tr(help_key, lang=lang) if help_key else None,
+            {name: tr(key, lang=lang) for name, key in option_keys.items()},
+        )
+    return table
+
+
+def _apply_locale_to_command(cmd: click.Command) -> None:
+    """Set the help text of ``cmd`` and its subcommands to the current language.
+
+    The strings come from a table built once per language, and a tree that
+    already shows the current language is left alone.
+    """
     lang = get_lang()
+    if getattr(cmd, "_help_lang", None) == lang:
+        return
+    _set_help(cmd, _localized_help(lang))
+    cmd._help_lang = lang  # type: ignore[attr-defined]
+
+
+def _set_help(cmd: click.Command, table: dict[str, tuple[str | None, dict[str, str]]]) -> None:
     command_name = cmd.name or "app"
     if command_name == "main":
         command_name = "app"
-    help_key = COMMAND_HELP_KEYS.get(command_name)
-    if help_key:
-        cmd.help = tr(help_key, lang=lang)
-
-    opt_keys = OPTION_HELP_KEYS.get(command_name, {})
-    for param in getattr(cmd, "params", []):
-        key = opt_keys.get(param.name)
-        if key:
-            param.help = tr(key, lang=lang)
-        # 處理 Typer/Click 內建選項
-        elif isinstance(param, click.Option):
-            if param.name == "install_completion":
-                param.help = tr("option.install_completion", lang=lang)
-            elif param.name == "show_completion":
-                param.help = tr("option.show_completion", lang=lang)
-
-    subcommands = getattr(cmd, "commands", {})
-    for sub in subcommands.values():
-        _apply_locale_to_command(sub)
+    help_text, options = table.get(command_name, (None, {}))
+    if help_text:
+        cmd.help = help_text
+    for param in cmd.params:
+        text = options.get(param.name or "")
+        if text:
+            param.help = text  # type: ignore[attr-defined]
+
+    for sub in getattr(cmd, "commands", {}).values():
+        _set_help(sub, table)
 
 
 def _lang_callback(value: Optional[str]) -> Optional[str]:
     set_lang(value)
-    ctx = click.get_current_context(silent=True)
-    if ctx and ctx.command:
-        _apply_locale_to_command(ctx.command)
     return value
 
 
@@ -161,8 +224,65 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _remote_callback(ctx: typer.Context, value: bool) -> None:
+    if value:
+        from .server import forward, split_remote
+
+        _, argv = split_remote(ctx.meta.get("hsu.argv", []))
+        raise typer.Exit(forward(argv))
+
+
+def _print_profile() -> None:
+    from . import profiling
+
+    timings, elapsed = profiling.stop()
+    typer.echo(f"\n{'phase':<10} {'calls':>7} {'seconds':>9} {'% wall':>7}", err=True)
+    for row in sorted(timings, key=lambda row: row.seconds, reverse=True):
+        share = row.seconds * 100 / elapsed if elapsed else 0.0
+        typer.echo(f"{row.phase:<10} {row.calls:>7} {row.seconds:>9.3f} {share:>7.1f}", err=True)
+    typer.echo(f"{'wall':<10} {'':>7} {elapsed:>9.3f}", err=True)
+
+
+@contextmanager
+def _job_metrics(metrics_file: Optional[Path], command: str) -> Iterator[dict]:
+    """Time the block and write ``--metrics-file`` from the counts it fills in.
+
+    Phase times are the spans recorded inside the block, so a ``--profile``
+    run that was already timing earlier phases does not skew them.
+    """
+    counts: dict = {}
+    if metrics_file is None:
+        yield counts
+        return
+
+    from . import profiling
+    from .metrics import JobMetrics, write_textfile
+
+    owns_timers = not profiling.enabled()
+    if owns_timers:
+        profiling.start()
+    before = {row.phase: row for row in profiling.snapshot()[0]}
+    started = time.perf_counter()
+    try:
+        yield counts
+        duration = time.perf_counter() - started
+        phases = []
+        for row in profiling.snapshot()[0]:
+            earlier = before.get(row.phase)
+            if earlier is not None:
+                row = row._replace(calls=row.calls - earlier.calls, seconds=row.seconds - earlier.seconds)
+            if row.calls:
+                phases.append(row)
+        values = {"scanned": 0, "processed": 0, "skipped": 0, "errored": 0, "bytes_read": 0, "bytes_written": 0}
+        write_textfile(metrics_file, JobMetrics(command=command, phases=phases, duration=duration, **{**values, **counts}))
+    finally:
+        if owns_timers:
+            profiling.stop()
+
+
 @app.callback()
 def main(
+    ctx: typer.Context,
     lang: Optional[str] = typer.Option(  # noqa: B008
         None,
         "--lang",
@@ -180,13 +300,36 @@ def main(
         is_eager=True,
         help=tr("option.version"),
     ),
+    remote: bool = typer.Option(  # noqa: B008
+        False,
+        "--remote",
+        callback=_remote_callback,
+        is_eager=True,
+        help=tr("option.remote"),
+    ),
+    profile: bool = typer.Option(  # noqa: B008
+        False,
+        "--profile",
+        help=tr("option.profile"),
+    ),
+    profile_dump: Optional[Path] = typer.Option(  # noqa: B008
+        None,
+        "--profile-dump",
+        dir_okay=False,
+        help=tr("option.profile_dump"),
+    ),
 ) -> None:
     """Root callback to support global options."""
     if lang:
         set_lang(lang)
+    if profile or profile_dump is not None:
+        from . import profiling
 
+        profiling.start(profile_dump)
+        ctx.call_on_close(_print_profile)
 
-@app.command(help=tr("cpath.help"))
+
+@app.command(cls=LocalizedCommand, help=tr("cpath.help"))
 def cpath(
     path: Path = typer.Option(".", exists=True, file_okay=False, dir_okay=True, help=tr("cpath.path")),
     output: str = typer.Option(DEFAULT_OUTPUT_FILE, help=tr("cpath.output")),
@@ -197,13 +340,21 @@ def cpath(
         "-i",
         help=tr("cpath.ignore"),
     ),
+    metrics_file: Optional[Path] = typer.Option(None, "--metrics-file", dir_okay=False, help=tr("option.metrics_file")),
 ) -> None:
+    from .core import generate_path_md
+
     directory = resolve_directory(path)
-    output_path = generate_path_md(directory, output_file=output, ignore_names=ignore or DEFAULT_IGNORE_NAMES, max_depth=max_depth)
+    with _job_metrics(metrics_file, "cpath") as counts:
+        output_path = generate_path_md(directory, output_file=output, ignore_names=ignore or DEFAULT_IGNORE_NAMES, max_depth=max_depth)
+        if metrics_file is not None:
+            # One line per listed entry.
+            entries = len(output_path.read_text(encoding="utf-8").splitlines())
+            counts.update(scanned=entries, processed=entries, bytes_written=output_path.stat().st_size)
     typer.echo(tr("cpath.created", path=output_path))
 
 
-@app.command(help=tr("filem.help"))
+@app.command(cls=LocalizedCommand, help=tr("filem.help"))
 def filem(
     path: Path = typer.Option(".", exists=True, file_okay=False, dir_okay=True, help=tr("filem.path")),
     mode: Optional[str] = typer.Option(
@@ -227,6 +378,8 @@ def filem(
         help=tr("filem.include_hidden"),
     ),
 ) -> None:
+    from .core import categorize_files
+
     if mode is None:
         mode = typer.prompt(
             tr("filem.prompt_mode"),
@@ -246,7 +399,8 @@ def filem(
     directory = resolve_directory(path)
     
     # Preview files to be moved
-    files_to_move = list(iter_files(directory, ignore_names=ignore or DEFAULT_IGNORE_NAMES, include_hidden=include_hidden))
+    with span("preview"):
+        files_to_move = list(iter_files(directory, ignore_names=ignore or DEFAULT_IGNORE_NAMES, include_hidden=include_hidden))
     
     if not files_to_move:
         typer.echo(tr("filem.none_found"))
@@ -273,7 +427,7 @@ def filem(
         typer.echo(f"✓ {tr('filem.success', count=len(moved))}")
 
 
-@app.command(help=tr("rename.help"))
+@app.command(cls=LocalizedCommand, help=tr("rename.help"))
 def rename(
     path: Path = typer.Option(".", exists=True, file_okay=False, dir_okay=True, help=tr("rename.path")),
     find_text: Optional[str] = typer.Option(None, "--find", help=tr("rename.find")),
@@ -297,6 +451,8 @@ def rename(
         help=tr("rename.include_hidden"),
     ),
 ) -> None:
+    from .core import replace_names
+
     if find_text is None:
         find_text = typer.prompt(tr("rename.prompt_find"))
     if replace_text is None:
@@ -307,14 +463,15 @@ def rename(
     # Preview matching entries
     ignore_set = set(ignore or DEFAULT_IGNORE_NAMES)
     matching_entries = []
-    for entry in directory.iterdir():
-        if not include_hidden and entry.name.startswith("."):
-            continue
-        if entry.name in ignore_set:
-            continue
-        if entry.is_file() or (include_dirs and entry.is_dir()):
-            if find_text in entry.name:
-                matching_entries.append(entry)
+    with span("preview"):
+        for entry in directory.iterdir():
+            if not include_hidden and entry.name.startswith("."):
+                continue
+            if entry.name in ignore_set:
+                continue
+            if entry.is_file() or (include_dirs and entry.is_dir()):
+                if find_text in entry.name:
+                    matching_entries.append(entry)
     
     if not matching_entries:
         typer.echo(tr("rename.none_found", text=find_text))
@@ -353,7 +510,7 @@ def rename(
         typer.echo(f"✓ {tr('rename.success', count=len(updated))}")
 
 
-@app.command(help=tr("topdf.help"))
+@app.command(cls=LocalizedCommand, help=tr("topdf.help"))
 def topdf(
     path: Path = typer.Option(".", exists=True, file_okay=False, dir_okay=True, help=tr("topdf.path")),
     ignore: list[str] = typer.Option(
@@ -369,6 +526,8 @@ def topdf(
         help=tr("topdf.include_hidden"),
     ),
 ) -> None:
+    from .core import convert_docx_directory
+
     directory = resolve_directory(path)
     
     # Preview files to convert
@@ -407,7 +566,7 @@ def topdf(
         typer.echo(f"✓ {tr('topdf.success', count=len(converted))}")
 
 
-@app.command(help=tr("resize.help"))
+@app.command(cls=LocalizedCommand, help=tr("resize.help"))
 def resize(
     input: Path = typer.Option(
         ".",
@@ -443,41 +602,270 @@ def resize(
         "-i",
         help=tr("resize.ignore"),
     ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help=tr("resize.jobs")),
+    max_pixels: Optional[int] = typer.Option(None, "--max-pixels", min=1, help=tr("resize.max_pixels")),
+    passthrough: str = typer.Option(
+        "copy",
+        "--passthrough",
+        case_sensitive=False,
+        help=tr("resize.passthrough"),
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", is_flag=True, help=tr("resize.dry_run")),
+    encoder_profile: str = typer.Option(
+        DEFAULT_RESIZE_PROFILE,
+        "--encoder-profile",
+        case_sensitive=False,
+        help=tr("resize.encoder_profile"),
+    ),
+    checkpoint: Optional[Path] = typer.Option(
+        None,
+        "--checkpoint",
+        file_okay=True,
+        dir_okay=False,
+        help=tr("resize.checkpoint"),
+    ),
+    watch: bool = typer.Option(False, "--watch", is_flag=True, help=tr("resize.watch")),
+    settle: float = typer.Option(2.0, "--settle", min=0.0, help=tr("resize.settle")),
+    report: Optional[Path] = typer.Option(
+        None,
+        "--report",
+        file_okay=True,
+        dir_okay=False,
+        help=tr("resize.report"),
+    ),
+    output_archive: Optional[Path] = typer.Option(
+        None,
+        "--output-archive",
+        file_okay=True,
+        dir_okay=False,
+        help=tr("resize.output_archive"),
+    ),
+    dedup: Optional[str] = typer.Option(None, "--dedup", case_sensitive=False, help=tr("resize.dedup")),
+    metrics_file: Optional[Path] = typer.Option(
+        None,
+        "--metrics-file",
+        file_okay=True,
+        dir_okay=False,
+        help=tr("option.metrics_file"),
+    ),
 ) -> None:
+    from .core import ResizeReport, plan_resize, resize_images, watch_resize
+
     if quality < 1 or quality > 100:
         raise typer.BadParameter(tr("resize.bad_quality"))
 
     if width is None and height is None and scale is None and max_width is None and max_height is None:
         raise typer.BadParameter(tr("resize.need_size"))
 
+    passthrough_mode = passthrough.lower()
+    if passthrough_mode not in {"copy", "link", "none"}:
+        raise typer.BadParameter(tr("resize.invalid_passthrough"))
+
+    dedup_mode = dedup.lower() if dedup else None
+    if dedup_mode not in {None, "link", "reflink"}:
+        raise typer.BadParameter(tr("resize.invalid_dedup"))
+
+    profile_name = encoder_profile.lower()
+    if profile_name not in RESIZE_PROFILES:
+        raise typer.BadParameter(tr("resize.invalid_profile", choices=", ".join(RESIZE_PROFILES)))
+
+    if output_archive is not None and (checkpoint is not None or watch or dry_run):
+        raise typer.BadParameter(tr("resize.archive_conflict"))
+    if output_archive is not None and not output_archive.name.lower().endswith((".zip", ".tar", ".tar.gz", ".tgz")):
+        raise typer.BadParameter(tr("resize.bad_archive"))
+    if watch and (report is not None or checkpoint is not None or dedup_mode is not None or metrics_file is not None):
+        raise typer.BadParameter(tr("resize.watch_conflict"))
+
+    source_dir = resolve_directory(input)
+
+    if dry_run:
+        plan = plan_resize(
+            source_dir,
+            output_dir=output,
+            width=width,
+            height=height,
+            max_width=max_width,
+            max_height=max_height,
+            scale=scale,
+            keep_aspect=keep_aspect,
+            allow_upscale=allow_upscale,
+            output_format=output_format,
+            suffix=suffix,
+            overwrite=overwrite,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            ignore_names=ignore or DEFAULT_IGNORE_NAMES,
+            passthrough=passthrough_mode,  # type: ignore[arg-type]
+            jobs=jobs,
+        )
+        for entry in plan:
+            relative = entry.source.relative_to(source_dir)
+            if entry.action == "resize":
+                (ow, oh), (tw, th) = entry.original_size, entry.target_size
+                typer.echo(f"  resize {relative}  {ow}x{oh} → {tw}x{th}")
+            else:
+                typer.echo(f"  {entry.action:<6} {relative}")
+        counts = {action: sum(1 for e in plan if e.action == action) for action in ("resize", "copy", "skip")}
+        typer.echo(f"\n{tr('resize.plan_summary', **counts)}")
+        return
+
+    if watch:
+        def echo_result(source: Path, destination: Optional[Path], error: Optional[BaseException]) -> None:
+            if error is not None:
+                typer.echo(f"✗ {source}: {error}", err=True)
+            else:
+                typer.echo(f"✓ {source} → {destination}")
+
+        typer.echo(tr("resize.watching", path=source_dir))
+        count = watch_resize(
+            source_dir,
+            output_dir=output,
+            width=width,
+            height=height,
+            max_width=max_width,
+            max_height=max_height,
+            scale=scale,
+            keep_aspect=keep_aspect,
+            allow_upscale=allow_upscale,
+            quality=quality,
+            output_format=output_format,
+            profile=profile_name,
+            suffix=suffix,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            ignore_names=ignore or DEFAULT_IGNORE_NAMES,
+            jobs=jobs,
+            max_pixels=max_pixels,
+            passthrough=passthrough_mode,  # type: ignore[arg-type]
+            settle=settle,
+            callback=echo_result,
+        )
+        typer.echo(f"\n{tr('resize.watch_stopped', count=count)}")
+        return
+
+    timings = ResizeReport() if report is not None or metrics_file is not None else None
+    try:
+        with _job_metrics(metrics_file, "resize") as counts:
+            written = resize_images(
+                source_dir,
+                output_dir=output,
+                width=width,
+                height=height,
+                max_width=max_width,
+                max_height=max_height,
+                scale=scale,
+                keep_aspect=keep_aspect,
+                allow_upscale=allow_upscale,
+                quality=quality,
+                output_format=output_format,
+                suffix=suffix,
+                overwrite=overwrite,
+                recursive=recursive,
+                include_hidden=include_hidden,
+                ignore_names=ignore or DEFAULT_IGNORE_NAMES,
+                jobs=jobs,
+                max_pixels=max_pixels,
+                passthrough=passthrough_mode,  # type: ignore[arg-type]
+                profile=profile_name,
+                checkpoint=checkpoint,
+                report=timings,
+                output_archive=output_archive,
+                dedup=dedup_mode,  # type: ignore[arg-type]
+            )
+            if timings is not None:
+                counts.update(
+                    scanned=timings.scanned,
+                    processed=len(written),
+                    skipped=max(timings.scanned - len(written), 0),
+                    bytes_read=sum(record.input_bytes for record in timings.records),
+                    bytes_written=sum(record.output_bytes for record in timings.records),
+                )
+    except ValueError as exc:
+        # An image too large for --max-pixels.
+        typer.echo(f"✗ {exc}", err=True)
+        raise typer.Exit(1)
+
+    if report is not None and timings is not None:
+        timings.write(report)
+        summary = timings.summary()
+        typer.echo(
+            tr(
+                "resize.report_summary",
+                images=summary["images"],
+                ips=f"{summary['images_per_second']:.1f}",
+                mbps=f"{summary['input_mb_per_second']:.1f}",
+                path=report,
+            )
+        )
+        for phase, stats in summary["phases"].items():
+            typer.echo(f"  {phase:<10} p50 {stats['p50'] * 1000:8.1f} ms   p95 {stats['p95'] * 1000:8.1f} ms")
+
+    if not written:
+        typer.echo(tr("resize.none"))
+        return
+
+    destination = output_archive.resolve() if output_archive is not None else written[0].parent
+    typer.echo(f"✓ {tr('resize.success', count=len(written), output=destination)}")
+
+
+@app.command("resize-bench", cls=LocalizedCommand, help=tr("resizebench.help"))
+def resize_bench(
+    input: Path = typer.Option(
+        ".",
+        "--input",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help=tr("resize.input"),
+    ),
+    sample: int = typer.Option(20, "--sample", min=1, help=tr("resizebench.sample")),
+    width: Optional[int] = typer.Option(1920, help=tr("resize.width")),
+    height: Optional[int] = typer.Option(None, help=tr("resize.height")),
+    max_width: Optional[int] = typer.Option(None, help=tr("resize.max_width")),
+    max_height: Optional[int] = typer.Option(None, help=tr("resize.max_height")),
+    quality: int = typer.Option(90, help=tr("resize.quality")),
+    output_format: Optional[str] = typer.Option(None, "--format", help=tr("resize.format")),
+    recursive: bool = typer.Option(False, "--recursive", is_flag=True, help=tr("resize.recursive")),
+    include_hidden: bool = typer.Option(False, "--include-hidden", is_flag=True, help=tr("resize.include_hidden")),
+    ignore: list[str] = typer.Option(
+        None,
+        "--ignore",
+        "-i",
+        help=tr("resize.ignore"),
+    ),
+) -> None:
+    from .core import benchmark_profiles
+
+    if quality < 1 or quality > 100:
+        raise typer.BadParameter(tr("resize.bad_quality"))
+
     source_dir = resolve_directory(input)
-    written = resize_images(
+    results = benchmark_profiles(
         source_dir,
-        output_dir=output,
+        sample=sample,
         width=width,
         height=height,
         max_width=max_width,
         max_height=max_height,
-        scale=scale,
-        keep_aspect=keep_aspect,
-        allow_upscale=allow_upscale,
         quality=quality,
         output_format=output_format,
-        suffix=suffix,
-        overwrite=overwrite,
         recursive=recursive,
         include_hidden=include_hidden,
         ignore_names=ignore or DEFAULT_IGNORE_NAMES,
     )
-
-    if not written:
-        typer.echo(tr("resize.none"))
+    if not results:
+        typer.echo(tr("resizebench.none"))
         return
 
-    typer.echo(f"✓ {tr('resize.success', count=len(written), output=written[0].parent)}")
+    typer.echo(f"{'profile':<10} {'format':<6} {'images':>6} {'encode ms/img':>14} {'KiB/img':>9}")
+    for row in results:
+        typer.echo(
+            f"{row.profile:<10} {row.format:<6} {row.images:>6} "
+            f"{row.encode_seconds * 1000 / row.images:>14.1f} {row.output_bytes / 1024 / row.images:>9.1f}"
+        )
 
 
-@app.command("build-exe", help=tr("buildexe.help"))
+@app.command("build-exe", cls=LocalizedCommand, help=tr("buildexe.help"))
 def build_exe(
     extra: list[str] = typer.Option(
         None,
@@ -489,7 +877,7 @@ def build_exe(
     raise typer.Exit(code)
 
 
-@app.command("s2tw", help=tr("s2tw.help"))
+@app.command("s2tw", cls=LocalizedCommand, help=tr("s2tw.help"))
 def s2tw(
     path: Path = typer.Option(
         ".",
@@ -512,6 +900,8 @@ def s2tw(
         is_flag=True,
         help=tr("s2tw.no_backup"),
     ),
+    backup_mode: str = typer.Option("copy", "--backup-mode", help=tr("s2tw.backup_mode")),
+    office: bool = typer.Option(False, "--office", is_flag=True, help=tr("s2tw.office")),
     convert_names: bool = typer.Option(
         True,
         "--convert-names/--no-convert-names",
@@ -529,16 +919,74 @@ def s2tw(
         is_flag=True,
         help=tr("s2tw.include_hidden"),
     ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help=tr("s2tw.jobs")),
+    engine: str = typer.Option("opencc", "--engine", help=tr("s2tw.engine")),
+    manifest: Path | None = typer.Option(
+        None,
+        "--manifest",
+        dir_okay=False,
+        help=tr("s2tw.manifest"),
+    ),
+    check: bool = typer.Option(False, "--check", is_flag=True, help=tr("s2tw.check")),
+    json_output: bool = typer.Option(False, "--json", is_flag=True, help=tr("s2tw.json")),
+    metrics_file: Optional[Path] = typer.Option(
+        None,
+        "--metrics-file",
+        file_okay=True,
+        dir_okay=False,
+        help=tr("option.metrics_file"),
+    ),
 ) -> None:
     """Convert Simplified Chinese to Traditional Chinese (Taiwan)."""
+    from .core import check_opencc_available, check_s2tw, convert_s2tw_recursive
+
     # Check if OpenCC is available
     if not check_opencc_available():
         typer.echo(tr("s2tw.no_opencc"))
         typer.echo("pip install opencc-python-reimplemented")
         raise typer.Exit(1)
     
+    engine_name = engine.lower()
+    if engine_name not in {"opencc", "compiled"}:
+        raise typer.BadParameter(tr("s2tw.invalid_engine"))
+    backup_mode_name = backup_mode.lower()
+    if backup_mode_name not in {"copy", "link", "reflink", "tar", "zip"}:
+        raise typer.BadParameter(tr("s2tw.invalid_backup_mode"))
+    if check and (office or manifest is not None or metrics_file is not None):
+        raise typer.BadParameter(tr("s2tw.check_conflict"))
+    if json_output and not check:
+        raise typer.BadParameter(tr("s2tw.json_needs_check"))
+    
     input_path = resolve_path(path)
     
+    if check:
+        with span("preview"):
+            hits = check_s2tw(
+                input_path,
+                extensions=None,
+                check_names=convert_names,
+                ignore_names=ignore or DEFAULT_IGNORE_NAMES,
+                include_hidden=include_hidden,
+                jobs=jobs,
+                engine=engine_name,
+            )
+        if json_output:
+            typer.echo(json.dumps(
+                [{**hit._asdict(), "path": str(hit.path)} for hit in hits],
+                ensure_ascii=False,
+                indent=2,
+            ))
+        else:
+            for hit in hits:
+                if hit.kind == "content":
+                    typer.echo(f"{hit.path}:{hit.line}:{hit.column}: {hit.original} -> {hit.converted}")
+                elif hit.kind == "name":
+                    typer.echo(f"{hit.path}: {hit.original} -> {hit.converted}")
+                else:
+                    typer.echo(f"{hit.path}: {tr('s2tw.check_error', error=hit.original)}", err=True)
+            typer.echo(tr("s2tw.check_summary", count=len(hits)) if hits else tr("s2tw.check_clean"))
+        raise typer.Exit(1 if hits else 0)
+    
     typer.echo(f"\n{tr('s2tw.scanning', path=input_path)}")
     typer.echo(f"{tr('s2tw.backup_info', enabled=not no_backup)}\n")
     
@@ -549,16 +997,30 @@ def s2tw(
     
     typer.echo(f"\n{tr('s2tw.converting')}...")
     
-    results, stats = convert_s2tw_recursive(
-        input_path,
-        extensions=None,  # 處理所有文字檔案
-        convert_content=True,
-        convert_names=convert_names,
-        create_backup_files=not no_backup,
-        backup_dir=backup_dir,
-        ignore_names=ignore or DEFAULT_IGNORE_NAMES,
-        include_hidden=include_hidden,
-    )
+    with _job_metrics(metrics_file, "s2tw") as counts:
+        results, stats = convert_s2tw_recursive(
+            input_path,
+            extensions=None,  # 處理所有文字檔案
+            convert_content=True,
+            convert_names=convert_names,
+            create_backup_files=not no_backup,
+            backup_dir=backup_dir,
+            ignore_names=ignore or DEFAULT_IGNORE_NAMES,
+            include_hidden=include_hidden,
+            jobs=jobs,
+            engine=engine_name,
+            manifest=manifest,
+            backup_mode=backup_mode_name,
+            office=office,
+        )
+        counts.update(
+            scanned=stats.files_scanned,
+            processed=max(stats.files_scanned - stats.files_unchanged - stats.errors, 0),
+            skipped=stats.files_unchanged,
+            errored=stats.errors,
+            bytes_read=stats.bytes_read,
+            bytes_written=stats.bytes_written,
+        )
     
     # Show results
     typer.echo(f"\n{tr('s2tw.stats_header')}")
@@ -573,8 +1035,49 @@ def s2tw(
     typer.echo(f"\n✓ {tr('s2tw.complete')}")
 
 
-_apply_locale_to_command(get_command(app))
+def _run_job(command: click.Command, argv: list[str]) -> int:
+    try:
+        command.main(args=argv, prog_name="hsu")
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        typer.echo(exc.code, err=True)
+        return 1
+    return 0
+
+
+@app.command("serve", cls=LocalizedCommand, help=tr("serve.help"))
+def serve(
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help=tr("serve.socket")),
+) -> None:
+    from typer.main import get_command
+
+    from .server import HAS_SERVER, default_socket_path, serve as run_server
+
+    if not HAS_SERVER:
+        typer.echo(tr("serve.unsupported"), err=True)
+        raise typer.Exit(1)
+    path = socket_path or default_socket_path()
+    command = get_command(app)
+    try:
+        run_server(
+            path,
+            lambda argv: _run_job(command, argv),
+            ready=lambda: typer.echo(tr("serve.listening", path=path)),
+        )
+    except FileExistsError:
+        typer.echo(tr("serve.in_use", path=path), err=True)
+        raise typer.Exit(1)
+    except PermissionError as exc:
+        typer.echo(tr("serve.unsafe_dir", path=exc.filename or path.parent), err=True)
+        raise typer.Exit(1)
+
 
 
 if __name__ == "__main__":
+    # The PyInstaller build starts here; frozen worker processes must stop
+    # in freeze_support instead of running the CLI again.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     app()
@@ -0,0 +1,241 @@
+"""Shell completion served from a precomputed table.
+
+A completion request (the ``_HSU_COMPLETE`` variable set by the scripts
+that ``hsu --install-completion`` installs) is answered by the entry point
+in ``launcher`` from ``completion_table``, without importing Typer, Click
+or any command.
+
+Values of options and arguments that take paths or free text get no
+candidates, so the shell falls back to its own file completion. After
+changing commands or options, regenerate the table with::
+
+    python -c "from hsutools.completion import write_table; write_table()"
+"""
+
+from __future__ import annotations
+
+import os
+import shlex
+import sys
+from pathlib import Path
+
+from .i18n import ENV_LANG, _normalize_lang
+
+TABLE_PATH = Path(__file__).with_name("completion_table.py")
+SHELLS = {"bash", "zsh", "fish", "powershell", "pwsh"}
+
+# (value, help)
+Completion = tuple[str, str | None]
+
+
+def _split(string: str) -> list[str]:
+    """``shlex.split`` that keeps a trailing unterminated token (as Click does)."""
+    lex = shlex.shlex(string, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    out = []
+    try:
+        for token in lex:
+            out.append(token)
+    except ValueError:
+        out.append(lex.token)
+    return out
+
+
+def _find(params: list[dict], name: str) -> dict | None:
+    for param in params:
+        if name in param["opts"] or name in param["secondary_opts"]:
+            return param
+    return None
+
+
+def _lang(args: list[str]) -> str:
+    value = None
+    for index, token in enumerate(args):
+        if token.startswith("--lang="):
+            value = token.split("=", 1)[1]
+        elif token in {"--lang", "-l"} and index + 1 < len(args):
+            value = args[index + 1]
+    return _normalize_lang(value or os.getenv(ENV_LANG))
+
+
+def complete(table: dict, args: list[str], incomplete: str) -> list[Completion]:
+    """
+    Completions for ``incomplete`` after the complete words ``args``.
+
+    Follows Click's rules: option names when the word starts with ``-``, the
+    option's choices after an option that takes a value, otherwise
+    subcommand names.
+    """
+    lang = _lang(args)
+    command = table
+    used: set[str] = set()
+    expects: dict | None = None  # option waiting for its value
+    literal = False  # after "--"
+    for token in args:
+        if expects is not None:
+            expects = None
+            continue
+        if token == "--":
+            literal = True
+            continue
+        if token.startswith("-") and not literal:
+            name = token.split("=", 1)[0]
+            param = _find(command["params"], name)
+            if param is not None:
+                used.add(param["name"])
+                if param["kind"] != "flag" and "=" not in token:
+                    expects = param
+            continue
+        if token in command.get("commands", {}):
+            command = command["commands"][token]
+            used = set()
+            literal = False
+
+    if incomplete == "=":
+        incomplete = ""
+    elif "=" in incomplete and incomplete.startswith("-"):
+        name, _, incomplete = incomplete.partition("=")
+        expects = _find(command["params"], name)
+
+    if incomplete.startswith("-"):
+        return [
+            (name, param["help"][lang])
+            for param in command["params"]
+            if not param["hidden"] and (param["multiple"] or param["name"] not in used)
+            for name in (*param["opts"], *param["secondary_opts"])
+            if name.startswith(incomplete)
+        ]
+    if expects is not None:
+        choices = expects["choices"] or []
+        if expects["case_sensitive"]:
+            return [(choice, None) for choice in choices if choice.startswith(incomplete)]
+        return [(choice, None) for choice in choices if choice.lower().startswith(incomplete.lower())]
+    return [
+        (name, sub["help"][lang])
+        for name, sub in command.get("commands", {}).items()
+        if not sub["hidden"] and name.startswith(incomplete)
+    ]
+
+
+def _zsh_escape(text: str) -> str:
+    return text.replace('"', '""').replace("'", "''").replace("$", "\\$").replace("`", "\\`")
+
+
+def respond(table: dict, shell: str, environ: dict[str, str]) -> tuple[str, int]:
+    """Output and exit status for a completion request, in Typer's formats."""
+    if shell == "bash":
+        words = _split(environ.get("COMP_WORDS", ""))
+        cword = int(environ.get("COMP_CWORD", "0"))
+        incomplete = words[cword] if cword < len(words) else ""
+        items = complete(table, words[1:cword], incomplete)
+        return "\n".join(value for value, _help in items), 0
+    line = environ.get("_TYPER_COMPLETE_ARGS", "")
+    words = _split(line)
+    if shell in ("powershell", "pwsh"):
+        incomplete = environ.get("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
+        items = complete(table, words[1:-1] if incomplete else words[1:], incomplete)
+        return "\n".join(f"{value}:::{help_text or ' '}" for value, help_text in items), 0
+    args = words[1:]
+    if args and not line.endswith(" "):
+        incomplete = args.pop()
+    else:
+        incomplete = ""
+    items = complete(table, args, incomplete)
+    if shell == "zsh":
+        if not items:
+            return "_files", 0
+        lines = "\n".join(
+            f'"{_zsh_escape(value)}":"{_zsh_escape(help_text)}"' if help_text else f'"{_zsh_escape(value)}"'
+            for value, help_text in items
+        )
+        return f"_arguments '*: :(({lines}))'", 0
+    action = environ.get("_TYPER_COMPLETE_FISH_ACTION", "")
+    if action == "is-args":
+        return "", 0 if items else 1
+    return "\n".join(
+        f"{value}\t{' '.join(help_text.split())}" if help_text else value for value, help_text in items
+    ), 0
+
+
+def _param_entry(param, lang_help: dict[str, str | None]) -> dict:
+    import click
+
+    if getattr(param, "is_flag", False) or getattr(param, "count", False):
+        kind = "flag"
+    elif isinstance(param.type, click.Choice):
+        kind = "choice"
+    else:
+        kind = "value"
+    return {
+        "name": param.name,
+        "opts": list(param.opts),
+        "secondary_opts": list(param.secondary_opts),
+        "kind": kind,
+        "choices": [str(choice) for choice in param.type.choices] if kind == "choice" else None,
+        "case_sensitive": param.type.case_sensitive if kind == "choice" else True,
+        "multiple": bool(getattr(param, "multiple", False)),
+        "hidden": bool(getattr(param, "hidden", False)),
+        "help": lang_help,
+    }
+
+
+def build_table() -> dict:
+    """Completion table of the registered commands, with help in every language."""
+    import click
+    from typer.main import get_command
+
+    from .cli import _localized_help, _set_help, app
+    from .i18n import SUPPORTED_LANGS
+
+    langs = sorted(SUPPORTED_LANGS)
+    trees = {}
+    for lang in langs:
+        trees[lang] = get_command(app)
+        _set_help(trees[lang], _localized_help(lang))
+
+    def entry(commands: dict[str, click.Command], short_help: dict[str, str | None]) -> dict:
+        first = commands[langs[0]]
+        contexts = {lang: click.Context(command) for lang, command in commands.items()}
+        params = {lang: command.get_params(contexts[lang]) for lang, command in commands.items()}
+        node = {
+            "help": short_help,
+            "hidden": bool(getattr(first, "hidden", False)),
+            "params": [
+                _param_entry(param, {lang: getattr(params[lang][index], "help", None) for lang in langs})
+                for index, param in enumerate(params[langs[0]])
+                if isinstance(param, click.Option)
+            ],
+        }
+        if isinstance(first, click.MultiCommand):
+            node["commands"] = {
+                name: entry(
+                    {lang: command.get_command(contexts[lang], name) for lang, command in commands.items()},
+                    {
+                        lang: command.get_command(contexts[lang], name).get_short_help_str()
+                        for lang, command in commands.items()
+                    },
+                )
+                for name in first.list_commands(contexts[langs[0]])
+            }
+        return node
+
+    return entry(trees, {lang: None for lang in langs})
+
+
+def write_table(path: Path = TABLE_PATH) -> Path:
+    """Regenerate the completion table module."""
+    import pprint
+
+    from .utils import atomic_destination
+
+    source = (
+        '"""Completion table for ``hsu``; generated by ``completion.write_table``, do not edit."""\n\n'
+        f"TABLE = {pprint.pformat(build_table(), width=100, sort_dicts=False)}\n"
+    )
+    with atomic_destination(path) as temp:
+        temp.write_text(source, encoding="utf-8")
+    return path
+
+
+__all__ = ["build_table", "complete", "respond", "write_table"]
@@ -0,0 +1,964 @@
+"""Completion table for ``hsu``; generated by ``completion.write_table``, do not edit."""
+
+TABLE = {'help': {'en': None, 'zh': None},
+ 'hidden': False,
+ 'params': [{'name': 'lang',
+             'opts': ['--lang', '-l'],
+             'secondary_opts': [],
+             'kind': 'value',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Interface language (en, zh). Env: HSU_LANG.',
+                      'zh': '介面語言（en, zh），可用環境變數 HSU_LANG。'}},
+            {'name': 'version',
+             'opts': ['--version'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Show version and exit.', 'zh': '顯示版本後離開。'}},
+            {'name': 'remote',
+             'opts': ['--remote'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Run the command on the `hsu serve` daemon (socket: HSU_SOCKET).',
+                      'zh': '在 `hsu serve` 常駐程序上執行指令（socket：HSU_SOCKET）。'}},
+            {'name': 'profile',
+             'opts': ['--profile'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Print the time spent in each phase (scan, plan, apply, ...) to stderr '
+                            'when the command ends.',
+                      'zh': '指令結束時將各階段（scan、plan、apply…）耗時輸出至 stderr。'}},
+            {'name': 'profile_dump',
+             'opts': ['--profile-dump'],
+             'secondary_opts': [],
+             'kind': 'value',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Also write a cProfile/pstats dump to this file (implies --profile).',
+                      'zh': '同時將 cProfile/pstats 資料寫入此檔案（隱含 --profile）。'}},
+            {'name': 'install_completion',
+             'opts': ['--install-completion'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Install completion for the current shell.',
+                      'zh': '為當前 shell 安裝自動補全。'}},
+            {'name': 'show_completion',
+             'opts': ['--show-completion'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Show completion for the current shell, to copy it or customize the '
+                            'installation.',
+                      'zh': '顯示當前 shell 的自動補全腳本，供複製或自訂安裝。'}},
+            {'name': 'help',
+             'opts': ['--help'],
+             'secondary_opts': [],
+             'kind': 'flag',
+             'choices': None,
+             'case_sensitive': True,
+             'multiple': False,
+             'hidden': False,
+             'help': {'en': 'Show this message and exit.', 'zh': 'Show this message and exit.'}}],
+ 'commands': {'build-exe': {'help': {'en': 'Build a single-file executable via...',
+                                     'zh': '使用 PyInstaller 建立單檔可執行檔（可選）。'},
+                            'hidden': False,
+                            'params': [{'name': 'extra',
+                                        'opts': ['--extra-arg'],
+                                        'secondary_opts': [],
+                                        'kind': 'value',
+                                        'choices': None,
+                                        'case_sensitive': True,
+                                        'multiple': True,
+                                        'hidden': False,
+                                        'help': {'en': 'Extra arguments forwarded to PyInstaller.',
+                                                 'zh': '轉交給 PyInstaller 的額外參數。'}},
+                                       {'name': 'help',
+                                        'opts': ['--help'],
+                                        'secondary_opts': [],
+                                        'kind': 'flag',
+                                        'choices': None,
+                                        'case_sensitive': True,
+                                        'multiple': False,
+                                        'hidden': False,
+                                        'help': {'en': 'Show this message and exit.',
+                                                 'zh': 'Show this message and exit.'}}]},
+              'cpath': {'help': {'en': 'Generate a markdown tree listing for the...',
+                                 'zh': '為指定目錄產生 Markdown 樹狀清單。'},
+                        'hidden': False,
+                        'params': [{'name': 'path',
+                                    'opts': ['--path'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Target directory.', 'zh': '目標目錄。'}},
+                                   {'name': 'output',
+                                    'opts': ['--output'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Output markdown file name.',
+                                             'zh': '輸出 Markdown 檔名。'}},
+                                   {'name': 'max_depth',
+                                    'opts': ['--max-depth'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Limit traversal depth (None for unlimited).',
+                                             'zh': '限制遞迴深度（空值為不限）。'}},
+                                   {'name': 'ignore',
+                                    'opts': ['--ignore', '-i'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': True,
+                                    'hidden': False,
+                                    'help': {'en': 'Names to ignore in the tree output.',
+                                             'zh': '樹狀輸出時要忽略的名稱。'}},
+                                   {'name': 'metrics_file',
+                                    'opts': ['--metrics-file'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Write node-exporter textfile metrics (items, '
+                                                   'bytes, phase times) of this run to this file.',
+                                             'zh': '將本次執行的 node-exporter textfile '
+                                                   '指標（項目數、位元組、各階段耗時）寫入此檔案。'}},
+                                   {'name': 'help',
+                                    'opts': ['--help'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Show this message and exit.',
+                                             'zh': 'Show this message and exit.'}}]},
+              'filem': {'help': {'en': 'Categorize files by date, prefix, or suffix.',
+                                 'zh': '依日期、前綴或副檔名分門別類。'},
+                        'hidden': False,
+                        'params': [{'name': 'path',
+                                    'opts': ['--path'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Directory to manage.', 'zh': '要整理的目錄。'}},
+                                   {'name': 'mode',
+                                    'opts': ['--mode', '-m'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Grouping strategy: date | prefix | suffix.',
+                                             'zh': '分組策略：date | prefix | suffix。'}},
+                                   {'name': 'prefix',
+                                    'opts': ['--prefix'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Prefix bucket name when mode=prefix.',
+                                             'zh': '當模式為 prefix 時使用的前綴群組名稱。'}},
+                                   {'name': 'ignore',
+                                    'opts': ['--ignore', '-i'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': True,
+                                    'hidden': False,
+                                    'help': {'en': 'Names to ignore.', 'zh': '要忽略的名稱。'}},
+                                   {'name': 'include_hidden',
+                                    'opts': ['--include-hidden'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Include hidden files.', 'zh': '包含隱藏檔。'}},
+                                   {'name': 'help',
+                                    'opts': ['--help'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Show this message and exit.',
+                                             'zh': 'Show this message and exit.'}}]},
+              'rename': {'help': {'en': 'Batch rename file or directory names by...',
+                                  'zh': '批次以文字取代方式重新命名檔案或資料夾。'},
+                         'hidden': False,
+                         'params': [{'name': 'path',
+                                     'opts': ['--path'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Directory to operate.', 'zh': '要操作的目錄。'}},
+                                    {'name': 'find_text',
+                                     'opts': ['--find'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Text to replace.', 'zh': '要尋找的文字。'}},
+                                    {'name': 'replace_text',
+                                     'opts': ['--replace'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Replacement text.', 'zh': '替換文字。'}},
+                                    {'name': 'include_dirs',
+                                     'opts': ['--include-dirs'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Allow renaming directories as well.',
+                                              'zh': '允許同時重新命名資料夾。'}},
+                                    {'name': 'ignore',
+                                     'opts': ['--ignore', '-i'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': True,
+                                     'hidden': False,
+                                     'help': {'en': 'Names to ignore.', 'zh': '要忽略的名稱。'}},
+                                    {'name': 'include_hidden',
+                                     'opts': ['--include-hidden'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Include hidden entries.', 'zh': '包含隱藏項目。'}},
+                                    {'name': 'help',
+                                     'opts': ['--help'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Show this message and exit.',
+                                              'zh': 'Show this message and exit.'}}]},
+              'resize': {'help': {'en': 'Resize images with flexible sizing rules.',
+                                  'zh': '以彈性規則調整圖片大小。'},
+                         'hidden': False,
+                         'params': [{'name': 'input',
+                                     'opts': ['--input'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Directory containing images to resize.',
+                                              'zh': '包含待調整圖片的目錄。'}},
+                                    {'name': 'output',
+                                     'opts': ['--output'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Directory to write resized images (defaults '
+                                                    'to INPUT/resized).',
+                                              'zh': '輸出目錄（預設為輸入目錄下的 resized）。'}},
+                                    {'name': 'width',
+                                     'opts': ['--width'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Target width. Combine with height for '
+                                                    'bounding box.',
+                                              'zh': '目標寬度，可與高度組合為邊界框。'}},
+                                    {'name': 'height',
+                                     'opts': ['--height'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Target height. Combine with width for '
+                                                    'bounding box.',
+                                              'zh': '目標高度，可與寬度組合為邊界框。'}},
+                                    {'name': 'max_width',
+                                     'opts': ['--max-width'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Maximum width cap after other calculations.',
+                                              'zh': '最終寬度上限。'}},
+                                    {'name': 'max_height',
+                                     'opts': ['--max-height'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Maximum height cap after other calculations.',
+                                              'zh': '最終高度上限。'}},
+                                    {'name': 'scale',
+                                     'opts': ['--scale'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Scale factor (e.g., 0.5 halves the size).',
+                                              'zh': '縮放倍數（如 0.5 代表縮小一半）。'}},
+                                    {'name': 'keep_aspect',
+                                     'opts': ['--keep-aspect'],
+                                     'secondary_opts': ['--no-keep-aspect'],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Preserve aspect ratio when resizing.',
+                                              'zh': '保持長寬比。'}},
+                                    {'name': 'allow_upscale',
+                                     'opts': ['--allow-upscale'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Permit enlarging images.', 'zh': '允許放大。'}},
+                                    {'name': 'quality',
+                                     'opts': ['--quality'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Quality (1-100) for JPEG/WEBP outputs.',
+                                              'zh': 'JPEG/WEBP 輸出品質（1-100）。'}},
+                                    {'name': 'output_format',
+                                     'opts': ['--format'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Force output format, e.g., jpeg/png/webp.',
+                                              'zh': '強制輸出格式（例如 jpeg/png/webp）。'}},
+                                    {'name': 'suffix',
+                                     'opts': ['--suffix'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Append suffix before the file extension.',
+                                              'zh': '在副檔名之前加上後綴。'}},
+                                    {'name': 'overwrite',
+                                     'opts': ['--overwrite'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Overwrite if destination exists.',
+                                              'zh': '若檔案已存在則覆寫。'}},
+                                    {'name': 'recursive',
+                                     'opts': ['--recursive'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Process subdirectories recursively.',
+                                              'zh': '遞迴處理子目錄。'}},
+                                    {'name': 'include_hidden',
+                                     'opts': ['--include-hidden'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Include hidden files.', 'zh': '包含隱藏檔。'}},
+                                    {'name': 'ignore',
+                                     'opts': ['--ignore', '-i'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': True,
+                                     'hidden': False,
+                                     'help': {'en': 'Names to ignore (applied to files and '
+                                                    'directories).',
+                                              'zh': '要忽略的名稱（檔案與資料夾）。'}},
+                                    {'name': 'jobs',
+                                     'opts': ['--jobs', '-j'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Number of images to resize in parallel.',
+                                              'zh': '同時處理的圖片數量。'}},
+                                    {'name': 'max_pixels',
+                                     'opts': ['--max-pixels'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Limit on decoded source pixels held by all '
+                                                    'workers at once. JPEGs are decoded at reduced '
+                                                    'scale to fit; other images over the limit '
+                                                    'fail.',
+                                              'zh': '所有工作同時持有的已解碼來源像素總量上限。JPEG '
+                                                    '會以縮小比例解碼以符合上限；超過上限的其他圖片會失敗。'}},
+                                    {'name': 'passthrough',
+                                     'opts': ['--passthrough'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'How to output images already within bounds: '
+                                                    'copy | link | none (re-encode).',
+                                              'zh': '已符合尺寸的圖片如何輸出：copy | link | none（重新編碼）。'}},
+                                    {'name': 'dry_run',
+                                     'opts': ['--dry-run'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Only read image headers and report what would '
+                                                    'be done.',
+                                              'zh': '只讀取圖片標頭並列出將執行的動作。'}},
+                                    {'name': 'encoder_profile',
+                                     'opts': ['--encoder-profile'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Encoder speed/size profile: fast | balanced | '
+                                                    'smallest.',
+                                              'zh': '編碼速度／大小設定檔：fast | balanced | smallest。'}},
+                                    {'name': 'checkpoint',
+                                     'opts': ['--checkpoint'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'File recording finished sources; rerunning '
+                                                    'with it resumes an interrupted job.',
+                                              'zh': '記錄已完成來源的檔案；再次執行時可從中斷處繼續。'}},
+                                    {'name': 'watch',
+                                     'opts': ['--watch'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Keep running and resize images as they arrive '
+                                                    'in --input (Ctrl+C to stop).',
+                                              'zh': '持續執行，於 --input 出現新圖片時自動調整（Ctrl+C 停止）。'}},
+                                    {'name': 'settle',
+                                     'opts': ['--settle'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': "Seconds a file's size must stay unchanged "
+                                                    'before it is processed in --watch mode.',
+                                              'zh': '--watch 模式下，檔案大小需維持不變多少秒才處理。'}},
+                                    {'name': 'report',
+                                     'opts': ['--report'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Record per-image phase timings to this file '
+                                                    '(.json or .csv).',
+                                              'zh': '將每張圖片各階段耗時寫入此檔（.json 或 .csv）。'}},
+                                    {'name': 'output_archive',
+                                     'opts': ['--output-archive'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Stream resized images into one archive (.zip, '
+                                                    '.tar, .tar.gz) instead of --output.',
+                                              'zh': '將調整後的圖片直接串流寫入單一封存檔（.zip、.tar、.tar.gz），取代 '
+                                                    '--output。'}},
+                                    {'name': 'dedup',
+                                     'opts': ['--dedup'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Resize byte-identical sources once and fill '
+                                                    'the other outputs by link | reflink.',
+                                              'zh': '內容完全相同的來源只處理一次，其餘輸出以 link | reflink 產生。'}},
+                                    {'name': 'metrics_file',
+                                     'opts': ['--metrics-file'],
+                                     'secondary_opts': [],
+                                     'kind': 'value',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Write node-exporter textfile metrics (items, '
+                                                    'bytes, phase times) of this run to this file.',
+                                              'zh': '將本次執行的 node-exporter textfile '
+                                                    '指標（項目數、位元組、各階段耗時）寫入此檔案。'}},
+                                    {'name': 'help',
+                                     'opts': ['--help'],
+                                     'secondary_opts': [],
+                                     'kind': 'flag',
+                                     'choices': None,
+                                     'case_sensitive': True,
+                                     'multiple': False,
+                                     'hidden': False,
+                                     'help': {'en': 'Show this message and exit.',
+                                              'zh': 'Show this message and exit.'}}]},
+              'resize-bench': {'help': {'en': 'Compare encoder profiles on a sample of...',
+                                        'zh': '以你的圖片樣本比較各編碼設定檔（編碼時間與輸出大小）。'},
+                               'hidden': False,
+                               'params': [{'name': 'input',
+                                           'opts': ['--input'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Directory containing images to resize.',
+                                                    'zh': '包含待調整圖片的目錄。'}},
+                                          {'name': 'sample',
+                                           'opts': ['--sample'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Number of images to sample.',
+                                                    'zh': '取樣圖片數量。'}},
+                                          {'name': 'width',
+                                           'opts': ['--width'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Target width. Combine with height for '
+                                                          'bounding box.',
+                                                    'zh': '目標寬度，可與高度組合為邊界框。'}},
+                                          {'name': 'height',
+                                           'opts': ['--height'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Target height. Combine with width for '
+                                                          'bounding box.',
+                                                    'zh': '目標高度，可與寬度組合為邊界框。'}},
+                                          {'name': 'max_width',
+                                           'opts': ['--max-width'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Maximum width cap after other '
+                                                          'calculations.',
+                                                    'zh': '最終寬度上限。'}},
+                                          {'name': 'max_height',
+                                           'opts': ['--max-height'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Maximum height cap after other '
+                                                          'calculations.',
+                                                    'zh': '最終高度上限。'}},
+                                          {'name': 'quality',
+                                           'opts': ['--quality'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Quality (1-100) for JPEG/WEBP outputs.',
+                                                    'zh': 'JPEG/WEBP 輸出品質（1-100）。'}},
+                                          {'name': 'output_format',
+                                           'opts': ['--format'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Force output format, e.g., '
+                                                          'jpeg/png/webp.',
+                                                    'zh': '強制輸出格式（例如 jpeg/png/webp）。'}},
+                                          {'name': 'recursive',
+                                           'opts': ['--recursive'],
+                                           'secondary_opts': [],
+                                           'kind': 'flag',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Process subdirectories recursively.',
+                                                    'zh': '遞迴處理子目錄。'}},
+                                          {'name': 'include_hidden',
+                                           'opts': ['--include-hidden'],
+                                           'secondary_opts': [],
+                                           'kind': 'flag',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Include hidden files.', 'zh': '包含隱藏檔。'}},
+                                          {'name': 'ignore',
+                                           'opts': ['--ignore', '-i'],
+                                           'secondary_opts': [],
+                                           'kind': 'value',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': True,
+                                           'hidden': False,
+                                           'help': {'en': 'Names to ignore (applied to files and '
+                                                          'directories).',
+                                                    'zh': '要忽略的名稱（檔案與資料夾）。'}},
+                                          {'name': 'help',
+                                           'opts': ['--help'],
+                                           'secondary_opts': [],
+                                           'kind': 'flag',
+                                           'choices': None,
+                                           'case_sensitive': True,
+                                           'multiple': False,
+                                           'hidden': False,
+                                           'help': {'en': 'Show this message and exit.',
+                                                    'zh': 'Show this message and exit.'}}]},
+              's2tw': {'help': {'en': 'Convert Simplified Chinese to Traditional...',
+                                'zh': '將檔案中的簡體中文轉換為繁體中文（台灣）。'},
+                       'hidden': False,
+                       'params': [{'name': 'path',
+                                   'opts': ['--path', '-p'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Path to file or directory.', 'zh': '檔案或目錄路徑。'}},
+                                  {'name': 'backup_dir',
+                                   'opts': ['--backup-dir', '-b'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Directory for backup files.', 'zh': '備份檔案目錄。'}},
+                                  {'name': 'no_backup',
+                                   'opts': ['--no-backup'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Skip creating backup files.',
+                                            'zh': '跳過建立備份檔案。'}},
+                                  {'name': 'backup_mode',
+                                   'opts': ['--backup-mode'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Backup strategy: copy (one file per original), '
+                                                  'link (hard-link snapshot), reflink (CoW '
+                                                  'clones), tar or zip (one compressed archive); '
+                                                  'the last four keep relative paths.',
+                                            'zh': '備份方式：copy（每個檔案各複製一份）、link（硬連結快照）、reflink（寫入時複製）、tar '
+                                                  '或 zip（單一壓縮檔）；後四者保留相對路徑。'}},
+                                  {'name': 'office',
+                                   'opts': ['--office'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Also convert the text inside .docx, .xlsx and '
+                                                  '.pptx files.',
+                                            'zh': '一併轉換 .docx、.xlsx 與 .pptx 檔案中的文字。'}},
+                                  {'name': 'convert_names',
+                                   'opts': ['--convert-names'],
+                                   'secondary_opts': ['--no-convert-names'],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Also convert file/directory names.',
+                                            'zh': '同時轉換檔案/目錄名稱。'}},
+                                  {'name': 'ignore',
+                                   'opts': ['--ignore', '-i'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': True,
+                                   'hidden': False,
+                                   'help': {'en': 'Names to ignore.', 'zh': '要忽略的名稱。'}},
+                                  {'name': 'include_hidden',
+                                   'opts': ['--include-hidden'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Include hidden files.', 'zh': '包含隱藏檔。'}},
+                                  {'name': 'jobs',
+                                   'opts': ['--jobs', '-j'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Number of worker processes for content '
+                                                  'conversion.',
+                                            'zh': '轉換內容時使用的工作行程數。'}},
+                                  {'name': 'engine',
+                                   'opts': ['--engine'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Conversion engine: opencc, or compiled (same '
+                                                  'output from a memory-mapped dictionary, '
+                                                  'faster).',
+                                            'zh': '轉換引擎：opencc，或 compiled（輸出相同，使用記憶體映射字典，速度較快）。'}},
+                                  {'name': 'manifest',
+                                   'opts': ['--manifest'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'SQLite manifest of converted files; reruns skip '
+                                                  'files unchanged since.',
+                                            'zh': '記錄已轉換檔案的 SQLite 清單；再次執行時略過未變更的檔案。'}},
+                                  {'name': 'check',
+                                   'opts': ['--check'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Only report files and names that would change; '
+                                                  'write nothing and exit 1 if any would.',
+                                            'zh': '只回報會變更的檔案與名稱，不寫入任何內容；若有變更則以代碼 1 結束。'}},
+                                  {'name': 'json_output',
+                                   'opts': ['--json'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'With --check, print the findings as JSON.',
+                                            'zh': '搭配 --check 時以 JSON 輸出結果。'}},
+                                  {'name': 'metrics_file',
+                                   'opts': ['--metrics-file'],
+                                   'secondary_opts': [],
+                                   'kind': 'value',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Write node-exporter textfile metrics (items, '
+                                                  'bytes, phase times) of this run to this file.',
+                                            'zh': '將本次執行的 node-exporter textfile '
+                                                  '指標（項目數、位元組、各階段耗時）寫入此檔案。'}},
+                                  {'name': 'help',
+                                   'opts': ['--help'],
+                                   'secondary_opts': [],
+                                   'kind': 'flag',
+                                   'choices': None,
+                                   'case_sensitive': True,
+                                   'multiple': False,
+                                   'hidden': False,
+                                   'help': {'en': 'Show this message and exit.',
+                                            'zh': 'Show this message and exit.'}}]},
+              'serve': {'help': {'en': 'Keep a warm process serving `hsu --remote`...',
+                                 'zh': '常駐一個已預熱的程序，透過 Unix socket 處理 `hsu...'},
+                        'hidden': False,
+                        'params': [{'name': 'socket_path',
+                                    'opts': ['--socket'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Socket path (default: HSU_SOCKET, else the '
+                                                   'runtime directory).',
+                                             'zh': 'Socket 路徑（預設：HSU_SOCKET，否則為執行期目錄）。'}},
+                                   {'name': 'help',
+                                    'opts': ['--help'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Show this message and exit.',
+                                             'zh': 'Show this message and exit.'}}]},
+              'topdf': {'help': {'en': 'Convert .docx files in the directory to...',
+                                 'zh': '將目錄中的 .docx 轉換為 .pdf（使用 docx2pdf）。'},
+                        'hidden': False,
+                        'params': [{'name': 'path',
+                                    'opts': ['--path'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Directory containing .docx files.',
+                                             'zh': '包含 .docx 的目錄。'}},
+                                   {'name': 'ignore',
+                                    'opts': ['--ignore', '-i'],
+                                    'secondary_opts': [],
+                                    'kind': 'value',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': True,
+                                    'hidden': False,
+                                    'help': {'en': 'Names to ignore.', 'zh': '要忽略的名稱。'}},
+                                   {'name': 'include_hidden',
+                                    'opts': ['--include-hidden'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Include hidden files.', 'zh': '包含隱藏檔。'}},
+                                   {'name': 'help',
+                                    'opts': ['--help'],
+                                    'secondary_opts': [],
+                                    'kind': 'flag',
+                                    'choices': None,
+                                    'case_sensitive': True,
+                                    'multiple': False,
+                                    'hidden': False,
+                                    'help': {'en': 'Show this message and exit.',
+                                             'zh': 'Show this message and exit.'}}]}}}
@@ -4,6 +4,8 @@ APP_NAME = "hsu"
 DEFAULT_OUTPUT_FILE = "path.md"
 DEFAULT_IGNORE_NAMES = {".git", "README.md", "path.md", "__pycache__"}
 DOCX_EXTENSION = ".docx"
+# Office Open XML documents whose text s2tw can convert in place.
+OFFICE_EXTENSIONS = {".docx", ".xlsx", ".pptx"}
 DEFAULT_S2TW_EXTENSIONS = {".md"}
 IMAGE_EXTENSIONS = {
     ".png",
@@ -19,6 +21,26 @@ IMAGE_EXTENSIONS = {
     ".heic",
     ".raw",
 }
+# Encoder settings per output format for each resize profile. "balanced"
+# matches the historical output (quality + optimize for JPEG).
+RESIZE_PROFILES = {
+    "fast": {
+        "JPEG": {"optimize": False, "progressive": False, "subsampling": "4:2:0"},
+        "WEBP": {"method": 0},
+        "PNG": {"compress_level": 1},
+    },
+    "balanced": {
+        "JPEG": {"optimize": True},
+        "WEBP": {"method": 4},
+        "PNG": {"compress_level": 6},
+    },
+    "smallest": {
+        "JPEG": {"optimize": True, "progressive": True, "subsampling": "4:2:0"},
+        "WEBP": {"method": 6},
+        "PNG": {"optimize": True, "compress_level": 9},
+    },
+}
+DEFAULT_RESIZE_PROFILE = "balanced"
 PACKAGE_ROOT = Path(__file__).resolve().parent
 PYINSTALLER_DEFAULT_OPTS = ["-F", "-n", APP_NAME]
 
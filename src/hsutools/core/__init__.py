@@ -1,19 +1,112 @@
-"""Core features for hsutools."""
+"""Core features for hsutools.
+
+Submodules are imported on first use of one of their names, so that
+importing this package does not load Pillow, OpenCC or docx2pdf.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .create_path import generate_path_md
+    from .docx_to_pdf import convert_docx_directory
+    from .file_manage import categorize_files, iter_categorize_files
+    from .file_renamer import iter_replace_names, replace_names
+    from .image_resize import (
+        ImageTiming,
+        ProfileBenchmark,
+        ResizePlanEntry,
+        ResizeReport,
+        aresize_image_bytes,
+        benchmark_profiles,
+        iter_resize_bytes,
+        iter_resize_images,
+        plan_resize,
+        resize_image_bytes,
+        resize_images,
+    )
+    from .resize_watch import watch_resize
+    from .s2tw_check import check_s2tw, S2twHit
+    from .s2tw import (
+        ConversionRun,
+        ConversionStats,
+        check_opencc_available,
+        convert_s2tw_recursive,
+        get_converter,
+        iter_convert_s2tw_recursive,
+    )
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "generate_path_md": "create_path",
+    "convert_docx_directory": "docx_to_pdf",
+    "categorize_files": "file_manage",
+    "iter_categorize_files": "file_manage",
+    "iter_replace_names": "file_renamer",
+    "replace_names": "file_renamer",
+    "ImageTiming": "image_resize",
+    "ProfileBenchmark": "image_resize",
+    "ResizePlanEntry": "image_resize",
+    "ResizeReport": "image_resize",
+    "aresize_image_bytes": "image_resize",
+    "benchmark_profiles": "image_resize",
+    "iter_resize_bytes": "image_resize",
+    "iter_resize_images": "image_resize",
+    "plan_resize": "image_resize",
+    "resize_image_bytes": "image_resize",
+    "resize_images": "image_resize",
+    "watch_resize": "resize_watch",
+    "check_s2tw": "s2tw_check",
+    "S2twHit": "s2tw_check",
+    "ConversionRun": "s2tw",
+    "ConversionStats": "s2tw",
+    "check_opencc_available": "s2tw",
+    "convert_s2tw_recursive": "s2tw",
+    "get_converter": "s2tw",
+    "iter_convert_s2tw_recursive": "s2tw",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .create_path import generate_path_md
-from .docx_to_pdf import convert_docx_directory
-from .file_manage import categorize_files
-from .file_renamer import replace_names
-from .image_resize import resize_images
-from .s2tw import convert_s2tw_recursive, check_opencc_available, ConversionStats
 
 __all__ = [
+    "aresize_image_bytes",
+    "benchmark_profiles",
     "categorize_files",
     "check_opencc_available",
+    "check_s2tw",
     "convert_docx_directory",
     "convert_s2tw_recursive",
+    "ConversionRun",
     "ConversionStats",
     "generate_path_md",
+    "get_converter",
+    "ImageTiming",
+    "iter_categorize_files",
+    "iter_convert_s2tw_recursive",
+    "iter_replace_names",
+    "iter_resize_bytes",
+    "iter_resize_images",
+    "plan_resize",
+    "ProfileBenchmark",
+    "resize_image_bytes",
     "resize_images",
+    "ResizePlanEntry",
+    "ResizeReport",
     "replace_names",
+    "S2twHit",
+    "watch_resize",
 ]
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Iterable, List
 
 from ..config import DEFAULT_IGNORE_NAMES, DEFAULT_OUTPUT_FILE
+from ..profiling import span
 
 
 def _link_for(path: Path, root: Path) -> str:
@@ -58,10 +59,12 @@ def generate_path_md(
 ) -> Path:
     """Generate a markdown listing of the directory tree."""
     ignore = set(ignore_names or DEFAULT_IGNORE_NAMES)
-    lines = _render_tree(root, ignore_names=ignore, max_depth=max_depth)
+    with span("scan"):
+        lines = _render_tree(root, ignore_names=ignore, max_depth=max_depth)
 
     output_path = root / output_file
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    with span("write"):
+        output_path.write_text("\n".join(lines), encoding="utf-8")
     return output_path
 
 
@@ -6,6 +6,7 @@ from typing import Iterable, List
 from docx2pdf import convert
 
 from ..config import DOCX_EXTENSION
+from ..profiling import span
 from ..utils import iter_files
 
 
@@ -15,19 +16,21 @@ def convert_docx_directory(
     ignore_names: Iterable[str] | None = None,
     include_hidden: bool = False,
 ) -> List[Path]:
-    docx_files = list(
-        iter_files(
-            directory,
-            ignore_names=ignore_names,
-            include_hidden=include_hidden,
-            extensions={DOCX_EXTENSION},
+    with span("scan"):
+        docx_files = list(
+            iter_files(
+                directory,
+                ignore_names=ignore_names,
+                include_hidden=include_hidden,
+                extensions={DOCX_EXTENSION},
+            )
         )
-    )
 
     converted: List[Path] = []
     for docx_file in docx_files:
         pdf_path = docx_file.with_suffix(".pdf")
-        convert(str(docx_file), str(pdf_path))
+        with span("convert"):
+            convert(str(docx_file), str(pdf_path))
         converted.append(pdf_path)
     return converted
 
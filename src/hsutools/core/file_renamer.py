@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
+from ..profiling import span
 
-def replace_names(
+
+def iter_replace_names(
     directory: Path,
     *,
     find_text: str,
@@ -12,11 +14,14 @@ def replace_names(
     include_dirs: bool = False,
     ignore_names: Iterable[str] | None = None,
     include_hidden: bool = False,
-) -> List[Path]:
+) -> Iterator[Path]:
+    """Rename entries of ``directory``, yielding each new path as it is renamed."""
     ignore = set(ignore_names or [])
-    updated: List[Path] = []
 
-    for entry in directory.iterdir():
+    # Listed up front: renaming while ``iterdir`` runs could revisit entries.
+    with span("scan"):
+        entries = list(directory.iterdir())
+    for entry in entries:
         if not include_hidden and entry.name.startswith("."):
             continue
         if entry.name in ignore:
@@ -29,9 +34,30 @@ def replace_names(
             else:
                 new_name = entry.name.replace(find_text, replace_text)
             target = entry.with_name(new_name)
-            entry.rename(target)
-            updated.append(target)
-    return updated
+            with span("apply"):
+                entry.rename(target)
+            yield target
+
+
+def replace_names(
+    directory: Path,
+    *,
+    find_text: str,
+    replace_text: str,
+    include_dirs: bool = False,
+    ignore_names: Iterable[str] | None = None,
+    include_hidden: bool = False,
+) -> List[Path]:
+    return list(
+        iter_replace_names(
+            directory,
+            find_text=find_text,
+            replace_text=replace_text,
+            include_dirs=include_dirs,
+            ignore_names=ignore_names,
+            include_hidden=include_hidden,
+        )
+    )
 
 
-__all__ = ["replace_names"]
+__all__ = ["iter_replace_names", "replace_names"]
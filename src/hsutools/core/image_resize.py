@@ -1,14 +1,142 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import os
+import random
+import tarfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple, Union
 
 from PIL import Image, ImageOps
 
-from ..config import IMAGE_EXTENSIONS
-from ..utils import ensure_directory
+from .. import profiling
+from ..config import DEFAULT_RESIZE_PROFILE, IMAGE_EXTENSIONS, RESIZE_PROFILES
+from ..profiling import span
+from ..utils import atomic_destination, copy_file_fast, ensure_directory, link_or_copy, reflink_or_copy
 
 Resample = getattr(Image, "Resampling", Image)
+Transpose = getattr(Image, "Transpose", Image)
+
+# EXIF orientation -> transpose that brings the stored pixels upright.
+_ORIENTATION_TRANSPOSE = {
+    2: Transpose.FLIP_LEFT_RIGHT,
+    3: Transpose.ROTATE_180,
+    4: Transpose.FLIP_TOP_BOTTOM,
+    5: Transpose.TRANSPOSE,
+    6: Transpose.ROTATE_270,
+    7: Transpose.TRANSVERSE,
+    8: Transpose.ROTATE_90,
+}
+_EXIF_ORIENTATION = 0x0112
+# Keep at least this much headroom over the target size when shrinking at
+# decode time or with reduce(), so the final LANCZOS pass still has detail.
+_REDUCING_GAP = 2
+# reduce() averages pixel values: meaningless for palette indices and
+# bilevel images, unsupported for 16-bit ones. These go straight to resize().
+_NO_REDUCE_MODES = {"1", "P", "PA", "I;16", "I;16L", "I;16B", "I;16N"}
+# Header probing is I/O bound, so it fans out wider than the resize workers.
+_PROBE_WORKERS = 8
+# Finished sources are appended to the checkpoint file in batches this big.
+_CHECKPOINT_BATCH = 256
+_HASH_CHUNK = 1 << 20
+
+ResizeAction = Literal["resize", "copy", "skip"]
+PassthroughMode = Literal["copy", "link", "none"]
+DedupMode = Literal["link", "reflink"]
+ImageSource = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
+class _ResizeSpec(NamedTuple):
+    """Sizing and encoding options shared by every image in a run."""
+    width: Optional[int]
+    height: Optional[int]
+    max_width: Optional[int]
+    max_height: Optional[int]
+    scale: Optional[float]
+    keep_aspect: bool
+    allow_upscale: bool
+    quality: int
+    output_format: Optional[str]
+    profile: str = DEFAULT_RESIZE_PROFILE
+
+
+class ResizePlanEntry(NamedTuple):
+    """Planned action for one source image, computed from its header only."""
+    source: Path
+    destination: Path
+    original_size: Optional[Tuple[int, int]]
+    target_size: Optional[Tuple[int, int]]
+    action: ResizeAction
+
+
+class _PixelBudget:
+    """Counting semaphore over decoded pixels shared by all resize workers.
+
+    ``_load_bounded`` rejects images larger than the whole budget, so the
+    pixels granted at once never exceed ``capacity``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, pixels: int) -> None:
+        with self._cond:
+            while self._in_flight and self._in_flight + pixels > self.capacity:
+                self._cond.wait()
+            self._in_flight += pixels
+
+    def release(self, pixels: int) -> None:
+        with self._cond:
+            self._in_flight -= pixels
+            self._cond.notify_all()
+
+
+class _Laps:
+    """Accumulates wall time per phase between successive ``lap`` calls."""
+
+    __slots__ = ("phases", "_last")
+
+    def __init__(self) -> None:
+        self.phases: dict = {}
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+
+class _NoLaps:
+    """Stand-in used when instrumentation is off; ``lap`` does nothing."""
+
+    __slots__ = ()
+
+    def lap(self, phase: str) -> None:
+        pass
+
+
+_NO_LAPS = _NoLaps()
+
+
+def _laps_for(report: "ResizeReport | None") -> _Laps | _NoLaps:
+    return _Laps() if report is not None or profiling.enabled() else _NO_LAPS
+
+
+def _record_laps(laps: _Laps | _NoLaps) -> None:
+    """Add one image's phase laps to the ``--profile`` totals."""
+    for phase, seconds in getattr(laps, "phases", {}).items():
+        profiling.record(phase, seconds)
 
 
 def _is_hidden(path: Path, root: Path) -> bool:
@@ -90,6 +218,784 @@ def _compute_target_size(
     return max(1, target_w), max(1, target_h)
 
 
+def _save_kwargs(fmt: str, quality: int, profile: str = DEFAULT_RESIZE_PROFILE) -> dict:
+    save_kwargs: dict = {"format": fmt}
+    if fmt in {"JPEG", "JPG", "WEBP"}:
+        save_kwargs["quality"] = max(1, min(quality, 100))
+    save_kwargs.update(RESIZE_PROFILES[profile].get(fmt, {}))
+    return save_kwargs
+
+
+def _output_format(spec: _ResizeSpec, ext: str, source_format: str | None = None) -> str:
+    if spec.output_format:
+        return _normalize_format(spec.output_format)
+    return source_format or _normalize_format(ext or "png")
+
+
+def _target_for(spec: _ResizeSpec, size: Tuple[int, int]) -> Tuple[int, int]:
+    return _compute_target_size(
+        size,
+        width=spec.width,
+        height=spec.height,
+        max_width=spec.max_width,
+        max_height=spec.max_height,
+        scale=spec.scale,
+        keep_aspect=spec.keep_aspect,
+        allow_upscale=spec.allow_upscale,
+    )
+
+
+def _header_geometry(img: Image.Image) -> Tuple[int, Tuple[int, int]]:
+    """Return the EXIF orientation and upright size without decoding pixels."""
+    # The base implementation only reads metadata already parsed from the
+    # header; PNG's override would load() the whole image to look for a
+    # trailing eXIf chunk.
+    orientation = Image.Image.getexif(img).get(_EXIF_ORIENTATION, 1)
+    width, height = img.size
+    if orientation in {5, 6, 7, 8}:
+        return orientation, (height, width)
+    return orientation, (width, height)
+
+
+def _load_bounded(
+    img: Image.Image,
+    spec: _ResizeSpec,
+    budget: _PixelBudget,
+    laps: _Laps | _NoLaps = _NO_LAPS,
+) -> Tuple[Image.Image, Tuple[int, int], int]:
+    """Decode ``img`` as small as the target allows, under ``budget``.
+
+    Works from the header only until the budget is granted: JPEGs are asked
+    to decode at 1/2, 1/4 or 1/8 scale via ``draft``, and anything still far
+    above the target is shrunk with integer ``reduce`` steps before the
+    EXIF transpose, so the full-size bitmap is dropped as early as possible.
+    Palette, bilevel and 16-bit images are left to ``resize``.
+
+    Only JPEG can be decoded at reduced scale; any image that would still
+    need more pixels than the whole budget raises ``ValueError`` before it
+    is decoded.
+
+    Returns the upright image, its target size and the pixels charged to
+    the budget (the caller releases them).
+    """
+    orientation, upright = _header_geometry(img)
+    target_size = _target_for(spec, upright)
+
+    swapped = orientation in {5, 6, 7, 8}
+    target_w, target_h = (target_size[1], target_size[0]) if swapped else target_size
+    img.draft(None, (target_w * _REDUCING_GAP, target_h * _REDUCING_GAP))
+    cost = img.size[0] * img.size[1]
+    if cost > budget.capacity:
+        raise ValueError(
+            f"{getattr(img, 'filename', '') or 'image'}: decoding needs {img.size[0]}x{img.size[1]} pixels,"
+            f" more than max_pixels ({budget.capacity})"
+        )
+    laps.lap("decode")
+    budget.acquire(cost)
+    laps.lap("wait")
+    try:
+        img.load()
+        factor = min(img.size[0] // (target_w * _REDUCING_GAP), img.size[1] // (target_h * _REDUCING_GAP))
+        if factor >= 2 and img.mode not in _NO_REDUCE_MODES:
+            img = img.reduce(factor)
+        laps.lap("decode")
+        method = _ORIENTATION_TRANSPOSE.get(orientation)
+        if method is not None:
+            img = img.transpose(method)
+        laps.lap("transpose")
+    except BaseException:
+        budget.release(cost)
+        raise
+    return img, target_size, cost
+
+
+def _resize_stream(
+    source: Union[Path, BinaryIO],
+    destination: Union[Path, BinaryIO],
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    *,
+    ext: str | None = None,
+    laps: _Laps | _NoLaps = _NO_LAPS,
+) -> str:
+    """Decode ``source``, resize it and encode into ``destination``.
+
+    Both ends may be paths or binary file objects. The output format comes
+    from ``spec.output_format``, then the source's own format, then ``ext``.
+    Returns the format that was written.
+    """
+    with Image.open(source) as img:
+        cost = 0
+        if budget is not None:
+            upright, target_size, cost = _load_bounded(img, spec, budget, laps)
+        else:
+            img.load()
+            laps.lap("decode")
+            upright = ImageOps.exif_transpose(img)
+            laps.lap("transpose")
+            target_size = _target_for(spec, upright.size)
+        try:
+            resized = upright.resize(target_size, resample=Resample.LANCZOS)
+            fmt = _output_format(spec, ext or "", img.format)
+            if fmt in {"JPEG", "JPG"} and resized.mode in {"RGBA", "P"}:
+                resized = resized.convert("RGB")
+            laps.lap("resample")
+            resized.save(destination, **_save_kwargs(fmt, spec.quality, spec.profile))
+            laps.lap("encode")
+        finally:
+            if budget is not None:
+                budget.release(cost)
+    return fmt
+
+
+def _resize_one(
+    image_path: Path,
+    destination_path: Path,
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    laps: _Laps | _NoLaps = _NO_LAPS,
+) -> Path:
+    with atomic_destination(destination_path) as temp:
+        _resize_stream(image_path, temp, spec, budget, ext=destination_path.suffix, laps=laps)
+    return destination_path
+
+
+class ImageTiming(NamedTuple):
+    """Instrumentation record for one image written by ``resize_images``."""
+    source: Path
+    destination: Path
+    action: ResizeAction
+    phases: dict
+    input_pixels: int
+    output_pixels: int
+    input_bytes: int
+    output_bytes: int
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (which must be non-empty)."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+class ResizeReport:
+    """Per-image phase timings, pixel counts and byte counts for a resize run.
+
+    Pass an instance as ``resize_images(report=...)``. Phases are ``decode``,
+    ``wait`` (for the pixel budget), ``transpose``, ``resample``, ``encode``
+    (including ``optimize``) and ``copy`` for passed-through images.
+    ``scanned`` counts the images found, including those skipped.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[ImageTiming] = []
+        self.scanned = 0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self._lock = threading.Lock()
+
+    def add(self, entry: ResizePlanEntry, phases: dict, output_bytes: int | None = None) -> None:
+        original = entry.original_size or (0, 0)
+        target = entry.target_size or (0, 0)
+        record = ImageTiming(
+            source=entry.source,
+            destination=entry.destination,
+            action=entry.action,
+            phases=dict(phases),
+            input_pixels=original[0] * original[1],
+            output_pixels=target[0] * target[1],
+            input_bytes=entry.source.stat().st_size,
+            output_bytes=entry.destination.stat().st_size if output_bytes is None else output_bytes,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self) -> dict:
+        """Throughput and p50/p95 per phase, in seconds."""
+        elapsed = self.elapsed
+        phases: dict = {}
+        for record in self.records:
+            for phase, seconds in record.phases.items():
+                phases.setdefault(phase, []).append(seconds)
+        input_bytes = sum(record.input_bytes for record in self.records)
+        return {
+            "images": len(self.records),
+            "elapsed_seconds": elapsed,
+            "images_per_second": len(self.records) / elapsed if elapsed else 0.0,
+            "input_mb_per_second": input_bytes / 1e6 / elapsed if elapsed else 0.0,
+            "input_bytes": input_bytes,
+            "output_bytes": sum(record.output_bytes for record in self.records),
+            "phases": {
+                phase: {"p50": _percentile(values, 0.50), "p95": _percentile(values, 0.95)}
+                for phase, values in phases.items()
+            },
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write records as CSV (``.csv``) or JSON with the summary (anything else)."""
+        phase_names = sorted({phase for record in self.records for phase in record.phases})
+        rows = [
+            {
+                "source": str(record.source),
+                "destination": str(record.destination),
+                "action": record.action,
+                "input_pixels": record.input_pixels,
+                "output_pixels": record.output_pixels,
+                "input_bytes": record.input_bytes,
+                "output_bytes": record.output_bytes,
+                **{f"{phase}_seconds": record.phases.get(phase, 0.0) for phase in phase_names},
+            }
+            for record in self.records
+        ]
+        ensure_directory(path.parent)
+        if path.suffix.lower() == ".csv":
+            fields = [
+                "source",
+                "destination",
+                "action",
+                "input_pixels",
+                "output_pixels",
+                "input_bytes",
+                "output_bytes",
+                *(f"{phase}_seconds" for phase in phase_names),
+            ]
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                writer = csv.DictWriter(handle, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            payload = {"summary": self.summary(), "images": rows}
+            path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+
+def _normalize_format(name: str) -> str:
+    """Pillow's format name for an extension or format name (``.tif`` is TIFF)."""
+    name = name.lstrip(".")
+    return Image.registered_extensions().get(f".{name.lower()}", name.upper())
+
+
+def _destination_for(
+    image_path: Path,
+    input_dir: Path,
+    target_dir: Path,
+    output_format: str | None,
+    suffix: str | None,
+) -> Path:
+    relative = image_path.relative_to(input_dir)
+    ext = (f".{output_format.lower()}" if output_format else image_path.suffix).lower()
+    name_suffix = suffix or ""
+    return target_dir / relative.parent / f"{image_path.stem}{name_suffix}{ext}"
+
+
+def _iter_tasks(
+    input_dir: Path,
+    target_dir: Path,
+    *,
+    output_format: str | None,
+    suffix: str | None,
+    recursive: bool,
+    include_hidden: bool,
+    ignore_names: Iterable[str] | None,
+) -> Iterable[Tuple[Path, Path]]:
+    for image_path in _iter_image_files(
+        input_dir, recursive=recursive, include_hidden=include_hidden, ignore_names=ignore_names
+    ):
+        yield image_path, _destination_for(image_path, input_dir, target_dir, output_format, suffix)
+
+
+def _probe(
+    source: Path,
+    destination: Path,
+    spec: _ResizeSpec,
+    *,
+    overwrite: bool,
+    passthrough: PassthroughMode,
+) -> ResizePlanEntry:
+    if destination.exists() and not overwrite:
+        return ResizePlanEntry(source, destination, None, None, "skip")
+
+    with span("plan"), Image.open(source) as img:
+        orientation, upright = _header_geometry(img)
+    target_size = _target_for(spec, upright)
+
+    unchanged = (
+        target_size == upright
+        and orientation == 1
+        and _normalize_format(source.suffix) == _output_format(spec, destination.suffix)
+    )
+    action: ResizeAction = "copy" if unchanged and passthrough != "none" else "resize"
+    return ResizePlanEntry(source, destination, upright, target_size, action)
+
+
+def _iter_plan(
+    tasks: Iterable[Tuple[Path, Path]],
+    spec: _ResizeSpec,
+    *,
+    overwrite: bool,
+    passthrough: PassthroughMode,
+    jobs: int,
+) -> Iterator[ResizePlanEntry]:
+    """Probe ``tasks`` in order, a bounded window ahead of the consumer."""
+    def probe(task: Tuple[Path, Path]) -> ResizePlanEntry:
+        return _probe(task[0], task[1], spec, overwrite=overwrite, passthrough=passthrough)
+
+    for _, entry in _run_windowed(tasks, probe, max(jobs, _PROBE_WORKERS)):
+        yield entry
+
+
+def _execute(
+    entry: ResizePlanEntry,
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    passthrough: PassthroughMode,
+    report: ResizeReport | None = None,
+) -> Path:
+    ensure_directory(entry.destination.parent)
+    laps = _laps_for(report)
+    if entry.action == "copy":
+        if passthrough == "link":
+            link_or_copy(entry.source, entry.destination)
+        else:
+            with atomic_destination(entry.destination) as temp:
+                copy_file_fast(entry.source, temp)
+        laps.lap("copy")
+    else:
+        _resize_one(entry.source, entry.destination, spec, budget, laps)
+
+    _record_laps(laps)
+    if report is not None:
+        report.add(entry, laps.phases)  # type: ignore[union-attr]
+    return entry.destination
+
+
+def _content_digest(path: Path) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _dedup_tasks(
+    tasks: List[Tuple[Path, Path]],
+    spec: _ResizeSpec,
+    jobs: int,
+) -> Tuple[List[Tuple[Path, Path]], dict]:
+    """Split tasks into one primary per distinct source and its duplicates.
+
+    Sources are grouped by byte size and output format first; only sizes
+    shared by several files are hashed. Returns the primary tasks (in their
+    original order) and a map of primary source -> duplicate tasks.
+    """
+    by_size: dict = {}
+    for task in tasks:
+        key = (task[0].stat().st_size, _output_format(spec, task[1].suffix))
+        by_size.setdefault(key, []).append(task)
+
+    to_hash = [task for group in by_size.values() if len(group) > 1 for task in group]
+    with ThreadPoolExecutor(max_workers=max(jobs, _PROBE_WORKERS)) as executor:
+        digests = dict(zip((task[0] for task in to_hash), executor.map(lambda t: _content_digest(t[0]), to_hash)))
+
+    primary_for: dict = {}
+    followers: dict = {}
+    primaries: List[Tuple[Path, Path]] = []
+    for task in tasks:
+        if task[0] not in digests:
+            primaries.append(task)
+            continue
+        key = (digests[task[0]], _output_format(spec, task[1].suffix))
+        primary = primary_for.setdefault(key, task)
+        if primary is task:
+            primaries.append(task)
+        else:
+            followers.setdefault(primary[0], []).append(task)
+    return primaries, followers
+
+
+def _fill_duplicates(
+    primary_output: Path,
+    duplicates: List[Tuple[Path, Path]],
+    mode: DedupMode,
+    overwrite: bool,
+) -> List[Tuple[Path, Path]]:
+    """Materialize duplicate outputs from an already written primary output."""
+    filled: List[Tuple[Path, Path]] = []
+    for source, destination in duplicates:
+        if destination.exists() and not overwrite:
+            continue
+        ensure_directory(destination.parent)
+        if mode == "link":
+            link_or_copy(primary_output, destination)
+        else:
+            with atomic_destination(destination) as temp:
+                reflink_or_copy(primary_output, temp)
+        filled.append((source, destination))
+    return filled
+
+
+def _run_windowed(items: Iterable, work: Callable, jobs: int) -> Iterator[Tuple]:
+    """Yield ``(item, work(item))`` in input order, with ``jobs`` workers.
+
+    At most ``2 * jobs`` items are submitted ahead of the consumer, so a
+    slow consumer (or a huge input) never piles up results in memory.
+    """
+    if jobs <= 1:
+        for item in items:
+            yield item, work(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    window: deque = deque()
+    try:
+        for item in items:
+            window.append((item, executor.submit(work, item)))
+            if len(window) >= jobs * 2:
+                done, future = window.popleft()
+                yield done, future.result()
+        while window:
+            done, future = window.popleft()
+            yield done, future.result()
+    finally:
+        # On interrupt, drop queued work instead of finishing the whole batch.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_pending(
+    plan: Iterable[ResizePlanEntry],
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    passthrough: PassthroughMode,
+    jobs: int,
+    report: ResizeReport | None = None,
+) -> Iterator[Tuple[ResizePlanEntry, Path | None]]:
+    """Execute planned entries, yielding them in plan order as they finish.
+
+    ``skip`` entries pass through with ``None`` instead of a destination.
+    """
+    def work(entry: ResizePlanEntry) -> Path | None:
+        return None if entry.action == "skip" else _execute(entry, spec, budget, passthrough, report)
+
+    return _run_windowed(plan, work, jobs)
+
+
+class _ArchiveWriter:
+    """Single sequential writer for ``.zip``, ``.tar``, ``.tar.gz``/``.tgz``."""
+
+    def __init__(self, path: Path, archive_name: str) -> None:
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        lowered = archive_name.lower()
+        if lowered.endswith(".zip"):
+            # Encoded images do not deflate further; store them as-is.
+            self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED)
+        elif lowered.endswith(".tar"):
+            self._tar = tarfile.open(path, "w")
+        elif lowered.endswith((".tar.gz", ".tgz")):
+            self._tar = tarfile.open(path, "w:gz")
+        else:
+            raise ValueError(f"Unsupported archive type: {archive_name} (use .zip, .tar, .tar.gz or .tgz)")
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(data))  # type: ignore[union-attr]
+
+    def add_file(self, name: str, source: Path) -> None:
+        if self._zip is not None:
+            self._zip.write(source, name)
+        else:
+            self._tar.add(source, arcname=name, recursive=False)  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+
+
+def _encode_entry(
+    entry: ResizePlanEntry,
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    report: ResizeReport | None,
+) -> bytes | None:
+    """Encode a planned resize in memory; pass-through entries return ``None``."""
+    if entry.action == "copy":
+        return None
+    laps = _laps_for(report)
+    buffer = io.BytesIO()
+    _resize_stream(entry.source, buffer, spec, budget, ext=entry.destination.suffix, laps=laps)
+    data = buffer.getvalue()
+    _record_laps(laps)
+    if report is not None:
+        report.add(entry, laps.phases, output_bytes=len(data))  # type: ignore[union-attr]
+    return data
+
+
+def _write_archive(
+    archive: Path,
+    pending: Iterable[ResizePlanEntry],
+    spec: _ResizeSpec,
+    budget: _PixelBudget | None,
+    jobs: int,
+    report: ResizeReport | None,
+    duplicates: dict,
+) -> List[Path]:
+    members: List[Path] = []
+    ensure_directory(archive.parent)
+    with atomic_destination(archive) as temp:
+        writer = _ArchiveWriter(temp, archive.name)
+        try:
+            encoded = _run_windowed(pending, lambda entry: _encode_entry(entry, spec, budget, report), jobs)
+            for entry, data in encoded:
+                name = entry.destination.as_posix()
+                if data is None:
+                    laps = _laps_for(report)
+                    writer.add_file(name, entry.source)
+                    laps.lap("copy")
+                    _record_laps(laps)
+                    if report is not None:
+                        report.add(entry, laps.phases, output_bytes=entry.source.stat().st_size)  # type: ignore[union-attr]
+                else:
+                    with span("write"):
+                        writer.add_bytes(name, data)
+                members.append(entry.destination)
+                for source, destination in duplicates.get(entry.source, []):
+                    with span("write"):
+                        if data is None:
+                            writer.add_file(destination.as_posix(), source)
+                        else:
+                            writer.add_bytes(destination.as_posix(), data)
+                    members.append(destination)
+        finally:
+            writer.close()
+    return members
+
+
+class _Checkpoint:
+    """Append-only log of finished sources, as POSIX paths relative to the input."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.done: set[str] = set()
+        self._pending: List[str] = []
+        if path.exists():
+            text = path.read_text(encoding="utf-8")
+            lines = text.split("\n")
+            # The last element is "" for a clean file, or a torn line if a
+            # previous run was killed mid-flush; either way it is dropped.
+            self.done.update(line for line in lines[:-1] if line)
+
+    def mark(self, key: str) -> None:
+        self._pending.append(key)
+        if len(self._pending) >= _CHECKPOINT_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        ensure_directory(self.path.parent)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write("".join(f"{key}\n" for key in self._pending))
+        self.done.update(self._pending)
+        self._pending.clear()
+
+
+def plan_resize(
+    input_dir: Path,
+    *,
+    output_dir: Optional[Path] = None,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    output_format: str | None = None,
+    suffix: str | None = None,
+    overwrite: bool = False,
+    recursive: bool = False,
+    include_hidden: bool = False,
+    ignore_names: Iterable[str] | None = None,
+    passthrough: PassthroughMode = "copy",
+    jobs: int = 1,
+) -> List[ResizePlanEntry]:
+    """Work out what ``resize_images`` would do, reading image headers only.
+
+    Nothing is decoded or written. Each entry is ``resize`` (needs
+    resampling), ``copy`` (already within bounds, in the right format and
+    upright, so it is passed through as-is) or ``skip`` (destination exists
+    and ``overwrite`` is off).
+    """
+    target_dir = (output_dir or (input_dir / "resized")).resolve()
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=90,
+        output_format=output_format,
+    )
+    with span("scan"):
+        tasks = list(
+            _iter_tasks(
+                input_dir,
+                target_dir,
+                output_format=output_format,
+                suffix=suffix,
+                recursive=recursive,
+                include_hidden=include_hidden,
+                ignore_names=ignore_names,
+            )
+        )
+    return list(_iter_plan(tasks, spec, overwrite=overwrite, passthrough=passthrough, jobs=jobs))
+
+
+def iter_resize_images(
+    input_dir: Path,
+    *,
+    output_dir: Optional[Path] = None,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
+    suffix: str | None = None,
+    overwrite: bool = False,
+    recursive: bool = False,
+    include_hidden: bool = False,
+    ignore_names: Iterable[str] | None = None,
+    jobs: int = 1,
+    max_pixels: int | None = None,
+    passthrough: PassthroughMode = "copy",
+    checkpoint: Path | None = None,
+    report: ResizeReport | None = None,
+    output_archive: Path | None = None,
+    dedup: DedupMode | None = None,
+) -> Iterator[Path]:
+    """Resize images in a directory, yielding each written path as it is done.
+
+    Takes the same arguments as ``resize_images``. Nothing is read until the
+    first path is requested, and an output is complete on disk by the time
+    its path is yielded, so a consumer can upload or index it straight away.
+    The walk, the header probes and the resizes run as one pipeline with a
+    bounded window between steps, so the first output does not wait for
+    the whole tree to be scanned; only ``dedup`` (which compares every
+    source) and ``output_archive`` (whose members are yielded once the
+    archive is complete) collect the tree first. ``report`` is complete
+    once the iterator is exhausted. Closing the iterator early stops the
+    run and still flushes the checkpoint.
+    """
+    if output_archive is not None and checkpoint is not None:
+        raise ValueError("checkpoint cannot be combined with output_archive")
+    if output_archive is not None:
+        # Members are named relative to the archive root; nothing on disk
+        # can already hold them, so every entry is (re)written.
+        target_dir = Path()
+        overwrite = True
+    else:
+        target_dir = (output_dir or (input_dir / "resized")).resolve()
+        ensure_directory(target_dir)
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=quality,
+        output_format=output_format,
+        profile=profile,
+    )
+    budget = _PixelBudget(max_pixels) if max_pixels is not None else None
+    log = _Checkpoint(checkpoint) if checkpoint is not None else None
+
+    def scanned() -> Iterator[Tuple[Path, Path]]:
+        walk = iter(
+            _iter_tasks(
+                input_dir,
+                target_dir,
+                output_format=output_format,
+                suffix=suffix,
+                recursive=recursive,
+                include_hidden=include_hidden,
+                ignore_names=ignore_names,
+            )
+        )
+        while True:
+            with span("scan"):
+                task = next(walk, None)
+            if task is None:
+                return
+            if report is not None:
+                report.scanned += 1
+            if log is None or task[0].relative_to(input_dir).as_posix() not in log.done:
+                yield task
+
+    if report is not None:
+        report.started = time.perf_counter()
+    try:
+        tasks: Iterable[Tuple[Path, Path]] = scanned()
+        duplicates: dict = {}
+        if dedup is not None:
+            tasks = list(tasks)
+            with span("plan"):
+                tasks, duplicates = _dedup_tasks(tasks, spec, jobs)
+
+        plan = _iter_plan(tasks, spec, overwrite=overwrite, passthrough=passthrough, jobs=jobs)
+        if output_archive is not None:
+            pending = (entry for entry in plan if entry.action != "skip")
+            yield from _write_archive(output_archive.resolve(), pending, spec, budget, jobs, report, duplicates)
+            return
+
+        def finished(source: Path, destination: Path) -> Path:
+            if log is not None:
+                log.mark(source.relative_to(input_dir).as_posix())
+            return destination
+
+        def fill(entry: ResizePlanEntry) -> Iterator[Path]:
+            if entry.source in duplicates:
+                copies = _fill_duplicates(entry.destination, duplicates[entry.source], dedup or "link", overwrite)
+                for source, destination in copies:
+                    yield finished(source, destination)
+
+        for entry, destination in _run_pending(plan, spec, budget, passthrough, jobs, report):
+            if destination is not None:
+                yield finished(entry.source, destination)
+            # An existing (skipped) primary output can still seed missing duplicates.
+            yield from fill(entry)
+    finally:
+        if log is not None:
+            log.flush()
+        if report is not None:
+            report.finished = time.perf_counter()
+
+
 def resize_images(
     input_dir: Path,
     *,
@@ -103,62 +1009,362 @@ def resize_images(
     allow_upscale: bool = False,
     quality: int = 90,
     output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
     suffix: str | None = None,
     overwrite: bool = False,
     recursive: bool = False,
     include_hidden: bool = False,
     ignore_names: Iterable[str] | None = None,
+    jobs: int = 1,
+    max_pixels: int | None = None,
+    passthrough: PassthroughMode = "copy",
+    checkpoint: Path | None = None,
+    report: ResizeReport | None = None,
+    output_archive: Path | None = None,
+    dedup: DedupMode | None = None,
 ) -> List[Path]:
     """Resize images in a directory.
 
-    Returns a list of written file paths.
+    Runs in two phases: a header-only plan (see ``plan_resize``) and then
+    the work itself. Images that are already within bounds are passed
+    through instead of re-encoded, by fast copy (``passthrough="copy"``) or
+    hard link (``"link"``); ``"none"`` re-encodes them like any other.
+
+    ``jobs`` resizes that many images concurrently. ``max_pixels`` caps the
+    number of decoded source pixels held by all workers at once. JPEGs are
+    decoded at reduced scale to fit; any other image larger than
+    ``max_pixels`` raises ``ValueError`` instead of being decoded. The cap
+    covers decoded sources only, not resize and encoder buffers, so it
+    bounds rather than fixes peak memory. Pillow's decompression-bomb limit
+    still applies to every image.
+
+    ``profile`` picks the encoder settings from ``RESIZE_PROFILES``
+    (``fast``, ``balanced`` or ``smallest``).
+
+    Every output is written to a temp file and moved into place with
+    ``os.replace``, so an interrupted run never leaves a truncated image.
+    With ``checkpoint``, finished sources are logged to that file in
+    batches; a rerun skips them without probing their outputs, so a killed
+    job resumes where it stopped.
+
+    ``report`` collects per-image phase timings, pixel and byte counts; with
+    it unset the timing hooks are no-ops.
+
+    ``output_archive`` (``.zip``, ``.tar``, ``.tar.gz``) replaces
+    ``output_dir``: encoded images go straight from memory into one archive,
+    mirroring the relative layout, through a single sequential writer fed
+    by the parallel encoders. The archive appears atomically when complete.
+    In that mode the returned paths are archive member names.
+
+    ``dedup`` resizes byte-identical sources (same size and content hash)
+    only once; the other destinations are filled from the first output by
+    hard link (``"link"``) or reflink copy (``"reflink"``, falling back to a
+    plain copy where the filesystem cannot clone).
+
+    Returns a list of written file paths; ``iter_resize_images`` yields them
+    one at a time instead.
     """
-    target_dir = (output_dir or (input_dir / "resized")).resolve()
-    ensure_directory(target_dir)
+    return list(
+        iter_resize_images(
+            input_dir,
+            output_dir=output_dir,
+            width=width,
+            height=height,
+            max_width=max_width,
+            max_height=max_height,
+            scale=scale,
+            keep_aspect=keep_aspect,
+            allow_upscale=allow_upscale,
+            quality=quality,
+            output_format=output_format,
+            profile=profile,
+            suffix=suffix,
+            overwrite=overwrite,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            ignore_names=ignore_names,
+            jobs=jobs,
+            max_pixels=max_pixels,
+            passthrough=passthrough,
+            checkpoint=checkpoint,
+            report=report,
+            output_archive=output_archive,
+            dedup=dedup,
+        )
+    )
 
-    written: List[Path] = []
-    for image_path in _iter_image_files(
-        input_dir, recursive=recursive, include_hidden=include_hidden, ignore_names=ignore_names
-    ):
-        relative = image_path.relative_to(input_dir)
-        destination_dir = target_dir / relative.parent
-        ensure_directory(destination_dir)
 
-        ext = (f".{output_format.lower()}" if output_format else image_path.suffix).lower()
-        name_suffix = suffix or ""
-        destination_path = destination_dir / f"{image_path.stem}{name_suffix}{ext}"
+class _MemoryReader(io.RawIOBase):
+    """Seekable read-only file over a buffer, without copying it up front."""
 
-        if destination_path.exists() and not overwrite:
-            continue
+    def __init__(self, buffer: memoryview) -> None:
+        self._view = buffer
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:  # type: ignore[no-untyped-def]
+        chunk = self._view[self._pos : self._pos + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = len(self._view) + offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def _open_source(data: ImageSource) -> BinaryIO:
+    if isinstance(data, bytes):
+        # BytesIO shares an immutable bytes object until it is written to.
+        return io.BytesIO(data)
+    if isinstance(data, (bytearray, memoryview)):
+        return io.BufferedReader(_MemoryReader(memoryview(data).cast("B")))
+    if not data.seekable():
+        return io.BytesIO(data.read())
+    return data
 
+
+def resize_image_bytes(
+    data: ImageSource,
+    *,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
+    max_pixels: int | None = None,
+) -> bytes:
+    """Resize one encoded image held in memory and return the encoded result.
+
+    ``data`` may be ``bytes``, a ``bytearray``/``memoryview`` or a binary
+    file object; nothing touches the disk. Sizing and encoding follow
+    ``resize_images``, and the output keeps the source format unless
+    ``output_format`` is given. Pillow's decompression-bomb guard stays on.
+    """
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=quality,
+        output_format=output_format,
+        profile=profile,
+    )
+    budget = _PixelBudget(max_pixels) if max_pixels is not None else None
+    return _resize_buffer(data, spec, budget)
+
+
+def _resize_buffer(data: ImageSource, spec: _ResizeSpec, budget: _PixelBudget | None) -> bytes:
+    output = io.BytesIO()
+    _resize_stream(_open_source(data), output, spec, budget)
+    return output.getvalue()
+
+
+def iter_resize_bytes(
+    items: Iterable[ImageSource],
+    *,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
+    jobs: int = 1,
+    max_pixels: int | None = None,
+) -> Iterator[bytes]:
+    """Resize a stream of in-memory images, yielding results in input order.
+
+    At most ``jobs`` images are in flight (plus one queued per worker), so
+    ``items`` can be an unbounded generator. ``max_pixels`` is shared by all
+    workers as in ``resize_images``.
+    """
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=quality,
+        output_format=output_format,
+        profile=profile,
+    )
+    budget = _PixelBudget(max_pixels) if max_pixels is not None else None
+    for _, output in _run_windowed(items, lambda data: _resize_buffer(data, spec, budget), jobs):
+        yield output
+
+
+class ProfileBenchmark(NamedTuple):
+    """Encode cost of one profile/format pair over a benchmark sample."""
+    profile: str
+    format: str
+    images: int
+    encode_seconds: float
+    output_bytes: int
+
+
+def benchmark_profiles(
+    input_dir: Path,
+    *,
+    sample: int = 20,
+    profiles: Iterable[str] | None = None,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    recursive: bool = False,
+    include_hidden: bool = False,
+    ignore_names: Iterable[str] | None = None,
+    seed: int = 0,
+) -> List[ProfileBenchmark]:
+    """Measure encode time and output size of each profile on real images.
+
+    Picks up to ``sample`` images from ``input_dir`` (reproducibly, via
+    ``seed``), decodes and resizes each once, then encodes the result in
+    memory with every profile. Only the encode step is timed. Results are
+    grouped per profile and output format.
+    """
+    candidates = sorted(
+        _iter_image_files(input_dir, recursive=recursive, include_hidden=include_hidden, ignore_names=ignore_names)
+    )
+    if len(candidates) > sample:
+        candidates = sorted(random.Random(seed).sample(candidates, sample))
+    chosen_profiles = list(profiles or RESIZE_PROFILES)
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=quality,
+        output_format=output_format,
+    )
+
+    totals: dict = {}
+    for image_path in candidates:
         with Image.open(image_path) as img:
-            img = ImageOps.exif_transpose(img)
-            target_size = _compute_target_size(
-                img.size,
-                width=width,
-                height=height,
-                max_width=max_width,
-                max_height=max_height,
-                scale=scale,
-                keep_aspect=keep_aspect,
-                allow_upscale=allow_upscale,
+            upright = ImageOps.exif_transpose(img)
+            resized = upright.resize(_target_for(spec, upright.size), resample=Resample.LANCZOS)
+        fmt = _output_format(spec, image_path.suffix)
+        if fmt in {"JPEG", "JPG"} and resized.mode in {"RGBA", "P"}:
+            resized = resized.convert("RGB")
+        for profile in chosen_profiles:
+            buffer = io.BytesIO()
+            started = time.perf_counter()
+            resized.save(buffer, **_save_kwargs(fmt, quality, profile))
+            elapsed = time.perf_counter() - started
+            images, seconds, size = totals.get((profile, fmt), (0, 0.0, 0))
+            totals[(profile, fmt)] = (images + 1, seconds + elapsed, size + buffer.tell())
+
+    return [
+        ProfileBenchmark(profile, fmt, images, seconds, size)
+        for (profile, fmt), (images, seconds, size) in sorted(
+            totals.items(), key=lambda item: (chosen_profiles.index(item[0][0]), item[0][1])
+        )
+    ]
+
+
+_async_executor: ThreadPoolExecutor | None = None
+_async_executor_lock = threading.Lock()
+
+
+def _default_async_executor() -> ThreadPoolExecutor:
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="hsu-resize",
             )
-            resized = img.resize(target_size, resample=Resample.LANCZOS)
-
-            fmt = (output_format or img.format or ext.lstrip(".") or "png").upper()
-            if fmt == "JPG":
-                fmt = "JPEG"
-            save_kwargs = {"format": fmt}
-            if fmt in {"JPEG", "JPG", "WEBP"}:
-                save_kwargs["quality"] = max(1, min(quality, 100))
-                save_kwargs["optimize"] = True
-            if fmt in {"JPEG", "JPG"} and resized.mode in {"RGBA", "P"}:
-                resized = resized.convert("RGB")
+        return _async_executor
 
-            resized.save(destination_path, **save_kwargs)
-            written.append(destination_path)
 
-    return written
+async def aresize_image_bytes(
+    data: ImageSource,
+    *,
+    executor: Executor | None = None,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
+    max_pixels: int | None = None,
+) -> bytes:
+    """Async ``resize_image_bytes`` that runs on a bounded thread pool.
+
+    Uses a shared pool sized to the CPU count unless ``executor`` is given.
+    Pillow releases the GIL while decoding, resampling and encoding, so the
+    event loop stays responsive.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _default_async_executor(),
+        lambda: resize_image_bytes(
+            data,
+            width=width,
+            height=height,
+            max_width=max_width,
+            max_height=max_height,
+            scale=scale,
+            keep_aspect=keep_aspect,
+            allow_upscale=allow_upscale,
+            quality=quality,
+            output_format=output_format,
+            profile=profile,
+            max_pixels=max_pixels,
+        ),
+    )
 
 
-__all__ = ["resize_images"]
+__all__ = [
+    "aresize_image_bytes",
+    "benchmark_profiles",
+    "DedupMode",
+    "iter_resize_bytes",
+    "plan_resize",
+    "resize_image_bytes",
+    "resize_images",
+    "ImageTiming",
+    "ProfileBenchmark",
+    "ResizePlanEntry",
+    "ResizeReport",
+]
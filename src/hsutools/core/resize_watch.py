@@ -0,0 +1,308 @@
+"""Hot-folder mode for image resizing."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import DEFAULT_RESIZE_PROFILE, IMAGE_EXTENSIONS
+from .image_resize import (
+    PassthroughMode,
+    _destination_for,
+    _execute,
+    _PixelBudget,
+    _probe,
+    _ResizeSpec,
+)
+
+WatchCallback = Callable[[Path, Optional[Path], Optional[BaseException]], None]
+
+# inotify(7) constants.
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _PollingWatcher:
+    """Portable watcher that diffs (size, mtime) snapshots of the tree."""
+
+    def __init__(self, root: Path, *, recursive: bool, accept_dir: Callable[[Path], bool]) -> None:
+        self._root = root
+        self._recursive = recursive
+        self._accept_dir = accept_dir
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        stack = [self._root]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError:
+                continue
+            for entry in entries:
+                path = Path(entry.path)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self._recursive and self._accept_dir(path):
+                            stack.append(path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        snapshot[path] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+        return snapshot
+
+    def poll(self, timeout: float) -> List[Path]:
+        time.sleep(timeout)
+        current = self._scan()
+        changed = [path for path, stamp in current.items() if self._snapshot.get(path) != stamp]
+        self._snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Linux inotify watcher; adds a watch for every accepted directory."""
+
+    def __init__(self, root: Path, *, recursive: bool, accept_dir: Callable[[Path], bool]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._recursive = recursive
+        self._accept_dir = accept_dir
+        self._root = root
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        try:
+            self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, directory: Path) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _watch_tree(self, directory: Path) -> List[Path]:
+        """Watch ``directory`` (and below, if recursive); return files already there."""
+        self._watch(directory)
+        found: List[Path] = []
+        for root, dirs, files in os.walk(directory):
+            root_path = Path(root)
+            dirs[:] = [d for d in dirs if self._accept_dir(root_path / d)] if self._recursive else []
+            for name in dirs:
+                self._watch(root_path / name)
+            found.extend(root_path / name for name in files)
+        return found
+
+    def poll(self, timeout: float) -> List[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return []
+
+        changed: List[Path] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost: report everything under the root again.
+                changed.extend(self._rescan())
+                continue
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if self._recursive and mask & (_IN_CREATE | _IN_MOVED_TO) and self._accept_dir(path):
+                    # Files can land before the new watch is in place.
+                    changed.extend(self._watch_tree(path))
+                continue
+            changed.append(path)
+        return changed
+
+    def _rescan(self) -> List[Path]:
+        found: List[Path] = []
+        for root, dirs, files in os.walk(self._root):
+            root_path = Path(root)
+            dirs[:] = [d for d in dirs if self._accept_dir(root_path / d)] if self._recursive else []
+            found.extend(root_path / name for name in files)
+        return found
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _open_watcher(root: Path, *, recursive: bool, accept_dir: Callable[[Path], bool], use_inotify: bool):
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(root, recursive=recursive, accept_dir=accept_dir)
+        except (OSError, AttributeError):
+            # No inotify symbol, or the watch limit was hit on a huge tree.
+            pass
+    return _PollingWatcher(root, recursive=recursive, accept_dir=accept_dir)
+
+
+def watch_resize(
+    input_dir: Path,
+    *,
+    output_dir: Optional[Path] = None,
+    width: int | None = 1920,
+    height: int | None = None,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    scale: float | None = None,
+    keep_aspect: bool = True,
+    allow_upscale: bool = False,
+    quality: int = 90,
+    output_format: str | None = None,
+    profile: str = DEFAULT_RESIZE_PROFILE,
+    suffix: str | None = None,
+    recursive: bool = True,
+    include_hidden: bool = False,
+    ignore_names: Iterable[str] | None = None,
+    jobs: int = 1,
+    max_pixels: int | None = None,
+    passthrough: PassthroughMode = "copy",
+    settle: float = 2.0,
+    poll_interval: float = 1.0,
+    use_inotify: bool = True,
+    stop_event: threading.Event | None = None,
+    callback: WatchCallback | None = None,
+) -> int:
+    """Watch ``input_dir`` and resize images as they arrive or change.
+
+    Uses inotify on Linux and falls back to polling every ``poll_interval``
+    seconds elsewhere (or when the watch limit is exhausted). Files already
+    present when watching starts are left alone. A file is processed once
+    its size and mtime have not changed for ``settle`` seconds, on a pool
+    of ``jobs`` workers with a bounded queue. ``callback`` receives
+    ``(source, destination, error)`` for every processed file; failures do
+    not stop the watcher.
+
+    Runs until ``stop_event`` is set or the process is interrupted, and
+    returns the number of images written.
+    """
+    input_dir = input_dir.resolve()
+    target_dir = (output_dir or (input_dir / "resized")).resolve()
+    target_dir.mkdir(parents=True, exist_ok=True)
+    spec = _ResizeSpec(
+        width=width,
+        height=height,
+        max_width=max_width,
+        max_height=max_height,
+        scale=scale,
+        keep_aspect=keep_aspect,
+        allow_upscale=allow_upscale,
+        quality=quality,
+        output_format=output_format,
+        profile=profile,
+    )
+    budget = _PixelBudget(max_pixels) if max_pixels is not None else None
+    ignore = set(ignore_names or [])
+    stop = stop_event or threading.Event()
+
+    def excluded(path: Path) -> bool:
+        if path == target_dir or target_dir in path.parents:
+            return True
+        relative = path.relative_to(input_dir)
+        if any(part in ignore for part in relative.parts):
+            return True
+        return not include_hidden and any(part.startswith(".") for part in relative.parts)
+
+    def wanted(path: Path) -> bool:
+        return path.suffix.lower() in IMAGE_EXTENSIONS and not excluded(path)
+
+    written = 0
+    written_lock = threading.Lock()
+    slots = threading.BoundedSemaphore(max(1, jobs) * 2)
+
+    def process(source: Path) -> None:
+        nonlocal written
+        destination: Path | None = None
+        error: BaseException | None = None
+        try:
+            destination = _destination_for(source, input_dir, target_dir, output_format, suffix)
+            entry = _probe(source, destination, spec, overwrite=True, passthrough=passthrough)
+            _execute(entry, spec, budget, passthrough)
+            with written_lock:
+                written += 1
+        except Exception as exc:  # keep the daemon alive
+            error = exc
+        finally:
+            slots.release()
+        if callback is not None:
+            callback(source, destination if error is None else None, error)
+
+    watcher = _open_watcher(input_dir, recursive=recursive, accept_dir=lambda p: not excluded(p), use_inotify=use_inotify)
+    # path -> (size, mtime_ns, monotonic time the stamp was first seen)
+    pending: Dict[Path, Tuple[int, int, float]] = {}
+    tick = min(poll_interval, max(settle / 2, 0.05))
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="hsu-watch") as executor:
+            while not stop.is_set():
+                for path in watcher.poll(tick):
+                    if wanted(path):
+                        pending[path] = (-1, -1, 0.0)
+
+                now = time.monotonic()
+                for path, (size, mtime, since) in list(pending.items()):
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        del pending[path]
+                        continue
+                    stamp = (st.st_size, st.st_mtime_ns)
+                    if stamp != (size, mtime):
+                        pending[path] = (*stamp, now)
+                    elif now - since >= settle:
+                        del pending[path]
+                        slots.acquire()
+                        executor.submit(process, path)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+    return written
+
+
+__all__ = ["watch_resize"]
@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import codecs
+import importlib.metadata
+import json
+import mmap
 import os
+import re
 import shutil
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, Literal, NamedTuple
+from typing import IO, Callable, Iterable, Iterator, Literal, NamedTuple
+
+from ..config import OFFICE_EXTENSIONS
+from ..profiling import span
+from ..utils import atomic_destination
+from .s2tw_backup import BackupMode, BackupStore, create_backup, is_snapshot_name
+from .s2tw_manifest import ConversionManifest
 
 try:
+    import opencc
     from opencc import OpenCC
     HAS_OPENCC = True
 except ImportError:
@@ -32,6 +47,43 @@ class ConversionStats(NamedTuple):
     dirs_renamed: int
     files_backed_up: int
     errors: int
+    files_scanned: int = 0
+    files_unchanged: int = 0
+    bytes_read: int = 0  # size of the files opened for conversion
+    bytes_written: int = 0  # size of the converted files
+
+
+class ConversionRun:
+    """
+    Iterator over the results of ``iter_convert_s2tw_recursive``.
+    
+    Results are yielded as files and directories are done. ``stats`` counts
+    the work so far and is final once the iterator is exhausted; ``close``
+    (or leaving a ``with`` block) stops the run early.
+    """
+    
+    def __init__(self, results: Iterator[ConversionResult], counts: dict[str, int]) -> None:
+        self._results = results
+        self._counts = counts
+    
+    def __iter__(self) -> "ConversionRun":
+        return self
+    
+    def __next__(self) -> ConversionResult:
+        return next(self._results)
+    
+    @property
+    def stats(self) -> ConversionStats:
+        return ConversionStats(**self._counts)
+    
+    def close(self) -> None:
+        self._results.close()
+    
+    def __enter__(self) -> "ConversionRun":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def check_opencc_available() -> bool:
@@ -39,46 +91,177 @@ def check_opencc_available() -> bool:
     return HAS_OPENCC
 
 
-def create_backup(
-    file_path: Path,
-    backup_dir: Path | None = None,
-    backup_suffix: str = ".backup",
-) -> Path:
+S2twEngine = Literal["opencc", "compiled"]
+S2TW_ENGINES = ("opencc", "compiled")
+
+# Converters are expensive to build (every dictionary is parsed) but
+# stateless once built, so one instance per config and engine is shared by
+# all callers.
+_converters: dict[tuple[str, str], "OpenCC"] = {}
+_converters_lock = threading.Lock()
+
+# 當 extensions 為 None 時，使用常見文字檔案擴展名
+# 這樣可以處理大部分需要轉換的檔案類型
+TEXT_EXTENSIONS = {
+    ".md", ".txt", ".json", ".yaml", ".yml", ".xml", ".html", ".htm",
+    ".css", ".js", ".ts", ".jsx", ".tsx", ".vue", ".py", ".java",
+    ".c", ".cpp", ".h", ".hpp", ".cs", ".go", ".rs", ".rb", ".php",
+    ".sh", ".bat", ".ps1", ".sql", ".csv", ".ini", ".cfg", ".conf",
+    ".toml", ".rst", ".tex", ".log", ".properties", ".env",
+}
+
+# Files at least this large are converted in chunks instead of as one string.
+_STREAM_THRESHOLD = 32 * 1024 * 1024
+# Characters read per chunk in streaming mode.
+_STREAM_CHUNK = 1024 * 1024
+
+# Cached name conversions; directory and file names repeat a lot in a tree.
+_NAME_CACHE_SIZE = 65536
+
+
+def get_converter(config: str = "s2twp", engine: S2twEngine = "opencc") -> "OpenCC":
     """
-    Create a backup of a file.
+    Return the shared converter for ``config``, building it on first use.
+    
+    Safe to call from several threads; the dictionaries are loaded once.
+    The ``compiled`` engine gives the same output as OpenCC from a
+    memory-mapped dictionary compiled on first use (see ``s2tw_engine``).
     
     Args:
-        file_path: Path to the file to backup
-        backup_dir: Directory to store backups (default: same directory)
-        backup_suffix: Suffix to add to backup files
+        config: OpenCC configuration name (default: Simplified to Taiwan with phrases)
+        engine: ``opencc`` or ``compiled``
     
     Returns:
-        Path to the backup file
+        Shared converter instance
     """
-    if backup_dir:
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        backup_path = backup_dir / (file_path.name + backup_suffix)
-    else:
-        backup_path = file_path.parent / (file_path.name + backup_suffix)
-    
-    # If backup already exists, add timestamp
-    if backup_path.exists():
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        stem = file_path.stem
-        suffix = file_path.suffix
-        backup_path = backup_path.parent / f"{stem}_{timestamp}{suffix}{backup_suffix}"
-    
-    shutil.copy2(file_path, backup_path)
-    return backup_path
+    converter = _converters.get((config, engine))
+    if converter is not None:
+        return converter
+    if not HAS_OPENCC:
+        raise ImportError("OpenCC is not installed. Install it with: pip install opencc-python-reimplemented")
+    if engine not in S2TW_ENGINES:
+        raise ValueError(f"Unknown s2tw engine: {engine}")
+    with _converters_lock:
+        converter = _converters.get((config, engine))
+        if converter is None:
+            if engine == "compiled":
+                from .s2tw_engine import CompiledConverter
+                
+                converter = CompiledConverter(config)
+            else:
+                converter = OpenCC(config)
+            _converters[(config, engine)] = converter
+        return converter
+
+
+def _engine_of(converter: "OpenCC") -> str:
+    return getattr(converter, "engine", "opencc")
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _convert_name_cached(name: str, config: str, engine: str) -> str:
+    return get_converter(config, engine).convert(name)
+
+
+class _Prefilter(NamedTuple):
+    """Characters that can take part in a change under one OpenCC config."""
+    pattern: re.Pattern
+    ascii_inert: bool  # no dictionary key is pure ASCII
+
+    def may_change(self, text: str) -> bool:
+        if self.ascii_inert and text.isascii():
+            return False
+        return self.pattern.search(text) is not None
+
+
+_prefilters: dict[str, _Prefilter | None] = {}
+
+
+def _dictionary_keys(config: str) -> Iterator[str]:
+    """Yield every key of every text dictionary in an OpenCC config chain."""
+    base = Path(opencc.__file__).parent
+    with open(base / "config" / f"{config}.json", encoding="utf-8") as f:
+        setting = json.load(f)
+    pending = [chain.get("dict", {}) for chain in setting.get("conversion_chain", [])]
+    while pending:
+        entry = pending.pop()
+        if entry.get("type") == "group":
+            pending.extend(entry.get("dicts", []))
+        elif entry.get("type") == "txt":
+            with open(base / "dictionary" / entry["file"], encoding="utf-8") as f:
+                for line in f:
+                    yield line.strip().split("\t")[0]
 
 
-def convert_text_s2tw(text: str, converter: "OpenCC | None" = None) -> str:
+def _build_prefilter(config: str) -> _Prefilter | None:
+    # Text that contains no character of any key can match nothing, at any
+    # stage of the chain, so the conversion leaves it unchanged.
+    chars: set[str] = set()
+    ascii_inert = True
+    try:
+        for key in _dictionary_keys(config):
+            if key.isascii():
+                ascii_inert = False
+                chars.update(key)
+            else:
+                chars.update(ch for ch in key if not ch.isascii())
+    except (OSError, ValueError, KeyError, TypeError):
+        # Not the dictionary layout we know (another OpenCC binding).
+        return None
+    if not chars:
+        return None
+    pattern = re.compile("[" + "".join(re.escape(ch) for ch in sorted(chars)) + "]")
+    return _Prefilter(pattern, ascii_inert)
+
+
+def _prefilter_for(converter: "OpenCC") -> _Prefilter | None:
+    config = getattr(converter, "conversion", None)
+    if not isinstance(config, str):
+        return None
+    if config not in _prefilters:
+        with _converters_lock:
+            if config not in _prefilters:
+                _prefilters[config] = _build_prefilter(config)
+    return _prefilters[config]
+
+
+def _bytes_may_change(data: bytes, prefilter: _Prefilter) -> bool:
+    if prefilter.ascii_inert and data.isascii():
+        return False
+    return prefilter.may_change(data.decode("utf-8"))
+
+
+def _file_may_change(file_path: Path, prefilter: _Prefilter) -> bool:
+    """Scan a (large) file through mmap without keeping it in memory."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, size, _STREAM_CHUNK):
+                block = mm[offset:offset + _STREAM_CHUNK]
+                if prefilter.ascii_inert and block.isascii():
+                    continue
+                if prefilter.may_change(decoder.decode(block)):
+                    return True
+    decoder.decode(b"", final=True)
+    return False
+
+
+def convert_text_s2tw(
+    text: str,
+    converter: "OpenCC | None" = None,
+    *,
+    engine: S2twEngine = "opencc",
+) -> str:
     """
     Convert Simplified Chinese text to Traditional Chinese (Taiwan).
     
     Args:
         text: Text to convert
         converter: Optional OpenCC converter instance
+        engine: Engine of the shared converter used when none is given
     
     Returns:
         Converted text
@@ -87,7 +270,7 @@ def convert_text_s2tw(text: str, converter: "OpenCC | None" = None) -> str:
         raise ImportError("OpenCC is not installed. Install it with: pip install opencc-python-reimplemented")
     
     if converter is None:
-        converter = OpenCC("s2twp")  # Simplified to Taiwan with phrases
+        converter = get_converter("s2twp", engine)  # Simplified to Taiwan with phrases
     
     return converter.convert(text)
 
@@ -98,15 +281,25 @@ def convert_file_content(
     *,
     create_backup_file: bool = True,
     backup_dir: Path | None = None,
+    streaming: bool | None = None,
+    backup: BackupStore | None = None,
 ) -> ConversionResult:
     """
     Convert the content of a file from Simplified to Traditional Chinese.
     
+    .docx, .xlsx and .pptx files have the text of their document, shared
+    strings and slides converted (see ``convert_office_content``). The file
+    is rewritten through a temporary sibling that replaces it
+    atomically, and only when the conversion changed something.
+    
     Args:
         file_path: Path to the file
         converter: Optional OpenCC converter instance
         create_backup_file: Whether to create a backup before modifying
         backup_dir: Directory for backups
+        streaming: Convert chunk by chunk in constant memory
+            (default: only for files of 32 MiB or more)
+        backup: Backup store to use instead of a copy in ``backup_dir``
     
     Returns:
         ConversionResult with details of the operation
@@ -122,35 +315,56 @@ def convert_file_content(
         )
     
     if converter is None:
-        converter = OpenCC("s2twp")
+        converter = get_converter("s2twp")
     
+    prefilter = _prefilter_for(converter)
     try:
-        # Read file content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        if file_path.suffix.lower() in OFFICE_EXTENSIONS:
+            from .s2tw_office import convert_office_content
+            
+            with span("convert"):
+                return convert_office_content(
+                    file_path,
+                    converter,
+                    create_backup_file=create_backup_file,
+                    backup_dir=backup_dir,
+                    backup=backup,
+                )
+        if streaming is None:
+            streaming = file_path.stat().st_size >= _STREAM_THRESHOLD
+        if streaming:
+            if prefilter is not None and not _file_may_change(file_path, prefilter):
+                return _unchanged_result(file_path)
+            with span("convert"):
+                return _convert_file_streaming(file_path, converter, create_backup_file, backup_dir, prefilter, backup)
         
-        # Convert content
-        converted_content = converter.convert(content)
+        with span("convert"):
+            # Read file content; files with nothing convertible stop here
+            with open(file_path, "rb") as f:
+                data = f.read()
+            if prefilter is not None and not _bytes_may_change(data, prefilter):
+                return _unchanged_result(file_path)
+            # Same newline handling as reading in text mode
+            content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            
+            # Convert content
+            converted_content = converter.convert(content)
         
         # Check if content changed
         if converted_content == content:
-            return ConversionResult(
-                path=file_path,
-                content_changed=False,
-                name_changed=False,
-                backup_path=None,
-                new_path=None,
-                error=None,
-            )
+            return _unchanged_result(file_path)
         
-        # Create backup if requested
-        backup_path = None
-        if create_backup_file:
-            backup_path = create_backup(file_path, backup_dir)
-        
-        # Write converted content
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(converted_content)
+        with span("write"):
+            # Create backup if requested
+            backup_path = None
+            if create_backup_file:
+                backup_path = backup.save(file_path) if backup is not None else create_backup(file_path, backup_dir)
+            
+            # Write converted content
+            with atomic_destination(file_path) as temp:
+                with open(temp, "w", encoding="utf-8") as f:
+                    f.write(converted_content)
+                shutil.copymode(file_path, temp)
         
         return ConversionResult(
             path=file_path,
@@ -172,6 +386,98 @@ def convert_file_content(
         )
 
 
+def _size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _unchanged_result(file_path: Path) -> ConversionResult:
+    return ConversionResult(
+        path=file_path,
+        content_changed=False,
+        name_changed=False,
+        backup_path=None,
+        new_path=None,
+        error=None,
+    )
+
+
+class _Unchanged(Exception):
+    """Raised inside ``atomic_destination`` to discard an identical rewrite."""
+
+
+def _iter_chunks(stream: IO[str], separator_re) -> Iterator[str]:
+    """
+    Read ``stream`` in chunks that end on a line or phrase boundary.
+    
+    OpenCC splits its input on separators (whitespace and punctuation) and
+    never matches a phrase across one, so converting the chunks one by one
+    gives exactly the same text as converting the whole file. A run of text
+    with no separator at all is kept together however long it gets.
+    """
+    carry = ""
+    while True:
+        block = stream.read(_STREAM_CHUNK)
+        if not block:
+            break
+        buffer = carry + block
+        cut = buffer.rfind("\n") + 1
+        if not cut:
+            match = None
+            for match in separator_re.finditer(buffer):
+                pass
+            cut = match.end() if match is not None else 0
+        if cut:
+            yield buffer[:cut]
+            carry = buffer[cut:]
+        else:
+            carry = buffer
+    if carry:
+        yield carry
+
+
+def _convert_file_streaming(
+    file_path: Path,
+    converter: "OpenCC",
+    create_backup_file: bool,
+    backup_dir: Path | None,
+    prefilter: _Prefilter | None = None,
+    backup: BackupStore | None = None,
+) -> ConversionResult:
+    separator_re = getattr(converter, "split_chars_re", None) or re.compile(r"\s+")
+    backup_path = None
+    try:
+        with atomic_destination(file_path) as temp:
+            changed = False
+            with open(file_path, "r", encoding="utf-8", newline="") as source, \
+                    open(temp, "w", encoding="utf-8", newline="") as target:
+                for chunk in _iter_chunks(source, separator_re):
+                    if prefilter is not None and not prefilter.may_change(chunk):
+                        target.write(chunk)
+                        continue
+                    converted = converter.convert(chunk)
+                    changed = changed or converted != chunk
+                    target.write(converted)
+            if not changed:
+                raise _Unchanged
+            shutil.copymode(file_path, temp)
+            if create_backup_file:
+                backup_path = backup.save(file_path) if backup is not None else create_backup(file_path, backup_dir)
+    except _Unchanged:
+        return _unchanged_result(file_path)
+    
+    return ConversionResult(
+        path=file_path,
+        content_changed=True,
+        name_changed=False,
+        backup_path=backup_path,
+        new_path=None,
+        error=None,
+    )
+
+
 def convert_name(
     name: str,
     converter: "OpenCC | None" = None,
@@ -179,6 +485,9 @@ def convert_name(
     """
     Convert a file or directory name from Simplified to Traditional Chinese.
     
+    Results are memoized when the shared converter is used (``converter``
+    omitted or obtained from ``get_converter``).
+    
     Args:
         name: Name to convert
         converter: Optional OpenCC converter instance
@@ -190,8 +499,12 @@ def convert_name(
         return name
     
     if converter is None:
-        converter = OpenCC("s2twp")
+        return _convert_name_cached(name, "s2twp", "opencc")
     
+    config = getattr(converter, "conversion", None)
+    engine = _engine_of(converter)
+    if config is not None and _converters.get((config, engine)) is converter:
+        return _convert_name_cached(name, config, engine)
     return converter.convert(name)
 
 
@@ -221,16 +534,7 @@ def iter_files_for_conversion(
             yield path
         return
     
-    for root, dirs, files in os.walk(path, topdown=False):
-        root_path = Path(root)
-        
-        # Filter directories
-        dirs[:] = [
-            d for d in dirs
-            if d not in ignore_set
-            and (include_hidden or not d.startswith("."))
-        ]
-        
+    for root_path, _dirs, files in _walk(path, ignore_set, include_hidden):
         for filename in files:
             if filename in ignore_set:
                 continue
@@ -242,6 +546,220 @@ def iter_files_for_conversion(
                 yield file_path
 
 
+# Files handed to a worker process per task in parallel mode.
+_PARALLEL_BATCH = 64
+
+_worker_converter: "OpenCC | None" = None
+
+
+def _init_worker(engine: S2twEngine = "opencc") -> None:
+    """Build the converter once per worker process."""
+    global _worker_converter
+    _worker_converter = get_converter("s2twp", engine)
+
+
+def _convert_batch(
+    paths: list[Path],
+    create_backup_file: bool,
+    backup_dir: Path | None,
+    backup: BackupStore | None = None,
+) -> list[ConversionResult]:
+    return [
+        convert_file_content(
+            path,
+            _worker_converter,
+            create_backup_file=create_backup_file,
+            backup_dir=backup_dir,
+            backup=backup,
+        )
+        for path in paths
+    ]
+
+
+def _map_batches(
+    executor: ProcessPoolExecutor,
+    work: Callable[..., list],
+    paths: Iterable[Path],
+    jobs: int,
+    *args,
+) -> Iterator[list]:
+    """
+    ``work(batch, *args)`` for successive batches of ``paths``, in order.
+    
+    At most ``2 * jobs`` batches are in flight, so ``paths`` is read only as
+    fast as the workers keep up and no result is held once consumed.
+    """
+    window: deque = deque()
+    batch: list[Path] = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) >= _PARALLEL_BATCH:
+            window.append(executor.submit(work, batch, *args))
+            batch = []
+            if len(window) >= 2 * jobs:
+                yield window.popleft().result()
+    if batch:
+        window.append(executor.submit(work, batch, *args))
+    while window:
+        yield window.popleft().result()
+
+
+def _convert_contents_parallel(
+    paths: Iterable[Path],
+    *,
+    jobs: int,
+    create_backup_files: bool,
+    backup_dir: Path | None,
+    engine: S2twEngine = "opencc",
+    backup: BackupStore | None = None,
+) -> Iterator[ConversionResult]:
+    """
+    Convert file contents on ``jobs`` worker processes, in batches.
+    
+    Results are yielded in the order of ``paths`` (see ``_map_batches``).
+    Workers cannot share a ``tar``/``zip`` archive, so in those modes they
+    snapshot into a staging store that is absorbed once the generator
+    finishes or is closed.
+    """
+    staged = backup.staging() if backup is not None and backup.archived else None
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(engine,))
+    try:
+        for results in _map_batches(
+            executor, _convert_batch, paths, jobs, create_backup_files, backup_dir, staged or backup
+        ):
+            for result in results:
+                if staged is not None and result.backup_path:
+                    result = result._replace(backup_path=backup.location)
+                yield result
+    finally:
+        # On interrupt, drop queued batches instead of finishing them.
+        executor.shutdown(wait=True, cancel_futures=True)
+        if staged is not None:
+            backup.absorb(staged)
+
+
+def _iter_walk_files(
+    input_path: Path,
+    extensions: set[str],
+    ignore_set: set[str],
+    include_hidden: bool,
+) -> Iterator[Path]:
+    """Files the bottom-up directory pass would convert, in the same order."""
+    for root_path, _dirs, files in _walk(input_path, ignore_set, include_hidden):
+        for filename in files:
+            if _skip_file(filename, extensions, ignore_set, include_hidden):
+                continue
+            yield root_path / filename
+
+
+def _walk(
+    top: Path,
+    ignore_set: set[str],
+    include_hidden: bool,
+) -> Iterator[tuple[Path, list[str], list[str]]]:
+    """
+    Bottom-up walk of the directories that s2tw converts and checks.
+    
+    Like ``os.walk(topdown=False)``, but ignored and (unless
+    ``include_hidden``) hidden directories are neither entered nor listed,
+    nor are backup snapshots of any run (they hold the originals). Each
+    directory comes after its contents, so it can be renamed once they
+    are done. Symlinked directories are listed but not entered.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    dirs: list[str] = []
+    files: list[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry.name)
+        elif entry.name not in ignore_set and (include_hidden or not entry.name.startswith(".")):
+            if is_snapshot_name(entry.name):
+                continue
+            dirs.append(entry.name)
+            if not entry.is_symlink():
+                yield from _walk(Path(entry.path), ignore_set, include_hidden)
+    yield Path(top), dirs, files
+
+
+def _skip_file(filename: str, extensions: set[str], ignore_set: set[str], include_hidden: bool) -> bool:
+    if filename in ignore_set:
+        return True
+    if not include_hidden and filename.startswith("."):
+        return True
+    # Check extension - 檢查檔案是否為文字檔案
+    return os.path.splitext(filename)[1].lower() not in extensions
+
+
+def iter_convert_s2tw_recursive(
+    path: Path,
+    *,
+    extensions: set[str] | None = None,
+    convert_content: bool = True,
+    convert_names: bool = True,
+    create_backup_files: bool = True,
+    backup_dir: Path | None = None,
+    ignore_names: Iterable[str] | None = None,
+    include_hidden: bool = False,
+    jobs: int = 1,
+    engine: S2twEngine = "opencc",
+    manifest: Path | None = None,
+    backup_mode: BackupMode = "copy",
+    office: bool = False,
+) -> ConversionRun:
+    """
+    Recursively convert files and directories, yielding results as they happen.
+    
+    Takes the same arguments as ``convert_s2tw_recursive``. Only changed or
+    failed entries are yielded, each as soon as its content and name are
+    done; unchanged files are not collected. Nothing is touched until
+    the first result is requested.
+    
+    Returns:
+        ConversionRun yielding ConversionResult, with ``stats`` at the end
+    """
+    if not HAS_OPENCC:
+        raise ImportError("OpenCC is not installed. Install it with: pip install opencc-python-reimplemented")
+    
+    counts = dict.fromkeys(ConversionStats._fields, 0)
+    
+    def run() -> Iterator[ConversionResult]:
+        backup = BackupStore(backup_mode, backup_dir, Path(path)) if create_backup_files else None
+        state = ConversionManifest(manifest, _manifest_signature("s2twp")) if manifest is not None else None
+        try:
+            yield from _convert_tree(
+                path,
+                extensions=extensions,
+                convert_content=convert_content,
+                convert_names=convert_names,
+                create_backup_files=create_backup_files,
+                backup_dir=backup_dir,
+                ignore_names=ignore_names,
+                include_hidden=include_hidden,
+                jobs=jobs,
+                engine=engine,
+                state=state,
+                backup=backup,
+                stats=counts,
+            )
+        finally:
+            if state is not None:
+                state.close()
+            if backup is not None:
+                backup.close()
+    
+    if office:
+        extensions = (extensions if extensions is not None else TEXT_EXTENSIONS) | OFFICE_EXTENSIONS
+    return ConversionRun(run(), counts)
+
+
 def convert_s2tw_recursive(
     path: Path,
     *,
@@ -252,11 +770,21 @@ def convert_s2tw_recursive(
     backup_dir: Path | None = None,
     ignore_names: Iterable[str] | None = None,
     include_hidden: bool = False,
+    jobs: int = 1,
+    engine: S2twEngine = "opencc",
+    manifest: Path | None = None,
+    backup_mode: BackupMode = "copy",
+    office: bool = False,
 ) -> tuple[list[ConversionResult], ConversionStats]:
     """
     Recursively convert files and directories from Simplified to Traditional Chinese.
     
-    Uses bottom-up traversal to safely rename directories.
+    Uses bottom-up traversal to safely rename directories. With ``jobs`` > 1,
+    file contents are converted first on that many worker processes (each
+    builds its converter once); renames then run bottom-up on this process.
+    With a ``manifest``, files recorded there as already converted and not
+    modified since are not opened again. ``iter_convert_s2tw_recursive``
+    yields the same results one at a time.
     
     Args:
         path: Input path (file or directory)
@@ -267,165 +795,249 @@ def convert_s2tw_recursive(
         backup_dir: Directory for backups (default: alongside originals)
         ignore_names: Names to ignore
         include_hidden: Include hidden files/directories
+        jobs: Number of worker processes for content conversion
+        engine: Conversion engine (``opencc`` or ``compiled``)
+        manifest: SQLite file recording converted files between runs
+        backup_mode: ``copy`` (flat copies), ``link``, ``reflink``, ``tar``
+            or ``zip`` (one snapshot of relative paths per run; see
+            ``BackupStore``)
+        office: Also convert the text inside .docx, .xlsx and .pptx files
     
     Returns:
         Tuple of (list of ConversionResult, ConversionStats)
     """
-    if not HAS_OPENCC:
-        raise ImportError("OpenCC is not installed. Install it with: pip install opencc-python-reimplemented")
-    
-    # 當 extensions 為 None 時，使用常見文字檔案擴展名
-    # 這樣可以處理大部分需要轉換的檔案類型
-    text_extensions = {
-        ".md", ".txt", ".json", ".yaml", ".yml", ".xml", ".html", ".htm",
-        ".css", ".js", ".ts", ".jsx", ".tsx", ".vue", ".py", ".java",
-        ".c", ".cpp", ".h", ".hpp", ".cs", ".go", ".rs", ".rb", ".php",
-        ".sh", ".bat", ".ps1", ".sql", ".csv", ".ini", ".cfg", ".conf",
-        ".toml", ".rst", ".tex", ".log", ".properties", ".env",
-    }
-    
+    run = iter_convert_s2tw_recursive(
+        path,
+        extensions=extensions,
+        convert_content=convert_content,
+        convert_names=convert_names,
+        create_backup_files=create_backup_files,
+        backup_dir=backup_dir,
+        ignore_names=ignore_names,
+        include_hidden=include_hidden,
+        jobs=jobs,
+        engine=engine,
+        manifest=manifest,
+        backup_mode=backup_mode,
+        office=office,
+    )
+    results = list(run)
+    return results, run.stats
+
+
+def _manifest_signature(config: str) -> str:
+    try:
+        version = importlib.metadata.version("opencc-python-reimplemented")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{config}:{version}"
+
+
+def _convert_tree(
+    path: Path,
+    *,
+    extensions: set[str] | None,
+    convert_content: bool,
+    convert_names: bool,
+    create_backup_files: bool,
+    backup_dir: Path | None,
+    ignore_names: Iterable[str] | None,
+    include_hidden: bool,
+    jobs: int,
+    engine: S2twEngine,
+    state: ConversionManifest | None,
+    backup: BackupStore | None,
+    stats: dict[str, int],
+) -> Iterator[ConversionResult]:
     # 如果未指定 extensions，使用所有文字檔案擴展名
-    effective_extensions = extensions if extensions is not None else text_extensions
+    effective_extensions = extensions if extensions is not None else TEXT_EXTENSIONS
     
-    converter = OpenCC("s2twp")
-    results: list[ConversionResult] = []
+    converter = get_converter("s2twp", engine)
     ignore_set = set(ignore_names or [])
     
-    stats = {
-        "files_content_modified": 0,
-        "files_renamed": 0,
-        "dirs_renamed": 0,
-        "files_backed_up": 0,
-        "errors": 0,
-    }
-    
     input_path = Path(path)
     
     if input_path.is_file():
         # Single file mode
         if input_path.suffix.lower() in effective_extensions:
-            if convert_content:
+            stats["files_scanned"] += 1
+            if convert_content and (state is None or state.needs_conversion(input_path)):
+                stats["bytes_read"] += _size(input_path)
                 result = convert_file_content(
                     input_path,
                     converter,
                     create_backup_file=create_backup_files,
                     backup_dir=backup_dir,
+                    backup=backup,
                 )
-                results.append(result)
+                if state is not None and not result.error:
+                    state.record(input_path)
                 if result.content_changed:
                     stats["files_content_modified"] += 1
+                    stats["bytes_written"] += _size(input_path)
+                elif not result.error:
+                    stats["files_unchanged"] += 1
                 if result.backup_path:
                     stats["files_backed_up"] += 1
                 if result.error:
                     stats["errors"] += 1
+                yield result
+            else:
+                stats["files_unchanged"] += 1
         
-        return results, ConversionStats(**stats)
+        return
     
-    # Directory mode - use bottom-up traversal
-    for root, dirs, files in os.walk(input_path, topdown=False):
-        root_path = Path(root)
-        
-        # Process files
-        for filename in files:
-            if filename in ignore_set:
-                continue
-            if not include_hidden and filename.startswith("."):
-                continue
-            
-            file_path = root_path / filename
-            
-            # Check extension - 檢查檔案是否為文字檔案
-            if file_path.suffix.lower() not in effective_extensions:
-                continue
-            
-            content_changed = False
-            name_changed = False
-            backup_path = None
-            new_path = None
-            error = None
-            
-            # Convert content
-            if convert_content:
-                result = convert_file_content(
-                    file_path,
-                    converter,
-                    create_backup_file=create_backup_files,
-                    backup_dir=backup_dir,
-                )
-                content_changed = result.content_changed
-                backup_path = result.backup_path
-                error = result.error
-                
-                if content_changed:
-                    stats["files_content_modified"] += 1
-                if backup_path:
-                    stats["files_backed_up"] += 1
-                if error:
-                    stats["errors"] += 1
-            
-            # Convert filename (after content, in case path changes)
-            current_path = file_path
-            if convert_names and not error:
-                new_name = convert_name(filename, converter)
-                if new_name != filename:
-                    new_file_path = root_path / new_name
-                    if not new_file_path.exists():
-                        try:
-                            os.rename(current_path, new_file_path)
-                            name_changed = True
-                            new_path = new_file_path
-                            stats["files_renamed"] += 1
-                        except Exception as e:
-                            error = str(e)
-                            stats["errors"] += 1
-            
-            if content_changed or name_changed or error:
-                results.append(ConversionResult(
-                    path=file_path,
-                    content_changed=content_changed,
-                    name_changed=name_changed,
-                    backup_path=backup_path,
-                    new_path=new_path,
-                    error=error,
-                ))
-        
-        # Process directories (rename)
-        if convert_names:
-            for dirname in dirs:
-                if dirname in ignore_set:
-                    continue
-                if not include_hidden and dirname.startswith("."):
+    # Parallel mode converts file contents on worker processes a bounded
+    # distance ahead of the walk below, which consumes the results in walk
+    # order and does the renames.
+    
+    # Files the manifest already knows as converted are never opened.
+    known: set[Path] = set()
+    
+    def stale(file_path: Path) -> bool:
+        if state is None or state.needs_conversion(file_path):
+            stats["bytes_read"] += _size(file_path)
+            return True
+        known.add(file_path)
+        return False
+    
+    converted: Iterator[ConversionResult] | None = None
+    received: dict[Path, ConversionResult] = {}
+    
+    def take(file_path: Path) -> ConversionResult | None:
+        """The worker result for ``file_path``; None if the workers never saw it."""
+        while file_path not in received and file_path not in known:
+            # Only the wait is timed: the workers' own spans are not collected.
+            with span("convert"):
+                result = next(converted, None)
+            if result is None:
+                break
+            received[result.path] = result
+        if file_path in known:
+            return _unchanged_result(file_path)
+        return received.pop(file_path, None)
+    
+    if convert_content and jobs > 1:
+        converted = _convert_contents_parallel(
+            filter(stale, _iter_walk_files(input_path, effective_extensions, ignore_set, include_hidden)),
+            jobs=jobs,
+            create_backup_files=create_backup_files,
+            backup_dir=backup_dir,
+            engine=engine,
+            backup=backup,
+        )
+    
+    try:
+        # Directory mode - use bottom-up traversal
+        for root_path, dirs, files in _walk(input_path, ignore_set, include_hidden):
+            # Process files
+            for filename in files:
+                if _skip_file(filename, effective_extensions, ignore_set, include_hidden):
                     continue
                 
-                new_dirname = convert_name(dirname, converter)
-                if new_dirname != dirname:
-                    old_dir_path = root_path / dirname
-                    new_dir_path = root_path / new_dirname
+                file_path = root_path / filename
+                stats["files_scanned"] += 1
+                
+                content_changed = False
+                name_changed = False
+                backup_path = None
+                new_path = None
+                error = None
+                
+                # Convert content
+                if convert_content:
+                    result = None
+                    if converted is not None:
+                        result = take(file_path)
+                    elif not stale(file_path):
+                        result = _unchanged_result(file_path)
+                    if result is None:
+                        result = convert_file_content(
+                            file_path,
+                            converter,
+                            create_backup_file=create_backup_files,
+                            backup_dir=backup_dir,
+                            backup=backup,
+                        )
+                    content_changed = result.content_changed
+                    backup_path = result.backup_path
+                    error = result.error
                     
-                    if not new_dir_path.exists():
-                        try:
-                            os.rename(old_dir_path, new_dir_path)
-                            stats["dirs_renamed"] += 1
-                            results.append(ConversionResult(
-                                path=old_dir_path,
-                                content_changed=False,
-                                name_changed=True,
-                                backup_path=None,
-                                new_path=new_dir_path,
-                                error=None,
-                            ))
-                        except Exception as e:
-                            stats["errors"] += 1
-                            results.append(ConversionResult(
-                                path=old_dir_path,
-                                content_changed=False,
-                                name_changed=False,
-                                backup_path=None,
-                                new_path=None,
-                                error=str(e),
-                            ))
-    
-    return results, ConversionStats(**stats)
+                    if content_changed:
+                        stats["files_content_modified"] += 1
+                        stats["bytes_written"] += _size(file_path)
+                    if backup_path:
+                        stats["files_backed_up"] += 1
+                    if error:
+                        stats["errors"] += 1
+                
+                # Convert filename (after content, in case path changes)
+                current_path = file_path
+                if convert_names and not error:
+                    new_name = convert_name(filename, converter)
+                    if new_name != filename:
+                        new_file_path = root_path / new_name
+                        if not new_file_path.exists():
+                            try:
+                                with span("apply"):
+                                    os.rename(current_path, new_file_path)
+                                name_changed = True
+                                new_path = new_file_path
+                                stats["files_renamed"] += 1
+                            except Exception as e:
+                                error = str(e)
+                                stats["errors"] += 1
+                
+                if state is not None and convert_content and not error and (file_path not in known or name_changed):
+                    state.record(new_path or file_path)
+                
+                if content_changed or name_changed or error:
+                    yield ConversionResult(
+                        path=file_path,
+                        content_changed=content_changed,
+                        name_changed=name_changed,
+                        backup_path=backup_path,
+                        new_path=new_path,
+                        error=error,
+                    )
+                else:
+                    stats["files_unchanged"] += 1
+            
+            # Process directories (rename)
+            if convert_names:
+                for dirname in dirs:
+                    new_dirname = convert_name(dirname, converter)
+                    if new_dirname != dirname:
+                        old_dir_path = root_path / dirname
+                        new_dir_path = root_path / new_dirname
+                        
+                        if not new_dir_path.exists():
+                            try:
+                                with span("apply"):
+                                    os.rename(old_dir_path, new_dir_path)
+                                stats["dirs_renamed"] += 1
+                                yield ConversionResult(
+                                    path=old_dir_path,
+                                    content_changed=False,
+                                    name_changed=True,
+                                    backup_path=None,
+                                    new_path=new_dir_path,
+                                    error=None,
+                                )
+                            except Exception as e:
+                                stats["errors"] += 1
+                                yield ConversionResult(
+                                    path=old_dir_path,
+                                    content_changed=False,
+                                    name_changed=False,
+                                    backup_path=None,
+                                    new_path=None,
+                                    error=str(e),
+                                )
+
+    finally:
+        if converted is not None:
+            converted.close()
 
 
 __all__ = [
@@ -435,6 +1047,11 @@ __all__ = [
     "convert_s2tw_recursive",
     "convert_text_s2tw",
     "ConversionResult",
+    "ConversionRun",
     "ConversionStats",
     "create_backup",
+    "get_converter",
+    "iter_convert_s2tw_recursive",
+    "S2TW_ENGINES",
+    "S2twEngine",
 ]
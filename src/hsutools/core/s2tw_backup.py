@@ -0,0 +1,215 @@
+"""Backups of the files s2tw rewrites."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import re
+import shutil
+import tarfile
+import threading
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Literal
+
+from ..utils import link_or_copy, reflink_or_copy
+
+BackupMode = Literal["copy", "link", "reflink", "tar", "zip"]
+BACKUP_MODES = ("copy", "link", "reflink", "tar", "zip")
+
+# Snapshot directories (and their staging directories) of any run.
+_SNAPSHOT_NAME = re.compile(r"\.?s2tw-\d{8}_\d{6}(?:_\d+)?(?:\.tar\.gz|\.zip)?(?:\.staging)?")
+
+
+def is_snapshot_name(name: str) -> bool:
+    """Whether ``name`` is the name of a ``BackupStore`` snapshot."""
+    return _SNAPSHOT_NAME.fullmatch(name) is not None
+
+
+def create_backup(
+    file_path: Path,
+    backup_dir: Path | None = None,
+    backup_suffix: str = ".backup",
+) -> Path:
+    """
+    Create a backup of a file.
+    
+    Args:
+        file_path: Path to the file to backup
+        backup_dir: Directory to store backups (default: same directory)
+        backup_suffix: Suffix to add to backup files
+    
+    Returns:
+        Path to the backup file
+    """
+    if backup_dir:
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_path = backup_dir / (file_path.name + backup_suffix)
+    else:
+        backup_path = file_path.parent / (file_path.name + backup_suffix)
+    
+    # If backup already exists, add timestamp (and a counter if that is
+    # taken too). Names are claimed with O_EXCL so parallel workers backing
+    # up same-named files never overwrite each other.
+    for candidate in _backup_candidates(backup_path, file_path, backup_suffix):
+        try:
+            with open(file_path, "rb") as source, open(candidate, "xb") as target:
+                shutil.copyfileobj(source, target)
+        except FileExistsError:
+            continue
+        shutil.copystat(file_path, candidate)
+        return candidate
+    raise AssertionError("unreachable")
+
+
+def _backup_candidates(backup_path: Path, file_path: Path, backup_suffix: str) -> Iterator[Path]:
+    yield backup_path
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stem = file_path.stem
+    suffix = file_path.suffix
+    yield backup_path.parent / f"{stem}_{timestamp}{suffix}{backup_suffix}"
+    for counter in itertools.count(1):
+        yield backup_path.parent / f"{stem}_{timestamp}_{counter}{suffix}{backup_suffix}"
+
+
+def _unused(path: Path) -> Path:
+    """``path``, or ``path`` with a counter before its suffixes if taken."""
+    if not path.exists():
+        return path
+    name = path.name
+    stem, dot, suffixes = name.partition(".")
+    for counter in itertools.count(1):
+        candidate = path.with_name(f"{stem}_{counter}{dot}{suffixes}")
+        if not candidate.exists():
+            return candidate
+    raise AssertionError("unreachable")
+
+
+class BackupStore:
+    """
+    Where s2tw keeps the originals of the files it rewrites.
+    
+    ``copy`` is the historical layout: one flat copy per file (via
+    ``create_backup``). The other modes keep paths relative to ``root`` in
+    one snapshot per run, named ``s2tw-<timestamp>``, in ``backup_dir`` or
+    else next to ``root`` (never inside it, where a later run would convert
+    the originals):
+    
+    - ``link``: hard links. Files are rewritten through a new inode, so the
+      snapshot keeps the original data without copying it.
+    - ``reflink``: copy-on-write clones where the filesystem supports them,
+      plain copies elsewhere.
+    - ``tar`` / ``zip``: a single compressed archive written as a stream.
+    """
+    
+    def __init__(
+        self,
+        mode: BackupMode,
+        backup_dir: Path | None,
+        root: Path,
+        *,
+        location: Path | None = None,
+    ) -> None:
+        if mode not in BACKUP_MODES:
+            raise ValueError(f"Unknown backup mode: {mode}")
+        self.mode = mode
+        self.root = root if root.is_dir() else root.parent
+        self.backup_dir = backup_dir
+        if location is None and mode != "copy":
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            extension = {"tar": ".tar.gz", "zip": ".zip"}.get(mode, "")
+            location = _unused((backup_dir or self.root.parent) / f"s2tw-{stamp}{extension}")
+        self.location = location
+        self._archive: tarfile.TarFile | zipfile.ZipFile | None = None
+        self._lock = threading.Lock()
+    
+    @property
+    def archived(self) -> bool:
+        return self.mode in ("tar", "zip")
+    
+    def _relative(self, file_path: Path) -> Path:
+        try:
+            return file_path.relative_to(self.root)
+        except ValueError:
+            return Path(file_path.name)
+    
+    def _open_archive(self) -> tarfile.TarFile | zipfile.ZipFile:
+        if self._archive is None:
+            self.location.parent.mkdir(parents=True, exist_ok=True)
+            if self.mode == "tar":
+                self._archive = tarfile.open(self.location, "x:gz")
+            else:
+                self._archive = zipfile.ZipFile(self.location, "x", compression=zipfile.ZIP_DEFLATED)
+        return self._archive
+    
+    def _add(self, source: Path, arcname: str) -> None:
+        with self._lock:
+            archive = self._open_archive()
+            if isinstance(archive, tarfile.TarFile):
+                archive.add(source, arcname=arcname, recursive=False)
+            else:
+                archive.write(source, arcname=arcname)
+    
+    def save(self, file_path: Path) -> Path:
+        """
+        Back up ``file_path`` before it is rewritten.
+        
+        Returns:
+            Path of the backup (the archive itself in ``tar``/``zip`` mode)
+        """
+        if self.mode == "copy":
+            return create_backup(file_path, self.backup_dir)
+        relative = self._relative(file_path)
+        if self.archived:
+            self._add(file_path, relative.as_posix())
+            return self.location
+        
+        destination = self.location / relative
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if self.mode == "link":
+            link_or_copy(file_path, destination)
+        else:
+            reflink_or_copy(file_path, destination)
+            shutil.copystat(file_path, destination)
+        return destination
+    
+    def staging(self) -> "BackupStore":
+        """
+        A hard-link store for worker processes in ``tar``/``zip`` mode.
+        
+        Workers cannot share the archive; they snapshot originals here and
+        ``absorb`` moves the snapshot into the archive afterwards.
+        """
+        staging_dir = self.location.with_name(f".{self.location.name}.staging")
+        return BackupStore("link", None, self.root, location=staging_dir)
+    
+    def absorb(self, staged: "BackupStore") -> None:
+        """Add every file of a ``staging`` store to the archive, then drop it."""
+        if not staged.location.exists():
+            return
+        for dirpath, _dirs, files in os.walk(staged.location):
+            for name in sorted(files):
+                source = Path(dirpath) / name
+                self._add(source, source.relative_to(staged.location).as_posix())
+        shutil.rmtree(staged.location)
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+    
+    def __getstate__(self) -> dict:
+        if self._archive is not None:
+            raise TypeError("an open archive store cannot be sent to another process")
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+__all__ = ["BACKUP_MODES", "BackupMode", "BackupStore", "create_backup", "is_snapshot_name"]
@@ -0,0 +1,173 @@
+"""Read-only check for text that s2tw would convert."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Literal, NamedTuple
+
+from .s2tw import (
+    _STREAM_THRESHOLD,
+    HAS_OPENCC,
+    TEXT_EXTENSIONS,
+    S2twEngine,
+    _bytes_may_change,
+    _file_may_change,
+    _map_batches,
+    _Prefilter,
+    _prefilter_for,
+    _skip_file,
+    _walk,
+    convert_name,
+    get_converter,
+)
+
+HitKind = Literal["content", "name", "error"]
+
+
+class S2twHit(NamedTuple):
+    """Something ``convert_s2tw_recursive`` would change (or could not read)."""
+    path: Path
+    kind: HitKind
+    line: int | None
+    column: int | None
+    original: str
+    converted: str
+
+
+_worker_converter = None
+
+
+def _init_worker(engine: S2twEngine) -> None:
+    global _worker_converter
+    _worker_converter = get_converter("s2twp", engine)
+
+
+def _changed_span(line: str, converted: str) -> tuple[int, str, str]:
+    """Index of the first difference and the differing parts of both lines."""
+    start = 0
+    limit = min(len(line), len(converted))
+    while start < limit and line[start] == converted[start]:
+        start += 1
+    end = 0
+    while end < limit - start and line[-1 - end] == converted[-1 - end]:
+        end += 1
+    return start, line[start:len(line) - end], converted[start:len(converted) - end]
+
+
+def _iter_lines(file_path: Path, size: int, prefilter: _Prefilter | None) -> Iterator[str]:
+    if size < _STREAM_THRESHOLD:
+        with open(file_path, "rb") as f:
+            data = f.read()
+        if prefilter is not None and not _bytes_may_change(data, prefilter):
+            return
+        yield from data.decode("utf-8").split("\n")
+        return
+    if prefilter is not None and not _file_may_change(file_path, prefilter):
+        return
+    with open(file_path, "r", encoding="utf-8", newline="\n") as f:
+        yield from f
+
+
+def _first_hit(file_path: Path, converter) -> S2twHit | None:
+    """
+    Find the first line of ``file_path`` that would change.
+
+    Lines end in a newline, which OpenCC treats as a separator, so
+    converting line by line is exact and the scan can stop at the first hit.
+    """
+    prefilter = _prefilter_for(converter)
+    try:
+        size = os.path.getsize(file_path)
+        for number, line in enumerate(_iter_lines(file_path, size, prefilter), 1):
+            if prefilter is not None and not prefilter.may_change(line):
+                continue
+            converted = converter.convert(line)
+            if converted != line:
+                column, original, replacement = _changed_span(line.rstrip("\r\n"), converted.rstrip("\r\n"))
+                return S2twHit(file_path, "content", number, column + 1, original, replacement)
+    except (OSError, UnicodeDecodeError) as e:
+        return S2twHit(file_path, "error", None, None, str(e), "")
+    return None
+
+
+def _check_batch(paths: list[Path]) -> list[S2twHit]:
+    return [hit for hit in (_first_hit(path, _worker_converter) for path in paths) if hit is not None]
+
+
+def check_s2tw(
+    path: Path,
+    *,
+    extensions: set[str] | None = None,
+    check_names: bool = True,
+    ignore_names: Iterable[str] | None = None,
+    include_hidden: bool = False,
+    jobs: int = 1,
+    engine: S2twEngine = "opencc",
+) -> list[S2twHit]:
+    """
+    Report what ``convert_s2tw_recursive`` would change, without writing.
+
+    Each file is scanned line by line up to its first convertible line;
+    files are spread over ``jobs`` worker processes. Files and directories
+    are visited by the same walk as the conversion, so the check reports
+    exactly what a run with the same options would change.
+
+    Args:
+        path: Input path (file or directory)
+        extensions: File extensions to check (None = all text files)
+        check_names: Also report file and directory names that would change
+        ignore_names: Names to ignore
+        include_hidden: Include hidden files/directories
+        jobs: Number of worker processes for content checks
+        engine: Conversion engine (``opencc`` or ``compiled``)
+
+    Returns:
+        Hits sorted by path; at most one content hit per file
+    """
+    if not HAS_OPENCC:
+        raise ImportError("OpenCC is not installed. Install it with: pip install opencc-python-reimplemented")
+
+    effective_extensions = extensions if extensions is not None else TEXT_EXTENSIONS
+    ignore_set = set(ignore_names or [])
+    converter = get_converter("s2twp", engine)
+    input_path = Path(path)
+    hits: list[S2twHit] = []
+
+    def name_hit(target: Path) -> None:
+        if check_names:
+            new_name = convert_name(target.name, converter)
+            if new_name != target.name:
+                hits.append(S2twHit(target, "name", None, None, target.name, new_name))
+
+    def files() -> Iterator[Path]:
+        if input_path.is_file():
+            # Like the conversion, a file given directly is never renamed.
+            if input_path.suffix.lower() in effective_extensions:
+                yield input_path
+            return
+        for root_path, dirs, filenames in _walk(input_path, ignore_set, include_hidden):
+            for filename in filenames:
+                if not _skip_file(filename, effective_extensions, ignore_set, include_hidden):
+                    name_hit(root_path / filename)
+                    yield root_path / filename
+            for dirname in dirs:
+                name_hit(root_path / dirname)
+
+    candidates = files()
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(engine,)) as executor:
+            for batch_hits in _map_batches(executor, _check_batch, candidates, jobs):
+                hits.extend(batch_hits)
+    else:
+        for file_path in candidates:
+            hit = _first_hit(file_path, converter)
+            if hit is not None:
+                hits.append(hit)
+
+    hits.sort(key=lambda hit: (str(hit.path), hit.kind != "name"))
+    return hits
+
+
+__all__ = ["check_s2tw", "S2twHit"]
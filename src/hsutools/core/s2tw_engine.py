@@ -0,0 +1,361 @@
+"""Compiled dictionary engine for OpenCC conversions.
+
+The text dictionaries shipped with ``opencc-python-reimplemented`` are
+compiled once into a flat file of tries that is memory-mapped on load, so
+building a converter costs a few milliseconds instead of a full parse.
+Conversion follows the segmentation rules of ``OpenCC.convert`` exactly:
+the input is split on the same separators, and within each dictionary the
+longest key (leftmost on ties) is replaced first, with the text on either
+side matched again on its own. Keys are found with one trie walk per
+position instead of probing every substring length.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List
+
+from ..utils import atomic_destination
+
+_MAGIC = b"HSUCC\x00\x00\x01"
+_FORMAT_VERSION = 1
+_LENGTH = array("I", [0])
+
+# Sentence separators used by opencc-python-reimplemented (from OpenCC's
+# PhraseExtract.cpp); text is split on these before any matching.
+_SPLIT_CHARS_RE = re.compile(
+    r"(\s+|-|,|\.|\?|!|\*|　|，|。|、|；|：|？|！|…|“|”|‘|’|『|』|「|」|﹁|﹂|—|－|（|）|《|》|〈|〉|～|．|／|＼|︒|︑|︔|︓"
+    r"|︿|﹀|︹|︺|︙|︐|［|﹇|］|﹈|︕|︖|︰|︳|︴|︽|︾|︵|︶|｛|︷|｝|︸|﹃|﹄|【|︻|】|︼)"
+)
+
+
+def default_cache_dir() -> Path:
+    """Directory for compiled dictionaries (``$HSU_CACHE_DIR`` overrides it)."""
+    override = os.environ.get("HSU_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "hsutools"
+
+
+def compiled_path(config: str = "s2twp") -> Path:
+    """Where the compiled dictionary for ``config`` is cached."""
+    return default_cache_dir() / f"opencc-{config}.hsucc"
+
+
+def _opencc_root() -> Path:
+    import opencc
+
+    return Path(opencc.__file__).parent
+
+
+def _chain_files(config: str) -> List[List[Path]]:
+    """Dictionary files of each stage of the conversion chain, in order."""
+    root = _opencc_root()
+    with open(root / "config" / f"{config}.json", encoding="utf-8") as f:
+        setting = json.load(f)
+
+    def files(entry: dict) -> List[Path]:
+        if entry.get("type") == "group":
+            return [path for item in entry.get("dicts", []) for path in files(item)]
+        if entry.get("type") == "txt":
+            return [root / "dictionary" / entry["file"]]
+        raise ValueError(f"Unsupported dictionary type: {entry.get('type')!r}")
+
+    return [files(chain.get("dict", {})) for chain in setting.get("conversion_chain", [])]
+
+
+def _fingerprint(stages: List[List[Path]]) -> list:
+    stamps = []
+    for stage in stages:
+        for path in stage:
+            st = path.stat()
+            stamps.append([path.name, st.st_size, st.st_mtime_ns])
+    return [_FORMAT_VERSION, sys.byteorder, stamps]
+
+
+def _read_dictionary(path: Path) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            key, value = line.strip().split("\t")
+            # Multiple mappings: OpenCC uses the first one.
+            mapping[key] = value.split(" ")[0]
+    return mapping
+
+
+def _build_trie(mapping: Dict[str, str]) -> tuple[array, array, array, bytes]:
+    """Flatten ``mapping`` into breadth-first trie arrays.
+
+    Children of node ``i`` are nodes ``child_start[i]:child_start[i + 1]``,
+    sorted by ``edge_char``; the value of node ``i`` is
+    ``blob[value_off[i]:value_off[i + 1]]`` (empty when no key ends there).
+    """
+    children: List[Dict[str, int]] = [{}]
+    values: List[str] = [""]
+    for key, value in mapping.items():
+        node = 0
+        for ch in key:
+            child = children[node].get(ch)
+            if child is None:
+                child = len(children)
+                children[node][ch] = child
+                children.append({})
+                values.append("")
+            node = child
+        values[node] = value
+
+    order = [0]
+    edge_char = array("I", [0])
+    child_start = array("I")
+    index = 0
+    while index < len(order):
+        child_start.append(len(order))
+        for ch, child in sorted(children[order[index]].items()):
+            order.append(child)
+            edge_char.append(ord(ch))
+        index += 1
+    child_start.append(len(order))
+
+    value_off = array("I", [0])
+    blob = bytearray()
+    for node in order:
+        blob += values[node].encode("utf-8")
+        value_off.append(len(blob))
+    return child_start, edge_char, value_off, bytes(blob)
+
+
+def compile_dictionary(config: str = "s2twp", path: Path | None = None) -> Path:
+    """Compile the dictionaries of an OpenCC config into ``path``.
+
+    Args:
+        config: OpenCC configuration name
+        path: Output file (default: ``compiled_path(config)``)
+
+    Returns:
+        Path to the compiled file
+    """
+    path = path or compiled_path(config)
+    stages = _chain_files(config)
+    tables = [[_build_trie(_read_dictionary(file)) for file in stage] for stage in stages]
+
+    # Header: magic, JSON length, JSON padded to 4 bytes; then every array
+    # at a 4-byte aligned offset (relative to the end of the header)
+    # recorded in the JSON.
+    layout = []
+    chunks: List[bytes] = []
+    offset = 0
+    for stage in tables:
+        stage_layout = []
+        for child_start, edge_char, value_off, blob in stage:
+            entry = {"nodes": len(edge_char)}
+            for name, data in (
+                ("child_start", child_start.tobytes()),
+                ("edge_char", edge_char.tobytes()),
+                ("value_off", value_off.tobytes()),
+                ("blob", blob),
+            ):
+                entry[name] = offset
+                chunks.append(data)
+                offset += len(data)
+                padding = -offset % 4
+                chunks.append(b"\0" * padding)
+                offset += padding
+            stage_layout.append(entry)
+        layout.append(stage_layout)
+
+    header = json.dumps(
+        {"config": config, "fingerprint": _fingerprint(stages), "stages": layout},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    prefix = len(_MAGIC) + _LENGTH.itemsize + len(header)
+    prefix += -prefix % 4
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_destination(path) as temp:
+        with open(temp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(array("I", [len(header)]).tobytes())
+            f.write(header.ljust(prefix - len(_MAGIC) - _LENGTH.itemsize, b" "))
+            for chunk in chunks:
+                f.write(chunk)
+    return path
+
+
+class _Trie:
+    """One dictionary, read straight from the mapped file."""
+
+    __slots__ = (
+        "_child_start", "_edge_char", "_value_off", "_blob", "_root", "_starts", "_children", "_values",
+        "_table", "single",
+    )
+
+    def __init__(self, view: memoryview, meta: dict) -> None:
+        nodes = meta["nodes"]
+        self._child_start = view[meta["child_start"] : meta["child_start"] + 4 * (nodes + 1)].cast("I")
+        self._edge_char = view[meta["edge_char"] : meta["edge_char"] + 4 * nodes].cast("I")
+        self._value_off = view[meta["value_off"] : meta["value_off"] + 4 * (nodes + 1)].cast("I")
+        blob_start = meta["blob"]
+        self._blob = view[blob_start : blob_start + self._value_off[nodes]]
+        self._root: Dict[str, tuple[int, bool]] | None = None
+        self._starts: re.Pattern | None = None
+        # Child tables of the nodes visited so far, as dicts of
+        # char -> (node, ends a key); the mapped arrays are only read the
+        # first time a node is reached.
+        self._children: Dict[int, Dict[str, tuple[int, bool]]] = {}
+        self._values: Dict[int, str] = {}
+        # Dictionaries of single characters only convert with str.translate.
+        self.single = self._child_start[1] == nodes
+        self._table: Dict[int, str] | None = None
+
+    def _load_children(self, node: int) -> Dict[str, tuple[int, bool]]:
+        edge_char = self._edge_char
+        value_off = self._value_off
+        first, last = self._child_start[node], self._child_start[node + 1]
+        children = {chr(edge_char[k]): (k, value_off[k] != value_off[k + 1]) for k in range(first, last)}
+        self._children[node] = children
+        return children
+
+    def matches(self, text: str) -> list[tuple[int, int, int]]:
+        """Every key occurrence as ``(-length, start, node)``."""
+        if self._starts is None:
+            self._root = self._load_children(0)
+            self._starts = re.compile("[" + "".join(re.escape(ch) for ch in sorted(self._root)) + "]")
+        found = []
+        root = self._root
+        children_of = self._children
+        size = len(text)
+        # Only positions holding a first character of some key can start one.
+        for match in self._starts.finditer(text):
+            start = match.start()
+            node, terminal = root[match.group()]
+            end = start + 1
+            while True:
+                if terminal:
+                    found.append((start - end, start, node))
+                if end == size:
+                    break
+                children = children_of.get(node)
+                if children is None:
+                    children = self._load_children(node)
+                step = children.get(text[end])
+                if step is None:
+                    break
+                node, terminal = step
+                end += 1
+        return found
+
+    def translate(self, text: str) -> str:
+        if self._table is None:
+            self._table = {ord(ch): self.value(node) for ch, (node, _) in self._load_children(0).items()}
+        return text.translate(self._table)
+
+    def value(self, node: int) -> str:
+        value = self._values.get(node)
+        if value is None:
+            value = bytes(self._blob[self._value_off[node] : self._value_off[node + 1]]).decode("utf-8")
+            self._values[node] = value
+        return value
+
+
+def _segment(text: str, group: List[_Trie], index: int) -> str:
+    """Apply dictionary ``group[index]`` to ``text``; gaps go to the next one.
+
+    Taking matches longest-first (leftmost on ties) and skipping any that
+    overlap one already taken selects the same matches as OpenCC's
+    recursive split on the longest match.
+    """
+    if index == len(group) or not text:
+        return text
+    trie = group[index]
+    if trie.single and index == len(group) - 1:
+        return trie.translate(text)
+    found = trie.matches(text)
+    if not found:
+        return _segment(text, group, index + 1)
+
+    found.sort()
+    taken = bytearray(len(text))
+    chosen = []
+    for negative_length, start, node in found:
+        end = start - negative_length
+        if taken.find(1, start, end) != -1:
+            continue
+        taken[start:end] = b"\x01" * (end - start)
+        chosen.append((start, end, node))
+    chosen.sort()
+
+    parts = []
+    position = 0
+    for start, end, node in chosen:
+        if start > position:
+            parts.append(_segment(text[position:start], group, index + 1))
+        parts.append(trie.value(node))
+        position = end
+    if position < len(text):
+        parts.append(_segment(text[position:], group, index + 1))
+    return "".join(parts)
+
+
+class CompiledConverter:
+    """Drop-in replacement for ``OpenCC(config)`` backed by a compiled file.
+
+    The file is compiled on first use (and again whenever the installed
+    dictionaries change) and memory-mapped afterwards.
+    """
+
+    engine = "compiled"
+
+    def __init__(self, conversion: str = "s2twp", path: Path | None = None) -> None:
+        self.conversion = conversion
+        self.split_chars_re = _SPLIT_CHARS_RE
+        self.path = path or compiled_path(conversion)
+        expected = _fingerprint(_chain_files(conversion))
+        loaded = self._load(expected)
+        if loaded is None:
+            compile_dictionary(conversion, self.path)
+            loaded = self._load(expected)
+            if loaded is None:
+                raise ValueError(f"Could not load compiled dictionary {self.path}")
+        self._mmap, self._stages = loaded
+
+    def _load(self, expected: list):
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        view = memoryview(mapped)
+        if bytes(view[: len(_MAGIC)]) != _MAGIC:
+            return None
+        header_start = len(_MAGIC) + _LENGTH.itemsize
+        (header_len,) = view[len(_MAGIC) : header_start].cast("I")
+        try:
+            header = json.loads(bytes(view[header_start : header_start + header_len]))
+        except ValueError:
+            return None
+        if header.get("config") != self.conversion or header.get("fingerprint") != expected:
+            return None
+        prefix = header_start + header_len
+        prefix += -prefix % 4
+        body = view[prefix:]
+        stages = [[_Trie(body, meta) for meta in stage] for stage in header["stages"]]
+        return mapped, stages
+
+    def convert(self, string: str) -> str:
+        """Convert ``string`` exactly like ``OpenCC(self.conversion).convert``."""
+        pieces = self.split_chars_re.split(string)
+        for i in range(0, len(pieces), 2):
+            piece = pieces[i]
+            for group in self._stages:
+                piece = _segment(piece, group, 0)
+            pieces[i] = piece
+        return "".join(pieces)
+
+
+__all__ = ["CompiledConverter", "compile_dictionary", "compiled_path", "default_cache_dir"]
@@ -0,0 +1,108 @@
+"""Manifest of files already in converted (Traditional) form."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Rows written per transaction.
+_BATCH = 512
+_HASH_CHUNK = 1 << 20
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class ConversionManifest:
+    """
+    SQLite record of (path, size, mtime, content hash) for converted files.
+
+    A file whose size and mtime still match its row is not opened at all; if
+    only the stat changed (a checkout, a ``touch``), the content hash decides.
+    The manifest is tied to a conversion signature (config and dictionary
+    version) and starts over when that changes.
+    """
+
+    def __init__(self, path: Path, signature: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest BLOB NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        if row is None or row[0] != signature:
+            with self._db:
+                self._db.execute("DELETE FROM files")
+                self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)", (signature,))
+        # One query up front beats one per file on large trees.
+        self._known: Dict[str, Tuple[int, int, bytes]] = {
+            path: (size, mtime_ns, digest)
+            for path, size, mtime_ns, digest in self._db.execute("SELECT path, size, mtime_ns, digest FROM files")
+        }
+        self._pending: List[Tuple[str, int, int, bytes]] = []
+
+    def needs_conversion(self, file_path: Path) -> bool:
+        """Whether ``file_path`` changed since it was last recorded."""
+        key = os.path.abspath(file_path)
+        known = self._known.get(key)
+        if known is None:
+            return True
+        st = os.stat(file_path)
+        if (st.st_size, st.st_mtime_ns) == known[:2]:
+            return False
+        digest = _file_digest(file_path)
+        if digest != known[2]:
+            return True
+        # Same content, new stat: remember the stat so the next run skips it.
+        self._queue(key, st, digest)
+        return False
+
+    def record(self, file_path: Path) -> None:
+        """Record ``file_path`` as converted, as it is on disk now."""
+        st = os.stat(file_path)
+        self._queue(os.path.abspath(file_path), st, _file_digest(file_path))
+
+    def _queue(self, key: str, st: os.stat_result, digest: bytes) -> None:
+        self._known[key] = (st.st_size, st.st_mtime_ns, digest)
+        self._pending.append((key, st.st_size, st.st_mtime_ns, digest))
+        if len(self._pending) >= _BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+    def __enter__(self) -> "ConversionManifest":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = ["ConversionManifest"]
@@ -0,0 +1,197 @@
+"""s2tw conversion of the text inside Office Open XML documents."""
+
+from __future__ import annotations
+
+import re
+import shutil
+import zipfile
+from pathlib import Path
+from typing import IO, Callable
+from xml.parsers import expat
+from xml.sax.saxutils import escape
+
+from ..config import OFFICE_EXTENSIONS
+from ..utils import atomic_destination
+from .s2tw import ConversionResult, _prefilter_for, _Unchanged, _unchanged_result, create_backup
+from .s2tw_backup import BackupStore
+
+# Members whose text nodes are converted; every other member is copied.
+_TEXT_MEMBERS = re.compile(r"word/document\.xml|xl/sharedStrings\.xml|ppt/slides/slide\d+\.xml")
+
+# Text elements (w:t, t, a:t) as "namespace localname", transitional and strict.
+_TEXT_TAGS = {
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main t",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main t",
+    "http://schemas.openxmlformats.org/spreadsheetml/2006/main t",
+    "http://purl.oclc.org/ooxml/spreadsheetml/main t",
+    "http://schemas.openxmlformats.org/drawingml/2006/main t",
+    "http://purl.oclc.org/ooxml/drawingml/main t",
+}
+_DECLARED_ENCODING = re.compile(rb"""^\s*<\?xml[^>]*encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+_CHUNK = 1 << 16
+
+
+def _is_utf8(head: bytes) -> bool:
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return False
+    match = _DECLARED_ENCODING.match(head.removeprefix(b"\xef\xbb\xbf"))
+    return match is None or match.group(1).lower() in (b"utf-8", b"utf8")
+
+
+def _rewrite_text_nodes(source: IO[bytes], target: IO[bytes], convert: Callable[[str], str]) -> bool:
+    """
+    Copy an XML stream, replacing the content of converted text elements.
+
+    The document is fed to expat in chunks; bytes are written out as soon as
+    they are known not to belong to an open text element, and everything
+    outside changed text nodes is copied as is. Returns whether anything
+    changed.
+    """
+    parser = expat.ParserCreate(namespace_separator=" ")
+    pending = bytearray()  # bytes from offset ``base`` that are not written yet
+    base = 0
+    replacements: list[tuple[int, int, bytes]] = []
+    node: dict | None = None  # the text element being read, if any
+    safe = 0  # everything before this offset can be written
+    changed = False
+
+    def start(name: str, _attrs: dict) -> None:
+        nonlocal node, safe
+        if node is not None:
+            node["skip"] = True
+            return
+        safe = parser.CurrentByteIndex
+        if name in _TEXT_TAGS:
+            node = {"name": name, "start": -1, "parts": [], "skip": False}
+
+    def characters(data: str) -> None:
+        if node is not None:
+            if node["start"] < 0:
+                node["start"] = parser.CurrentByteIndex
+            node["parts"].append(data)
+
+    def unsupported(*_args) -> None:
+        # Markup inside a text element (CDATA, comments): leave the node as is.
+        if node is not None:
+            node["skip"] = True
+
+    def end(name: str) -> None:
+        nonlocal node, safe, changed
+        index = parser.CurrentByteIndex
+        if node is not None and name == node["name"]:
+            if not node["skip"] and node["start"] >= 0:
+                text = "".join(node["parts"])
+                converted = convert(text)
+                if converted != text:
+                    replacements.append((node["start"], index, escape(converted).encode("utf-8")))
+                    changed = True
+            node = None
+        if node is None:
+            safe = index
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    parser.StartCdataSectionHandler = unsupported
+    parser.CommentHandler = unsupported
+    parser.ProcessingInstructionHandler = unsupported
+
+    def flush(upto: int) -> None:
+        nonlocal base
+        position = base
+        for start_at, end_at, replacement in replacements:
+            target.write(pending[position - base : start_at - base])
+            target.write(replacement)
+            position = end_at
+        replacements.clear()
+        if upto > position:
+            target.write(pending[position - base : upto - base])
+            position = upto
+        del pending[: position - base]
+        base = position
+
+    while chunk := source.read(_CHUNK):
+        pending += chunk
+        parser.Parse(chunk, False)
+        flush(safe)
+    parser.Parse(b"", True)
+    flush(base + len(pending))
+    return changed
+
+
+def _copy_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    copy = zipfile.ZipInfo(info.filename, info.date_time)
+    copy.compress_type = info.compress_type
+    copy.comment = info.comment
+    copy.external_attr = info.external_attr
+    copy.create_system = info.create_system
+    return copy
+
+
+def convert_office_content(
+    file_path: Path,
+    converter,
+    *,
+    create_backup_file: bool = True,
+    backup_dir: Path | None = None,
+    backup: BackupStore | None = None,
+) -> ConversionResult:
+    """
+    Convert the text of a .docx, .xlsx or .pptx file in place.
+
+    Members are streamed from the original zip into a temporary sibling:
+    the text nodes of ``word/document.xml``, ``xl/sharedStrings.xml`` and
+    the slides are converted, every other member is copied unchanged. The
+    original is replaced only if some text changed. Each text node is
+    converted on its own, so a phrase that Word split across two runs is
+    converted character by character.
+
+    Args:
+        file_path: Path to the document
+        converter: OpenCC converter instance
+        create_backup_file: Whether to create a backup before modifying
+        backup_dir: Directory for backups
+        backup: Backup store to use instead of a copy in ``backup_dir``
+
+    Returns:
+        ConversionResult with details of the operation
+    """
+    prefilter = _prefilter_for(converter)
+
+    def convert(text: str) -> str:
+        if prefilter is not None and not prefilter.may_change(text):
+            return text
+        return converter.convert(text)
+
+    backup_path = None
+    try:
+        with atomic_destination(file_path) as temp:
+            changed = False
+            with zipfile.ZipFile(file_path) as source, zipfile.ZipFile(temp, "w") as target:
+                target.comment = source.comment
+                for info in source.infolist():
+                    large = info.file_size >= zipfile.ZIP64_LIMIT // 2
+                    with source.open(info) as member, target.open(_copy_info(info), "w", force_zip64=large) as out:
+                        if _TEXT_MEMBERS.fullmatch(info.filename) and _is_utf8(member.peek(256)[:256]):
+                            changed = _rewrite_text_nodes(member, out, convert) or changed
+                        else:
+                            shutil.copyfileobj(member, out, _CHUNK)
+            if not changed:
+                raise _Unchanged
+            shutil.copymode(file_path, temp)
+            if create_backup_file:
+                backup_path = backup.save(file_path) if backup is not None else create_backup(file_path, backup_dir)
+    except _Unchanged:
+        return _unchanged_result(file_path)
+
+    return ConversionResult(
+        path=file_path,
+        content_changed=True,
+        name_changed=False,
+        backup_path=backup_path,
+        new_path=None,
+        error=None,
+    )
+
+
+__all__ = ["convert_office_content", "OFFICE_EXTENSIONS"]
@@ -61,6 +61,30 @@ TEXTS: Dict[str, Dict[str, str]] = {
         "en": "Show completion for the current shell, to copy it or customize the installation.",
         "zh": "顯示當前 shell 的自動補全腳本，供複製或自訂安裝。",
     },
+    "option.remote": {
+        "en": "Run the command on the `hsu serve` daemon (socket: HSU_SOCKET).",
+        "zh": "在 `hsu serve` 常駐程序上執行指令（socket：HSU_SOCKET）。",
+    },
+    "option.profile": {
+        "en": "Print the time spent in each phase (scan, plan, apply, ...) to stderr when the command ends.",
+        "zh": "指令結束時將各階段（scan、plan、apply…）耗時輸出至 stderr。",
+    },
+    "option.metrics_file": {
+        "en": "Write node-exporter textfile metrics (items, bytes, phase times) of this run to this file.",
+        "zh": "將本次執行的 node-exporter textfile 指標（項目數、位元組、各階段耗時）寫入此檔案。",
+    },
+    "option.profile_dump": {
+        "en": "Also write a cProfile/pstats dump to this file (implies --profile).",
+        "zh": "同時將 cProfile/pstats 資料寫入此檔案（隱含 --profile）。",
+    },
+    "remote.unavailable": {
+        "en": "No hsu server is listening on {path}; start one with `hsu serve`.",
+        "zh": "{path} 上沒有 hsu 伺服器；請先執行 `hsu serve`。",
+    },
+    "remote.untrusted": {
+        "en": "The hsu server on {path} is run by another user; not sending the command.",
+        "zh": "{path} 上的 hsu 伺服器由其他使用者執行，不傳送指令。",
+    },
     # cpath
     "cpath.help": {
         "en": "Generate a markdown tree listing for the given directory.",
@@ -208,6 +232,87 @@ TEXTS: Dict[str, Dict[str, str]] = {
     "resize.recursive": {"en": "Process subdirectories recursively.", "zh": "遞迴處理子目錄。"},
     "resize.include_hidden": {"en": "Include hidden files.", "zh": "包含隱藏檔。"},
     "resize.ignore": {"en": "Names to ignore (applied to files and directories).", "zh": "要忽略的名稱（檔案與資料夾）。"},
+    "resize.jobs": {"en": "Number of images to resize in parallel.", "zh": "同時處理的圖片數量。"},
+    "resize.max_pixels": {
+        "en": "Limit on decoded source pixels held by all workers at once. JPEGs are decoded at reduced scale to fit; other images over the limit fail.",
+        "zh": "所有工作同時持有的已解碼來源像素總量上限。JPEG 會以縮小比例解碼以符合上限；超過上限的其他圖片會失敗。",
+    },
+    "resize.passthrough": {
+        "en": "How to output images already within bounds: copy | link | none (re-encode).",
+        "zh": "已符合尺寸的圖片如何輸出：copy | link | none（重新編碼）。",
+    },
+    "resize.dry_run": {
+        "en": "Only read image headers and report what would be done.",
+        "zh": "只讀取圖片標頭並列出將執行的動作。",
+    },
+    "resize.invalid_passthrough": {
+        "en": "passthrough must be one of: copy, link, none",
+        "zh": "passthrough 必須是 copy、link 或 none",
+    },
+    "resize.plan_summary": {
+        "en": "Plan: {resize} to resize, {copy} to pass through, {skip} to skip.",
+        "zh": "計畫：調整 {resize} 張、直接複製 {copy} 張、略過 {skip} 張。",
+    },
+    "resize.encoder_profile": {
+        "en": "Encoder speed/size profile: fast | balanced | smallest.",
+        "zh": "編碼速度／大小設定檔：fast | balanced | smallest。",
+    },
+    "resize.checkpoint": {
+        "en": "File recording finished sources; rerunning with it resumes an interrupted job.",
+        "zh": "記錄已完成來源的檔案；再次執行時可從中斷處繼續。",
+    },
+    "resize.watch": {
+        "en": "Keep running and resize images as they arrive in --input (Ctrl+C to stop).",
+        "zh": "持續執行，於 --input 出現新圖片時自動調整（Ctrl+C 停止）。",
+    },
+    "resize.settle": {
+        "en": "Seconds a file's size must stay unchanged before it is processed in --watch mode.",
+        "zh": "--watch 模式下，檔案大小需維持不變多少秒才處理。",
+    },
+    "resize.watching": {
+        "en": "Watching {path} for new images (Ctrl+C to stop)...",
+        "zh": "監看 {path} 中的新圖片（Ctrl+C 停止）…",
+    },
+    "resize.watch_stopped": {
+        "en": "Stopped watching. Resized {count} image(s).",
+        "zh": "已停止監看，共調整 {count} 張圖片。",
+    },
+    "resize.report": {
+        "en": "Record per-image phase timings to this file (.json or .csv).",
+        "zh": "將每張圖片各階段耗時寫入此檔（.json 或 .csv）。",
+    },
+    "resize.report_summary": {
+        "en": "{images} image(s), {ips} images/s, {mbps} MB/s input. Report: {path}",
+        "zh": "{images} 張圖片，每秒 {ips} 張，輸入 {mbps} MB/s。報告：{path}",
+    },
+    "resize.output_archive": {
+        "en": "Stream resized images into one archive (.zip, .tar, .tar.gz) instead of --output.",
+        "zh": "將調整後的圖片直接串流寫入單一封存檔（.zip、.tar、.tar.gz），取代 --output。",
+    },
+    "resize.bad_archive": {
+        "en": "output archive must end with .zip, .tar, .tar.gz or .tgz",
+        "zh": "封存檔副檔名必須是 .zip、.tar、.tar.gz 或 .tgz",
+    },
+    "resize.archive_conflict": {
+        "en": "--output-archive cannot be combined with --checkpoint, --watch or --dry-run",
+        "zh": "--output-archive 不能與 --checkpoint、--watch 或 --dry-run 同時使用",
+    },
+    "resize.watch_conflict": {
+        "en": "--watch cannot be combined with --report, --checkpoint, --dedup or --metrics-file",
+        "zh": "--watch 不能與 --report、--checkpoint、--dedup 或 --metrics-file 同時使用",
+    },
+    "resize.dedup": {
+        "en": "Resize byte-identical sources once and fill the other outputs by link | reflink.",
+        "zh": "內容完全相同的來源只處理一次，其餘輸出以 link | reflink 產生。",
+    },
+    "resize.invalid_dedup": {
+        "en": "dedup must be one of: link, reflink",
+        "zh": "dedup 必須是 link 或 reflink",
+    },
+    "resize.invalid_profile": {
+        "en": "encoder profile must be one of: {choices}",
+        "zh": "編碼設定檔必須是：{choices}",
+    },
     "resize.bad_quality": {"en": "quality must be between 1 and 100", "zh": "quality 必須介於 1 到 100"},
     "resize.need_size": {
         "en": "Provide at least one of width, height, max-width, max-height, or scale",
@@ -215,6 +320,13 @@ TEXTS: Dict[str, Dict[str, str]] = {
     },
     "resize.none": {"en": "No images were resized (check filters or overwrite settings).", "zh": "沒有圖片被處理（請檢查篩選或覆寫設定）。"},
     "resize.success": {"en": "Resized {count} image(s). Output: {output}", "zh": "已調整 {count} 張圖片。輸出目錄：{output}"},
+    # resize-bench
+    "resizebench.help": {
+        "en": "Compare encoder profiles on a sample of your images (encode time and output size).",
+        "zh": "以你的圖片樣本比較各編碼設定檔（編碼時間與輸出大小）。",
+    },
+    "resizebench.sample": {"en": "Number of images to sample.", "zh": "取樣圖片數量。"},
+    "resizebench.none": {"en": "No images found to benchmark.", "zh": "找不到可測試的圖片。"},
     # build-exe
     "buildexe.help": {
         "en": "Build a single-file executable via PyInstaller (optional).",
@@ -257,6 +369,62 @@ TEXTS: Dict[str, Dict[str, str]] = {
         "en": "Include hidden files.",
         "zh": "包含隱藏檔。",
     },
+    "s2tw.jobs": {
+        "en": "Number of worker processes for content conversion.",
+        "zh": "轉換內容時使用的工作行程數。",
+    },
+    "s2tw.engine": {
+        "en": "Conversion engine: opencc, or compiled (same output from a memory-mapped dictionary, faster).",
+        "zh": "轉換引擎：opencc，或 compiled（輸出相同，使用記憶體映射字典，速度較快）。",
+    },
+    "s2tw.manifest": {
+        "en": "SQLite manifest of converted files; reruns skip files unchanged since.",
+        "zh": "記錄已轉換檔案的 SQLite 清單；再次執行時略過未變更的檔案。",
+    },
+    "s2tw.check": {
+        "en": "Only report files and names that would change; write nothing and exit 1 if any would.",
+        "zh": "只回報會變更的檔案與名稱，不寫入任何內容；若有變更則以代碼 1 結束。",
+    },
+    "s2tw.json": {
+        "en": "With --check, print the findings as JSON.",
+        "zh": "搭配 --check 時以 JSON 輸出結果。",
+    },
+    "s2tw.check_clean": {
+        "en": "Nothing to convert.",
+        "zh": "沒有需要轉換的內容。",
+    },
+    "s2tw.check_summary": {
+        "en": "{count} file(s) or name(s) would change.",
+        "zh": "有 {count} 個檔案或名稱會被變更。",
+    },
+    "s2tw.check_error": {
+        "en": "error: {error}",
+        "zh": "錯誤：{error}",
+    },
+    "s2tw.backup_mode": {
+        "en": "Backup strategy: copy (one file per original), link (hard-link snapshot), reflink (CoW clones), tar or zip (one compressed archive); the last four keep relative paths.",
+        "zh": "備份方式：copy（每個檔案各複製一份）、link（硬連結快照）、reflink（寫入時複製）、tar 或 zip（單一壓縮檔）；後四者保留相對路徑。",
+    },
+    "s2tw.invalid_backup_mode": {
+        "en": "backup mode must be one of: copy, link, reflink, tar, zip",
+        "zh": "備份方式必須是 copy、link、reflink、tar 或 zip",
+    },
+    "s2tw.check_conflict": {
+        "en": "--check cannot be combined with --office, --manifest or --metrics-file",
+        "zh": "--check 不能與 --office、--manifest 或 --metrics-file 同時使用",
+    },
+    "s2tw.json_needs_check": {
+        "en": "--json only applies to --check",
+        "zh": "--json 只能搭配 --check 使用",
+    },
+    "s2tw.office": {
+        "en": "Also convert the text inside .docx, .xlsx and .pptx files.",
+        "zh": "一併轉換 .docx、.xlsx 與 .pptx 檔案中的文字。",
+    },
+    "s2tw.invalid_engine": {
+        "en": "engine must be one of: opencc, compiled",
+        "zh": "engine 必須是 opencc 或 compiled",
+    },
     "s2tw.no_opencc": {
         "en": "OpenCC is not installed. Please install it with:",
         "zh": "未安裝 OpenCC。請使用以下指令安裝：",
@@ -309,4 +477,29 @@ TEXTS: Dict[str, Dict[str, str]] = {
         "en": "Conversion complete!",
         "zh": "轉換完成！",
     },
+    # serve
+    "serve.help": {
+        "en": "Keep a warm process serving `hsu --remote` calls on a Unix socket.",
+        "zh": "常駐一個已預熱的程序，透過 Unix socket 處理 `hsu --remote` 呼叫。",
+    },
+    "serve.socket": {
+        "en": "Socket path (default: HSU_SOCKET, else the runtime directory).",
+        "zh": "Socket 路徑（預設：HSU_SOCKET，否則為執行期目錄）。",
+    },
+    "serve.listening": {
+        "en": "Listening on {path}",
+        "zh": "正在監聽 {path}",
+    },
+    "serve.in_use": {
+        "en": "Another hsu server is already listening on {path}",
+        "zh": "{path} 上已有其他 hsu 伺服器在監聽",
+    },
+    "serve.unsupported": {
+        "en": "`hsu serve` and `hsu --remote` are not supported on this platform (they need fork and Unix sockets).",
+        "zh": "此平台不支援 `hsu serve` 與 `hsu --remote`（需要 fork 與 Unix socket）。",
+    },
+    "serve.unsafe_dir": {
+        "en": "{path} must be a directory owned by you with mode 0700; refusing to serve.",
+        "zh": "{path} 必須是你擁有且權限為 0700 的目錄；拒絕啟動伺服器。",
+    },
 }
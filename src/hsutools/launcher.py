@@ -0,0 +1,46 @@
+"""Entry point of ``hsu``.
+
+Shell completion and ``--remote`` calls are served here without importing
+the app; everything else runs the full CLI.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from .completion import SHELLS, respond
+
+
+def main() -> None:
+    if getattr(sys, "frozen", False):
+        # Worker processes of a frozen build re-enter here; freeze_support
+        # runs them and exits. Skipped otherwise to keep startup lean.
+        from multiprocessing import freeze_support
+
+        freeze_support()
+    prog_name = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "hsu"
+    complete_var = f"_{prog_name}_COMPLETE".replace("-", "_").upper()
+    command, _, shell = os.environ.get(complete_var, "").partition("_")
+    if command == "complete" and shell in SHELLS:
+        from .completion_table import TABLE
+
+        output, status = respond(TABLE, shell, dict(os.environ))
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        sys.exit(status)
+
+    if "--remote" in sys.argv:
+        from .server import forward, split_remote
+
+        remote, argv = split_remote(sys.argv[1:])
+        if remote:
+            sys.exit(forward(argv))
+
+    from .cli import app
+
+    app()
+
+
+__all__ = ["main"]
@@ -0,0 +1,102 @@
+"""Prometheus textfile metrics behind ``--metrics-file``.
+
+A scheduled ``hsu`` job writes one snapshot of its last run in the text
+exposition format, for node-exporter's textfile collector to pick up. The
+file is replaced atomically (through a hidden ``.tmp`` sibling, which the
+collector ignores), so a scrape never sees a half-written file. Every
+sample carries a ``command`` label; give each job its own ``.prom`` file.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import List, NamedTuple
+
+from .profiling import PhaseTiming
+from .utils import atomic_destination
+
+
+class JobMetrics(NamedTuple):
+    """Counters of one command run."""
+    command: str
+    scanned: int
+    processed: int
+    skipped: int
+    errored: int
+    bytes_read: int
+    bytes_written: int
+    phases: List[PhaseTiming]
+    duration: float
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def render(metrics: JobMetrics, *, timestamp: float | None = None) -> str:
+    """The metrics in the Prometheus text exposition format."""
+    command = metrics.command
+    families = [
+        (
+            "hsutools_items",
+            "Items handled by the last run, by state.",
+            [
+                (_labels(command=command, state=state), count)
+                for state, count in (
+                    ("scanned", metrics.scanned),
+                    ("processed", metrics.processed),
+                    ("skipped", metrics.skipped),
+                    ("errored", metrics.errored),
+                )
+            ],
+        ),
+        (
+            "hsutools_bytes",
+            "Bytes read and written by the last run.",
+            [
+                (_labels(command=command, direction="read"), metrics.bytes_read),
+                (_labels(command=command, direction="written"), metrics.bytes_written),
+            ],
+        ),
+        (
+            "hsutools_phase_seconds",
+            "Time spent in each phase of the last run.",
+            [(_labels(command=command, phase=row.phase), row.seconds) for row in metrics.phases],
+        ),
+        (
+            "hsutools_duration_seconds",
+            "Wall time of the last run.",
+            [(_labels(command=command), metrics.duration)],
+        ),
+        (
+            "hsutools_items_per_second",
+            "Processed items per second of wall time in the last run.",
+            [(_labels(command=command), metrics.processed / metrics.duration if metrics.duration else 0.0)],
+        ),
+        (
+            "hsutools_last_success_timestamp_seconds",
+            "Unix time at which the last successful run finished.",
+            [(_labels(command=command), time.time() if timestamp is None else timestamp)],
+        ),
+    ]
+    lines: List[str] = []
+    for name, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path, metrics: JobMetrics) -> Path:
+    """Atomically replace ``path`` with the rendered metrics."""
+    with atomic_destination(path) as temp:
+        temp.write_text(render(metrics), encoding="utf-8")
+    return path
+
+
+__all__ = ["JobMetrics", "render", "write_textfile"]
@@ -0,0 +1,107 @@
+"""Phase timers behind ``hsu --profile``.
+
+Core functions wrap their phases (scan, plan, preview, apply, convert,
+encode, write) in ``span``. Until ``start`` is called, ``span`` returns one
+shared do-nothing context manager, so the timers cost a global lookup
+when profiling is off. Spans may nest and may run on several threads;
+work done in worker processes is not timed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, List, NamedTuple, Optional
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_totals: Optional[Dict[str, List[float]]] = None  # phase -> [calls, seconds]
+_started = 0.0
+_profiler = None
+_dump: Optional[Path] = None
+
+
+class PhaseTiming(NamedTuple):
+    """Total time spent in one phase."""
+    phase: str
+    calls: int
+    seconds: float
+
+
+class _Span:
+    __slots__ = ("phase", "_start")
+
+    def __init__(self, phase: str) -> None:
+        self.phase = phase
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        record(self.phase, time.perf_counter() - self._start)
+
+
+def enabled() -> bool:
+    return _totals is not None
+
+
+def span(phase: str) -> ContextManager:
+    """Time the ``with`` block as ``phase`` (a no-op unless profiling)."""
+    if _totals is None:
+        return _NULL
+    return _Span(phase)
+
+
+def record(phase: str, seconds: float, calls: int = 1) -> None:
+    """Add time measured elsewhere to ``phase``."""
+    if _totals is None:
+        return
+    with _lock:
+        entry = _totals.setdefault(phase, [0, 0.0])
+        entry[0] += calls
+        entry[1] += seconds
+
+
+def start(dump: Optional[Path] = None) -> None:
+    """Start collecting spans; with ``dump``, also run cProfile on this thread."""
+    global _totals, _started, _profiler, _dump
+    _totals = {}
+    _dump = dump
+    if dump is not None:
+        import cProfile
+
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    _started = time.perf_counter()
+
+
+def snapshot() -> tuple[List[PhaseTiming], float]:
+    """
+    Phase totals so far, without stopping.
+
+    Returns:
+        Tuple of (phases in order of first use, wall seconds since ``start``)
+    """
+    elapsed = time.perf_counter() - _started
+    with _lock:
+        timings = [PhaseTiming(phase, int(calls), seconds) for phase, (calls, seconds) in (_totals or {}).items()]
+    return timings, elapsed
+
+
+def stop() -> tuple[List[PhaseTiming], float]:
+    """Stop profiling and write the pstats dump, if one was requested; returns ``snapshot()``."""
+    global _totals, _profiler
+    result = snapshot()
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(str(_dump))
+        _profiler = None
+    with _lock:
+        _totals = None
+    return result
+
+
+__all__ = ["enabled", "PhaseTiming", "record", "snapshot", "span", "start", "stop"]
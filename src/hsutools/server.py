@@ -0,0 +1,280 @@
+"""Warm ``hsu serve`` daemon and the ``hsu --remote`` client.
+
+The server imports every command, loads the OpenCC dictionaries and
+initializes Pillow once, then listens on a Unix domain socket. Each
+connection is one CLI invocation run in a forked child of that warm
+process, so jobs share the loaded state copy-on-write but cannot leak
+working directory, environment or language into each other.
+
+By default the socket lives in a directory only the user can enter, and
+the client talks only to a server run by the same user (checked with
+``SO_PEERCRED`` where the platform has it, else by the socket's owner).
+Only the variables a command reads (locale, terminal, ``HOME``, ``PATH``,
+``HSU_LANG``) are forwarded, never the rest of the client's environment.
+
+The protocol is one JSON object per line. The client sends
+``{"argv": [...], "cwd": ..., "env": {...}}``; the server answers with
+``{"stdout": text}`` and ``{"stderr": text}`` as the command writes,
+``{"input": true}`` when a prompt reads a line (the client replies with
+``{"stdin": line}``, ``null`` at end of input) and finally
+``{"exit": code}``.
+"""
+
+from __future__ import annotations
+
+import errno
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, List, Optional
+
+from .i18n import ENV_LANG, set_lang, tr
+
+ENV_SOCKET = "HSU_SOCKET"
+
+# The server forks a child per call on a Unix socket; Windows has neither.
+HAS_SERVER = hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+# Client variables a job runs with; the server keeps its own for the rest.
+_FORWARDED_ENV = {ENV_LANG, "HOME", "PATH", "LANG", "LANGUAGE", "TERM", "COLUMNS", "LINES", "NO_COLOR", "TMPDIR"}
+
+
+def _forwarded(name: str) -> bool:
+    return name in _FORWARDED_ENV or name.startswith("LC_")
+
+
+def default_socket_path() -> Path:
+    """``$HSU_SOCKET``, else ``hsutools.sock`` in the runtime dir or a private temp dir."""
+    override = os.getenv(ENV_SOCKET)
+    if override:
+        return Path(override).expanduser()
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "hsutools.sock"
+    return _fallback_dir() / "hsu.sock"
+
+
+def _fallback_dir() -> Path:
+    # In the shared temp dir, where anyone could have created it first.
+    return Path(tempfile.gettempdir()) / f"hsutools-{os.getuid()}"
+
+
+def _private_dir(directory: Path) -> None:
+    """Create ``directory`` as mode 0700, or make sure an existing one is ours and private."""
+    try:
+        directory.mkdir(mode=0o700, parents=True)
+        return
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(errno.EACCES, "not a private directory", str(directory))
+
+
+def _peer_is_us(conn: socket.socket, path: Path) -> bool:
+    """Whether the process at the other end of ``conn`` runs as this user."""
+    if hasattr(socket, "SO_PEERCRED"):
+        _pid, uid, _gid = struct.unpack("3i", conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+        return uid == os.getuid()
+    try:
+        return os.stat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _send(stream: IO[bytes], message: dict) -> None:
+    stream.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as a frame."""
+
+    def __init__(self, stream: IO[bytes], name: str) -> None:
+        self._stream = stream
+        self._name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str | bytes) -> int:
+        # Click writes bytes when it thinks the stream is binary.
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", "replace")
+        if text:
+            _send(self._stream, {self._name: text})
+        return len(text)
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _RemoteStdin(io.TextIOBase):
+    """Text stream that asks the client for each line a prompt reads."""
+
+    def __init__(self, reader: IO[bytes], writer: IO[bytes]) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:  # type: ignore[override]
+        _send(self._writer, {"input": True})
+        line = self._reader.readline()
+        if not line:
+            return ""
+        return json.loads(line).get("stdin") or ""
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        if not _peer_is_us(self.request, Path(self.server.server_address)):  # type: ignore[arg-type]
+            return
+        request = json.loads(line)
+        os.chdir(request["cwd"])
+        for name in [name for name in os.environ if _forwarded(name)]:
+            del os.environ[name]
+        os.environ.update({name: value for name, value in request["env"].items() if _forwarded(name)})
+        set_lang(os.getenv(ENV_LANG))
+        sys.stdout = _FrameWriter(self.wfile, "stdout")
+        sys.stderr = _FrameWriter(self.wfile, "stderr")
+        sys.stdin = _RemoteStdin(self.rfile, self.wfile)
+        code = self.server.run(request["argv"])  # type: ignore[attr-defined]
+        _send(self.wfile, {"exit": code})
+
+
+if HAS_SERVER:
+    class _Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+        def __init__(self, path: Path, run: Callable[[List[str]], int]) -> None:
+            self.run = run
+            super().__init__(str(path), _Handler)
+
+
+def _warm() -> None:
+    """Load what a cold ``hsu`` call would load on every run."""
+    from PIL import Image
+
+    from . import core
+
+    for name in core.__all__:
+        getattr(core, name)
+    Image.init()
+    if core.check_opencc_available():
+        core.get_converter("s2twp")
+
+
+def _in_use(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(path: Path, run: Callable[[List[str]], int], *, ready: Optional[Callable[[], None]] = None) -> None:
+    """
+    Serve CLI invocations on the Unix socket ``path`` until interrupted.
+
+    ``run`` executes one argument list and returns its exit code. The socket
+    is only accessible to the current user and is removed on exit, including
+    on SIGTERM. A missing socket directory is created private (0700), and
+    the fallback one in the temp dir must be private and ours.
+
+    Raises:
+        NotImplementedError: The platform has no ``fork`` or Unix sockets
+        FileExistsError: Another server is already listening on ``path``
+        PermissionError: The fallback socket directory belongs to someone
+            else or is accessible to other users
+    """
+    if not HAS_SERVER:
+        raise NotImplementedError("hsu serve needs fork() and Unix sockets")
+    if not path.parent.exists() or path.parent == _fallback_dir():
+        _private_dir(path.parent)
+    if path.exists():
+        if _in_use(path):
+            raise FileExistsError(path)
+        path.unlink()
+    _warm()
+    previous = os.umask(0o177)
+    try:
+        server = _Server(path, run)
+    finally:
+        os.umask(previous)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        if ready is not None:
+            ready()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+def forward(argv: List[str], path: Optional[Path] = None) -> int:
+    """Run ``argv`` on the ``hsu serve`` daemon, relaying its output and prompts.
+
+    Returns the remote exit code, or 1 if no server is listening, the
+    server runs as another user or the platform has no Unix sockets.
+    """
+    if not HAS_SERVER:
+        sys.stderr.write(tr("serve.unsupported") + "\n")
+        return 1
+    target = path or default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(str(target))
+        except OSError:
+            sys.stderr.write(tr("remote.unavailable", path=target) + "\n")
+            return 1
+        if not _peer_is_us(conn, target):
+            sys.stderr.write(tr("remote.untrusted", path=target) + "\n")
+            return 1
+        reader = conn.makefile("rb")
+        writer = conn.makefile("wb")
+        env = {name: value for name, value in os.environ.items() if _forwarded(name)}
+        _send(writer, {"argv": argv, "cwd": os.getcwd(), "env": env})
+        for line in reader:
+            message = json.loads(line)
+            if "stdout" in message:
+                sys.stdout.write(message["stdout"])
+                sys.stdout.flush()
+            elif "stderr" in message:
+                sys.stderr.write(message["stderr"])
+                sys.stderr.flush()
+            elif "input" in message:
+                answer = sys.stdin.readline()
+                _send(writer, {"stdin": answer or None})
+            elif "exit" in message:
+                return int(message["exit"])
+    return 1
+
+
+def split_remote(argv: List[str]) -> tuple[bool, List[str]]:
+    """Whether ``--remote`` is among the leading global options, and ``argv`` without it."""
+    for index, token in enumerate(argv):
+        if token == "--remote":
+            return True, argv[:index] + argv[index + 1:]
+        if not token.startswith("-") and (index == 0 or argv[index - 1] not in ("--lang", "-l")):
+            break
+    return False, argv
+
+
+__all__ = ["default_socket_path", "forward", "serve", "split_remote", "ENV_SOCKET", "HAS_SERVER"]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import importlib.util
+import os
+import secrets
+import shutil
 import subprocess
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -53,6 +57,79 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def copy_file_fast(source: Path, destination: Path) -> Path:
+    """Copy file bytes without pulling them through Python buffers.
+
+    Uses ``os.copy_file_range`` (which may reflink on CoW filesystems) and
+    falls back to ``shutil.copyfile``, which itself uses ``sendfile`` where
+    the platform has it.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return destination
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+    return destination
+
+
+# ioctl(2) request for FICLONE (share extents with another file), Linux only.
+_FICLONE = 0x40049409
+
+
+def reflink_or_copy(source: Path, destination: Path) -> Path:
+    """Clone ``source`` into ``destination`` on CoW filesystems, else copy.
+
+    Tries the ``FICLONE`` ioctl (btrfs, XFS, bcachefs...) and falls back to
+    ``copy_file_fast``.
+    """
+    try:
+        import fcntl
+
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return destination
+    except (ImportError, OSError):
+        return copy_file_fast(source, destination)
+
+
+@contextmanager
+def atomic_destination(destination: Path) -> Iterator[Path]:
+    """Yield a temporary sibling of ``destination`` that replaces it on success.
+
+    The temp file is created empty (with the usual umask-derived mode) next
+    to the destination, so ``os.replace`` stays on one filesystem. If the
+    block raises, the temp file is removed and ``destination`` is untouched.
+    """
+    temp = destination.with_name(f".{destination.name}.{os.getpid()}-{secrets.token_hex(4)}.tmp")
+    os.close(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        yield temp
+        os.replace(temp, destination)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def link_or_copy(source: Path, destination: Path) -> Path:
+    """Hard-link ``source`` to ``destination``, copying if linking fails."""
+    with atomic_destination(destination) as temp:
+        temp.unlink()
+        try:
+            os.link(source, temp)
+        except OSError:
+            copy_file_fast(source, temp)
+    return destination
+
+
 def build_executable(extra_args: list[str] | None = None) -> int:
     """Invoke PyInstaller to build a single-file executable for the CLI."""
     if importlib.util.find_spec("PyInstaller") is None:
@@ -72,9 +149,13 @@ def build_executable(extra_args: list[str] | None = None) -> int:
 
 __all__ = [
     "__version__",
+    "atomic_destination",
     "build_executable",
+    "copy_file_fast",
     "ensure_directory",
     "iter_files",
+    "link_or_copy",
+    "reflink_or_copy",
     "resolve_directory",
     "resolve_path",
 ]
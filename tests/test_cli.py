@@ -1,13 +1,35 @@
+import io
+import json
+import os
+import pstats
+import socket
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import zipfile
 from pathlib import Path
 
+from typer._completion_classes import BashComplete
+from typer.main import get_command
 from typer.testing import CliRunner
 
 from PIL import Image
 
+from hsutools import cli, profiling, server
 from hsutools.cli import app
+from hsutools.completion import build_table, complete
+from hsutools.completion_table import TABLE
+from hsutools.server import forward
 
 runner = CliRunner()
 
+# Self time, in microseconds, that importing hsutools itself may take at startup.
+# Wall-clock timings are noisy on shared runners, so the budget is only
+# enforced when HSU_CHECK_IMPORT_TIME is set (e.g. on a quiet benchmark host).
+IMPORT_BUDGET_US = 100_000
+
 
 def test_cpath_creates_markdown(tmp_path: Path) -> None:
     nested = tmp_path / "nested"
@@ -70,6 +92,205 @@ def test_help_env_lang_zh(monkeypatch) -> None:
     assert "介面語言" in result.stdout
 
 
+def test_help_is_localized_once_per_language(tmp_path: Path) -> None:
+    cli._localized_help.cache_clear()
+    result = runner.invoke(app, ["cpath", "--path", str(tmp_path)])
+    assert result.exit_code == 0
+    assert cli._localized_help.cache_info().currsize == 0
+
+    for _ in range(2):
+        result = runner.invoke(app, ["--lang", "zh", "s2tw", "--help"])
+        assert result.exit_code == 0
+        assert "檔案或目錄路徑" in result.stdout
+    result = runner.invoke(app, ["--lang", "en", "--help"])
+    assert result.exit_code == 0
+    info = cli._localized_help.cache_info()
+    assert (info.misses, info.hits) == (2, 1)
+
+
+def test_startup_imports_no_heavy_dependencies() -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from hsutools.cli import app; app(['--version'])"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0 and result.stdout.startswith("hsutools ")
+    own = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules.add(name.split(".")[0])
+        if name.startswith("hsutools"):
+            own += int(self_us)
+    assert not modules & {"PIL", "opencc", "docx2pdf"}
+    if os.environ.get("HSU_CHECK_IMPORT_TIME"):
+        assert own < IMPORT_BUDGET_US
+
+
+def test_completion_table_matches_app() -> None:
+    assert TABLE == build_table()
+
+    command = get_command(app)
+    cases = [
+        ([], ""),
+        ([], "re"),
+        ([], "--"),
+        (["--lang", "en"], "s"),
+        (["s2tw"], "--b"),
+        (["s2tw", "--no-backup"], "--no"),
+        (["s2tw", "--engine"], ""),
+        (["cpath", "--path", "x"], "-"),
+        (["cpath"], "--path=a"),
+        (["rename", "--"], "-"),
+    ]
+    for args, incomplete in cases:
+        expected = BashComplete(command, {}, "hsu", "_HSU_COMPLETE").get_completions(list(args), incomplete)
+        # Click echoes path values back; the table leaves those to the shell.
+        expected = [(item.value, item.help) for item in expected if item.type == "plain"]
+        assert complete(TABLE, list(args), incomplete) == expected
+
+
+def test_completion_fast_path_skips_the_app() -> None:
+    env = {**os.environ, "_HSU_COMPLETE": "complete_bash", "COMP_WORDS": "hsu s2tw --eng", "COMP_CWORD": "2"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; sys.argv[0] = 'hsu'; from hsutools.launcher import main; main()",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "--engine"
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+    assert not imported & {"typer", "click", "hsutools.cli", "hsutools.core"}
+
+
+def test_serve_runs_remote_commands(tmp_path: Path, monkeypatch, capsys) -> None:
+    socket_path = tmp_path / "hsu.sock"
+    (tmp_path / "work").mkdir()
+    (tmp_path / "work" / "hello_test.txt").write_text("data", encoding="utf-8")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "hsutools.cli", "serve", "--socket", str(socket_path)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert server.stdout.readline().startswith("Listening on")
+        monkeypatch.chdir(tmp_path)
+
+        assert forward(["cpath", "--path", "work"], socket_path) == 0
+        assert (tmp_path / "work" / "path.md").exists()
+        assert "Created" in capsys.readouterr().out
+
+        monkeypatch.setattr(sys, "stdin", io.StringIO("test\ndone\ny\n"))
+        assert forward(["rename", "--path", "work"], socket_path) == 0
+        assert (tmp_path / "work" / "hello_done.txt").exists()
+
+        assert forward(["s2tw", "--engine", "bogus"], socket_path) == 2
+        assert "engine" in capsys.readouterr().err
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    assert not socket_path.exists()
+    assert forward(["cpath"], socket_path) == 1
+
+
+def test_remote_forwards_only_needed_environment(tmp_path: Path, monkeypatch) -> None:
+    socket_path = tmp_path / "hsu.sock"
+    requests = []
+
+    def fake_server(listener: socket.socket) -> None:
+        conn, _ = listener.accept()
+        with conn:
+            requests.append(json.loads(conn.makefile("rb").readline()))
+            conn.sendall(b'{"exit": 0}\n')
+
+    monkeypatch.setenv("HSU_TEST_TOKEN", "secret")
+    monkeypatch.setenv("HSU_LANG", "zh")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen(1)
+        thread = threading.Thread(target=fake_server, args=(listener,))
+        thread.start()
+        assert forward(["cpath"], socket_path) == 0
+        thread.join(timeout=10)
+
+    (request,) = requests
+    assert request["env"]["HSU_LANG"] == "zh"
+    assert "HSU_TEST_TOKEN" not in request["env"]
+
+
+def test_serve_and_remote_report_unsupported_platforms(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(server, "HAS_SERVER", False)
+
+    result = runner.invoke(app, ["serve"])
+    assert result.exit_code == 1
+    assert "not supported on this platform" in result.output
+    assert forward(["cpath"]) == 1
+    assert "not supported on this platform" in capsys.readouterr().err
+
+
+def test_serve_refuses_a_shared_fallback_directory(tmp_path: Path, monkeypatch) -> None:
+    shared = tmp_path / f"hsutools-{os.getuid()}"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    monkeypatch.delenv("HSU_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", None)
+
+    result = runner.invoke(app, ["serve"])
+
+    assert result.exit_code == 1
+    assert "0700" in result.output
+    assert not (shared / "hsu.sock").exists()
+
+
+def test_profile_prints_phase_table(tmp_path: Path) -> None:
+    Image.new("RGB", (100, 50)).save(tmp_path / "photo.jpg")
+    dump = tmp_path / "hsu.prof"
+    result = runner.invoke(
+        app,
+        ["--profile-dump", str(dump), "resize", "--input", str(tmp_path), "--output", str(tmp_path / "out"), "--width", "50"],
+    )
+
+    assert result.exit_code == 0
+    phases = {line.split()[0] for line in result.output.splitlines()[-8:] if line.strip()}
+    assert {"scan", "plan", "decode", "resample", "encode", "wall"} <= phases
+    assert pstats.Stats(str(dump)).total_calls > 0
+    assert not profiling.enabled()
+
+
+def test_metrics_file_textfile_format(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("a.jpg", "b.jpg"):
+        Image.new("RGB", (100, 50)).save(input_dir / name)
+    metrics = tmp_path / "resize.prom"
+    args = ["resize", "--input", str(input_dir), "--output", str(tmp_path / "out"), "--width", "50"]
+
+    assert runner.invoke(app, [*args, "--metrics-file", str(metrics)]).exit_code == 0
+    samples = dict(line.rsplit(" ", 1) for line in metrics.read_text().splitlines() if not line.startswith("#"))
+    assert samples['hsutools_items{command="resize",state="processed"}'] == "2"
+    assert int(samples['hsutools_bytes{command="resize",direction="written"}']) > 0
+    assert 'hsutools_phase_seconds{command="resize",phase="encode"}' in samples
+
+    assert runner.invoke(app, [*args, "--metrics-file", str(metrics)]).exit_code == 0
+    samples = dict(line.rsplit(" ", 1) for line in metrics.read_text().splitlines() if not line.startswith("#"))
+    assert samples['hsutools_items{command="resize",state="skipped"}'] == "2"
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith(".")] == []
+
+
 def test_resize_command(tmp_path: Path) -> None:
     input_dir = tmp_path / "input"
     output_dir = tmp_path / "output"
@@ -96,3 +317,295 @@ def test_resize_command(tmp_path: Path) -> None:
     assert resized.exists()
     with Image.open(resized) as img:
         assert img.size == (50, 25)
+
+
+def test_resize_memory_bounded(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+
+    for name in ("a.jpg", "b.jpg"):
+        Image.new("RGB", (800, 400), color=(0, 128, 255)).save(input_dir / name)
+    Image.new("RGB", (400, 200), color=(0, 128, 255)).save(input_dir / "c.png")
+    args = [
+        "resize",
+        "--input",
+        str(input_dir),
+        "--output",
+        str(output_dir),
+        "--width",
+        "100",
+        "--jobs",
+        "3",
+        "--max-pixels",
+        "100000",
+    ]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    for name in ("a.jpg", "b.jpg", "c.png"):
+        with Image.open(output_dir / name) as img:
+            assert img.size == (100, 50)
+
+    # Only JPEG decodes at reduced scale; a bigger PNG cannot fit the cap.
+    Image.new("RGB", (800, 400)).save(input_dir / "d.png")
+    result = runner.invoke(app, [*args, "--overwrite"])
+
+    assert result.exit_code == 1
+    assert "d.png: decoding needs 800x400 pixels, more than max_pixels (100000)" in result.output
+    assert not (output_dir / "d.png").exists()
+
+
+def test_resize_dry_run_and_passthrough(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+    Image.new("RGB", (400, 200)).save(input_dir / "big.png")
+    Image.new("RGB", (40, 20)).save(input_dir / "small.png")
+
+    args = ["resize", "--input", str(input_dir), "--output", str(output_dir), "--max-width", "100"]
+    result = runner.invoke(app, [*args, "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "resize big.png  400x200 → 100x50" in result.stdout
+    assert "copy   small.png" in result.stdout
+    assert not output_dir.exists()
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    assert (output_dir / "small.png").read_bytes() == (input_dir / "small.png").read_bytes()
+    with Image.open(output_dir / "big.png") as img:
+        assert img.size == (100, 50)
+
+
+def test_resize_bench_reports_profiles(tmp_path: Path) -> None:
+    for i in range(3):
+        Image.new("RGB", (120, 80), color=(i * 40, 90, 160)).save(tmp_path / f"p{i}.jpg")
+
+    result = runner.invoke(app, ["resize-bench", "--input", str(tmp_path), "--width", "60", "--sample", "2"])
+
+    assert result.exit_code == 0
+    for profile in ("fast", "balanced", "smallest"):
+        assert profile in result.stdout
+    assert "JPEG" in result.stdout
+
+
+def test_resize_encoder_profile(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    Image.new("RGB", (200, 100)).save(input_dir / "a.png")
+
+    result = runner.invoke(
+        app,
+        ["resize", "--input", str(input_dir), "--width", "100", "--format", "jpeg", "--encoder-profile", "smallest"],
+    )
+
+    assert result.exit_code == 0
+    with Image.open(input_dir / "resized" / "a.jpeg") as img:
+        assert img.info.get("progressive") == 1
+
+    result = runner.invoke(app, ["resize", "--input", str(input_dir), "--encoder-profile", "tiny"])
+    assert result.exit_code != 0
+
+
+def test_resize_checkpoint_resumes(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    checkpoint = tmp_path / "job.ckpt"
+    input_dir.mkdir()
+    for name in ("a.png", "b.png"):
+        Image.new("RGB", (200, 100)).save(input_dir / name)
+    args = ["resize", "--input", str(input_dir), "--output", str(output_dir), "--width", "50"]
+
+    result = runner.invoke(app, [*args, "--checkpoint", str(checkpoint)])
+
+    assert result.exit_code == 0
+    assert sorted(checkpoint.read_text(encoding="utf-8").split()) == ["a.png", "b.png"]
+    assert not list(output_dir.glob(".*.tmp"))
+
+    (output_dir / "a.png").unlink()
+    Image.new("RGB", (200, 100)).save(input_dir / "c.png")
+    result = runner.invoke(app, [*args, "--checkpoint", str(checkpoint), "--overwrite"])
+
+    assert result.exit_code == 0
+    assert not (output_dir / "a.png").exists()
+    assert (output_dir / "c.png").exists()
+
+
+def test_resize_report(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    Image.new("RGB", (200, 100)).save(input_dir / "a.jpg")
+    Image.new("RGB", (20, 10)).save(input_dir / "b.jpg")
+    report = tmp_path / "timings.json"
+
+    result = runner.invoke(
+        app,
+        ["resize", "--input", str(input_dir), "--max-width", "100", "--report", str(report)],
+    )
+
+    assert result.exit_code == 0
+    assert "images/s" in result.stdout
+    payload = json.loads(report.read_text(encoding="utf-8"))
+    assert payload["summary"]["images"] == 2
+    assert {"decode", "transpose", "resample", "encode", "copy"} <= set(payload["summary"]["phases"])
+    by_name = {Path(row["source"]).name: row for row in payload["images"]}
+    assert by_name["a.jpg"]["output_pixels"] == 100 * 50
+    assert by_name["b.jpg"]["action"] == "copy"
+
+
+def test_resize_output_archive(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    (input_dir / "sub").mkdir(parents=True)
+    Image.new("RGB", (200, 100)).save(input_dir / "a.jpg")
+    Image.new("RGB", (200, 100)).save(input_dir / "sub" / "b.png")
+    base = ["resize", "--input", str(input_dir), "--width", "50", "--recursive", "--jobs", "2"]
+
+    result = runner.invoke(app, [*base, "--output-archive", str(tmp_path / "out.zip")])
+
+    assert result.exit_code == 0
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert sorted(archive.namelist()) == ["a.jpg", "sub/b.png"]
+        with archive.open("sub/b.png") as member, Image.open(member) as img:
+            assert img.size == (50, 25)
+    assert not (input_dir / "resized").exists()
+
+    result = runner.invoke(app, [*base, "--output-archive", str(tmp_path / "out.tar")])
+
+    assert result.exit_code == 0
+    with tarfile.open(tmp_path / "out.tar") as archive:
+        assert sorted(archive.getnames()) == ["a.jpg", "sub/b.png"]
+
+    for conflict in (["--watch"], ["--dry-run"], ["--checkpoint", str(tmp_path / "job.ckpt")]):
+        result = runner.invoke(app, [*base, "--output-archive", str(tmp_path / "late.zip"), *conflict])
+
+        assert result.exit_code == 2
+        assert "--output-archive cannot be combined" in result.output
+    assert not (tmp_path / "late.zip").exists()
+
+
+def test_resize_watch_rejects_batch_only_options(tmp_path: Path) -> None:
+    base = ["resize", "--input", str(tmp_path), "--width", "50", "--watch"]
+    conflicts = (
+        ["--report", str(tmp_path / "timings.json")],
+        ["--checkpoint", str(tmp_path / "job.ckpt")],
+        ["--dedup", "link"],
+        ["--metrics-file", str(tmp_path / "hsu.prom")],
+    )
+    for conflict in conflicts:
+        result = runner.invoke(app, [*base, *conflict])
+
+        assert result.exit_code == 2
+        assert "--watch cannot be combined" in result.output
+    assert sorted(path.name for path in tmp_path.iterdir()) == []
+
+
+def test_resize_dedup_links_identical_sources(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for folder in ("x", "y", "z"):
+        (input_dir / folder).mkdir(parents=True)
+    Image.new("RGB", (200, 100), color=(1, 2, 3)).save(input_dir / "x" / "photo.png")
+    for folder in ("y", "z"):
+        (input_dir / folder / "copy.png").write_bytes((input_dir / "x" / "photo.png").read_bytes())
+    Image.new("RGB", (200, 100), color=(9, 9, 9)).save(input_dir / "z" / "other.png")
+
+    result = runner.invoke(
+        app,
+        [
+            "resize",
+            "--input",
+            str(input_dir),
+            "--output",
+            str(output_dir),
+            "--width",
+            "50",
+            "--recursive",
+            "--dedup",
+            "link",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Resized 4 image(s)" in result.stdout
+    primary = output_dir / "x" / "photo.png"
+    for folder in ("y", "z"):
+        assert (output_dir / folder / "copy.png").samefile(primary)
+    assert not (output_dir / "z" / "other.png").samefile(primary)
+
+
+def test_s2tw_parallel_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HSU_CACHE_DIR", str(tmp_path / "cache"))
+    modes = (("serial", []), ("parallel", ["--jobs", "2"]), ("compiled", ["--engine", "compiled", "--jobs", "2"]))
+    for mode, extra in modes:
+        root = tmp_path / mode
+        (root / "简体目录").mkdir(parents=True)
+        (root / "简体目录" / "说明.md").write_text("软件信息", encoding="utf-8")
+        (root / "readme.md").write_text("这是测试", encoding="utf-8")
+        (root / "plain.txt").write_text("ascii only", encoding="utf-8")
+
+        result = runner.invoke(
+            app,
+            ["s2tw", "--path", str(root), "--backup-dir", str(tmp_path / f"{mode}-backup"), *extra],
+            input="y\n",
+        )
+
+        assert result.exit_code == 0
+        assert "File content modified: 2" in result.stdout
+        assert "Files renamed: 1" in result.stdout
+        assert "Directories renamed: 1" in result.stdout
+        assert "Files backed up: 2" in result.stdout
+        assert (root / "簡體目錄" / "說明.md").read_text(encoding="utf-8") == "軟體資訊"
+        assert (root / "readme.md").read_text(encoding="utf-8") == "這是測試"
+
+
+def test_s2tw_check_reports_without_writing(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    (root / "简体目录").mkdir(parents=True)
+    (root / "简体目录" / "notes.md").write_text("# Title\n\nplain line\n使用软件。\n", encoding="utf-8")
+    (root / "done.md").write_text("已經是繁體\n", encoding="utf-8")
+    for skipped in (".hidden", "node_modules"):
+        (root / skipped).mkdir()
+        (root / skipped / "x.md").write_text("软件", encoding="utf-8")
+    before = sorted(p.relative_to(root) for p in root.rglob("*"))
+
+    for extra in ([], ["--jobs", "2"]):
+        result = runner.invoke(app, ["s2tw", "--path", str(root), "--check", "--json", "--ignore", "node_modules", *extra])
+
+        assert result.exit_code == 1
+        hits = json.loads(result.stdout)
+        assert [(Path(hit["path"]).name, hit["kind"]) for hit in hits] == [("简体目录", "name"), ("notes.md", "content")]
+        assert (hits[1]["line"], hits[1]["column"]) == (4, 3)
+        assert (hits[1]["original"], hits[1]["converted"]) == ("软件", "軟體")
+    assert sorted(p.relative_to(root) for p in root.rglob("*")) == before
+    assert not list(tmp_path.glob("*.backup"))
+
+    clean = runner.invoke(app, ["s2tw", "--path", str(root / "done.md"), "--check"])
+    assert clean.exit_code == 0
+    assert "Nothing to convert." in clean.stdout
+
+    for conflict in (["--office"], ["--manifest", str(tmp_path / "m.sqlite")], ["--metrics-file", str(tmp_path / "m.prom")]):
+        result = runner.invoke(app, ["s2tw", "--path", str(root), "--check", *conflict])
+        assert result.exit_code == 2
+        assert "--check cannot be combined" in result.output
+    result = runner.invoke(app, ["s2tw", "--path", str(root), "--json"], input="y\n")
+    assert result.exit_code == 2
+    assert "--json only applies to --check" in result.output
+    assert sorted(p.relative_to(root) for p in root.rglob("*")) == before
+
+    # A file given directly is not renamed by the conversion, so not reported.
+    (root / "简体.md").write_text("已經是繁體\n", encoding="utf-8")
+    clean = runner.invoke(app, ["s2tw", "--path", str(root / "简体.md"), "--check"])
+    assert clean.exit_code == 0
+    result = runner.invoke(app, ["s2tw", "--path", str(root / "简体.md"), "--no-backup"], input="y\n")
+    assert result.exit_code == 0 and (root / "简体.md").exists()
+    (root / "简体.md").unlink()
+
+    # The real run changes exactly what the check reported.
+    result = runner.invoke(app, ["s2tw", "--path", str(root), "--no-backup", "--ignore", "node_modules"], input="y\n")
+    assert result.exit_code == 0
+    assert (root / "簡體目錄" / "notes.md").read_text(encoding="utf-8").endswith("使用軟體。\n")
+    assert (root / ".hidden" / "x.md").read_text(encoding="utf-8") == "软件"
+    assert (root / "node_modules" / "x.md").read_text(encoding="utf-8") == "软件"
@@ -0,0 +1,169 @@
+import asyncio
+import io
+import threading
+import time
+
+from PIL import Image
+
+from hsutools.core import (
+    ResizeReport,
+    aresize_image_bytes,
+    iter_resize_bytes,
+    iter_resize_images,
+    resize_image_bytes,
+    resize_images,
+    watch_resize,
+)
+
+
+def _encoded(size: tuple[int, int], fmt: str = "PNG") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(200, 10, 10)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def test_resize_image_bytes_accepts_buffers() -> None:
+    data = _encoded((200, 100))
+
+    for source in (data, bytearray(data), memoryview(data), io.BytesIO(data)):
+        output = resize_image_bytes(source, width=50)
+        with Image.open(io.BytesIO(output)) as img:
+            assert img.format == "PNG"
+            assert img.size == (50, 25)
+
+
+def test_iter_and_async_resize_bytes() -> None:
+    sources = [_encoded((100 + i * 10, 100), "JPEG") for i in range(5)]
+
+    outputs = list(iter_resize_bytes(sources, width=20, output_format="webp", jobs=2))
+
+    assert len(outputs) == 5
+    with Image.open(io.BytesIO(outputs[4])) as img:
+        assert img.format == "WEBP"
+        assert img.size == (20, 14)
+
+    output = asyncio.run(aresize_image_bytes(sources[0], width=10))
+    with Image.open(io.BytesIO(output)) as img:
+        assert img.size == (10, 10)
+
+
+def test_iter_resize_images_yields_outputs_as_written(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        Image.new("RGB", (80 + i, 40)).save(input_dir / f"{i}.png")
+    report = ResizeReport()
+
+    outputs = iter_resize_images(input_dir, width=20, report=report)
+    first = next(outputs)
+    with Image.open(first) as img:
+        assert img.size == (20, 10)
+    rest = list(outputs)
+
+    assert sorted(path.name for path in [first, *rest]) == ["0.png", "1.png", "2.png"]
+    assert report.summary()["images"] == 3
+    assert resize_images(input_dir, width=20) == []
+
+
+def test_iter_resize_images_streams_large_trees(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i in range(60):
+        Image.new("RGB", (40, 20)).save(input_dir / f"{i:02}.png")
+    report = ResizeReport()
+
+    outputs = iter_resize_images(input_dir, width=10, report=report)
+    next(outputs)
+
+    # Only a bounded window of the walk is ahead of the first output.
+    assert report.scanned < 60
+    assert len(list(outputs)) == 59
+    assert report.scanned == 60
+
+
+def test_resize_keeps_formats_of_aliased_extensions(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    Image.new("RGB", (300, 200)).save(input_dir / "scan.tif", format="TIFF")
+    Image.new("RGB", (300, 200)).save(input_dir / "photo.jfif", format="JPEG")
+
+    for max_pixels in (None, 100_000):
+        output_dir = tmp_path / f"output-{max_pixels}"
+        outputs = resize_images(input_dir, output_dir=output_dir, width=30, max_pixels=max_pixels)
+
+        assert sorted(path.name for path in outputs) == ["photo.jfif", "scan.tif"]
+        for name, fmt in (("scan.tif", "TIFF"), ("photo.jfif", "JPEG")):
+            with Image.open(output_dir / name) as img:
+                assert (img.format, img.size) == (fmt, (30, 20))
+
+
+def test_memory_bounded_mode_resizes_palette_images(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    palette = Image.new("RGB", (400, 400), color=(0, 128, 255)).convert("P", palette=Image.Palette.ADAPTIVE)
+    palette.save(input_dir / "icon.gif")
+    Image.new("1", (400, 400), color=1).save(input_dir / "mask.png")
+
+    outputs = resize_images(input_dir, output_dir=tmp_path / "output", width=20, max_pixels=1_000_000)
+
+    assert sorted(path.name for path in outputs) == ["icon.gif", "mask.png"]
+    with Image.open(tmp_path / "output" / "icon.gif") as img:
+        assert img.size == (20, 20)
+        assert img.convert("RGB").getpixel((10, 10)) == (0, 128, 255)
+    with Image.open(tmp_path / "output" / "mask.png") as img:
+        assert img.size == (20, 20)
+
+
+def test_memory_bounded_mode_keeps_pillow_bomb_limit(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i in range(2):
+        Image.new("RGB", (200, 100)).save(input_dir / f"{i}.png")
+    limit = Image.MAX_IMAGE_PIXELS
+
+    outputs = iter_resize_images(input_dir, width=20, max_pixels=30_000)
+    next(outputs)
+    assert Image.MAX_IMAGE_PIXELS == limit
+    list(outputs)
+    assert Image.MAX_IMAGE_PIXELS == limit
+
+
+def test_watch_resize_processes_new_files(tmp_path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    (input_dir / "old").mkdir(parents=True)
+    Image.new("RGB", (80, 40)).save(input_dir / "old" / "existing.png")
+
+    limit = Image.MAX_IMAGE_PIXELS
+    for use_inotify in (True, False):
+        stop = threading.Event()
+        seen = []
+        watcher = threading.Thread(
+            target=watch_resize,
+            args=(input_dir,),
+            kwargs=dict(
+                output_dir=output_dir,
+                width=20,
+                settle=0.2,
+                poll_interval=0.1,
+                max_pixels=30_000,
+                use_inotify=use_inotify,
+                stop_event=stop,
+                callback=lambda src, dst, err: seen.append((src.name, err)),
+            ),
+        )
+        watcher.start()
+        time.sleep(0.3)
+        assert Image.MAX_IMAGE_PIXELS == limit
+        (input_dir / "new").mkdir(exist_ok=True)
+        Image.new("RGB", (80, 40)).save(input_dir / "new" / f"arrived-{use_inotify}.png")
+        deadline = time.monotonic() + 5
+        while not seen and time.monotonic() < deadline:
+            time.sleep(0.05)
+        stop.set()
+        watcher.join()
+
+        assert seen == [(f"arrived-{use_inotify}.png", None)]
+        with Image.open(output_dir / "new" / f"arrived-{use_inotify}.png") as img:
+            assert img.size == (20, 10)
+    assert not (output_dir / "old" / "existing.png").exists()
@@ -0,0 +1,282 @@
+import random
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from opencc import OpenCC
+
+from hsutools.core import convert_s2tw_recursive, get_converter, iter_convert_s2tw_recursive, s2tw
+from hsutools.core.s2tw import _convert_name_cached, convert_name, convert_text_s2tw
+from hsutools.core.s2tw_engine import CompiledConverter, _chain_files, _read_dictionary
+
+
+def test_get_converter_is_shared_across_threads() -> None:
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(get_converter())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(converter is seen[0] for converter in seen)
+    assert get_converter("s2twp") is seen[0]
+    assert convert_text_s2tw("简体中文") == "簡體中文"
+
+
+def test_convert_name_is_memoized() -> None:
+    assert convert_name("软件说明") == "軟體說明"
+    hits = _convert_name_cached.cache_info().hits
+    assert convert_name("软件说明", get_converter()) == "軟體說明"
+    assert _convert_name_cached.cache_info().hits == hits + 1
+
+
+def test_streaming_conversion_matches_whole_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(s2tw, "_STREAM_CHUNK", 7)
+    text = "软件开发\r\n简体中文，信息技术。\n" * 5 + "没有分隔符的很长一段内存文本" * 3
+    source = tmp_path / "big.txt"
+    source.write_bytes(text.encode("utf-8"))
+    source.chmod(0o750)
+
+    result = s2tw.convert_file_content(source, streaming=True, backup_dir=tmp_path / "backup")
+
+    assert result.content_changed and result.error is None
+    assert source.read_bytes().decode("utf-8") == convert_text_s2tw(text)
+    assert source.stat().st_mode & 0o777 == 0o750
+    assert result.backup_path.read_bytes() == text.encode("utf-8")
+
+    plain = tmp_path / "plain.txt"
+    plain.write_text("nothing to convert\n" * 10, encoding="utf-8")
+    inode = plain.stat().st_ino
+    result = s2tw.convert_file_content(plain, streaming=True)
+    assert not result.content_changed
+    assert plain.stat().st_ino == inode
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["backup", "big.txt", "plain.txt"]
+
+
+def test_prefilter_skips_files_without_convertible_characters(tmp_path) -> None:
+    class Refusing:
+        conversion = "s2twp"
+
+        def convert(self, text: str) -> str:
+            raise AssertionError(f"converted {text!r}")
+
+    english = tmp_path / "readme.md"
+    english.write_text("plain ASCII only\n", encoding="utf-8")
+    latin = tmp_path / "notes.txt"
+    latin.write_text("café ÷ naïve\n", encoding="utf-8")
+
+    for path in (english, latin):
+        for streaming in (False, True):
+            result = s2tw.convert_file_content(path, Refusing(), streaming=streaming)
+            assert result.error is None and not result.content_changed
+
+    prefilter = s2tw._prefilter_for(get_converter())
+    assert prefilter.may_change("简体")
+    assert not prefilter.may_change("ASCII only")
+
+
+# Differential corpus for the compiled engine: overlapping phrases, keys
+# spanning separators, ASCII inside keys, astral characters and text the
+# dictionaries do not touch.
+_CORPUS = [
+    "",
+    "这是一个简体中文的测试文本，包含软件开发、信息技术和内存管理等词汇。",
+    "我们正在进行数据库查询优化；鼠标和打印机都坏了！",
+    "乔治．布希与乔治布希 SQL注入攻击 PN结 sql注入",
+    "台湾的计程车与出租车，发发发，干干净净的头发。",
+    "面条里面有许多面，後面还有一个面包。",
+    "繁體中文保持不變，English text stays put.",
+    "emoji 😀 与 𠮷 字符\r\n第二行\t制表符",
+]
+
+
+def test_compiled_engine_matches_opencc(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HSU_CACHE_DIR", str(tmp_path))
+    reference = OpenCC("s2twp")
+    compiled = CompiledConverter("s2twp")
+    assert compiled.path.parent == tmp_path
+
+    keys = [key for stage in _chain_files("s2twp") for path in stage for key in _read_dictionary(path)]
+    rng = random.Random(20240601)
+    samples = list(_CORPUS)
+    for _ in range(3000):
+        words = [rng.choice(keys)[rng.randint(0, 2):] for _ in range(rng.randint(1, 6))]
+        samples.append("".join(word + rng.choice(["", "", "，", " ", "a"]) for word in words))
+
+    for text in samples:
+        assert compiled.convert(text) == reference.convert(text), text
+
+    # A second instance maps the file written by the first.
+    mtime = compiled.path.stat().st_mtime_ns
+    assert CompiledConverter("s2twp").convert(_CORPUS[1]) == reference.convert(_CORPUS[1])
+    assert compiled.path.stat().st_mtime_ns == mtime
+    assert convert_text_s2tw("软件", engine="compiled") == "軟體"
+
+
+def test_manifest_skips_unchanged_files(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a.md").write_text("软件", encoding="utf-8")
+    (root / "b.md").write_text("已經是繁體", encoding="utf-8")
+    manifest = tmp_path / "manifest.sqlite"
+    options = {"create_backup_files": False, "convert_names": False, "manifest": manifest}
+
+    _, stats = convert_s2tw_recursive(root, **options)
+    assert stats.files_content_modified == 1
+
+    def refuse(path, *args, **kwargs):
+        raise AssertionError(f"{path} was opened again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(s2tw, "convert_file_content", refuse)
+        for jobs in (1, 2):
+            results, stats = convert_s2tw_recursive(root, jobs=jobs, **options)
+            assert results == [] and stats.errors == 0
+            assert (stats.files_scanned, stats.files_unchanged, stats.bytes_read) == (2, 2, 0)
+
+    (root / "b.md").write_text("新的简体内容", encoding="utf-8")
+    _, stats = convert_s2tw_recursive(root, **options)
+    assert stats.files_content_modified == 1
+    assert stats.bytes_read == stats.bytes_written == len("新的簡體內容".encode("utf-8"))
+    assert (root / "b.md").read_text(encoding="utf-8") == "新的簡體內容"
+
+
+def test_iter_convert_yields_results_with_running_stats(tmp_path) -> None:
+    root = tmp_path / "docs"
+    (root / "简体").mkdir(parents=True)
+    (root / "简体" / "a.md").write_text("软件", encoding="utf-8")
+    (root / "b.md").write_text("已經是繁體", encoding="utf-8")
+
+    for jobs in (1, 2):
+        run = iter_convert_s2tw_recursive(root, create_backup_files=False, jobs=jobs)
+        first = next(run)
+        assert first.path == root / "简体" / "a.md" and first.content_changed
+        assert run.stats.files_content_modified == 1 and run.stats.dirs_renamed == 0
+        rest = list(run)
+        assert [result.new_path for result in rest] == [root / "簡體"]
+        assert run.stats.dirs_renamed == 1
+        (root / "簡體").rename(root / "简体")
+        (root / "简体" / "a.md").write_text("软件", encoding="utf-8")
+
+    with iter_convert_s2tw_recursive(root, create_backup_files=False) as run:
+        next(run)
+    assert list(run) == []
+    assert (root / "简体").is_dir()
+
+
+def test_backup_modes_keep_relative_paths(tmp_path) -> None:
+    for mode in ("link", "reflink", "tar", "zip"):
+        for jobs in (1, 2):
+            root = tmp_path / f"{mode}-{jobs}"
+            for folder in ("a", "b"):
+                (root / folder).mkdir(parents=True)
+                (root / folder / "same.md").write_text(f"软件{folder}", encoding="utf-8")
+            backup_dir = root / "backups"
+
+            results, stats = convert_s2tw_recursive(
+                root, backup_dir=backup_dir, backup_mode=mode, jobs=jobs, convert_names=False
+            )
+
+            assert stats.files_backed_up == 2 and stats.errors == 0
+            assert (root / "a" / "same.md").read_text(encoding="utf-8") == "軟體a"
+            (snapshot,) = backup_dir.iterdir()
+            assert {result.backup_path.name for result in results} <= {"same.md", snapshot.name}
+            if mode == "tar":
+                with tarfile.open(snapshot) as archive:
+                    saved = {name: archive.extractfile(name).read() for name in archive.getnames()}
+            elif mode == "zip":
+                with zipfile.ZipFile(snapshot) as archive:
+                    saved = {name: archive.read(name) for name in archive.namelist()}
+            else:
+                saved = {p.relative_to(snapshot).as_posix(): p.read_bytes() for p in snapshot.rglob("*.md")}
+            assert saved == {"a/same.md": "软件a".encode(), "b/same.md": "软件b".encode()}
+
+
+def test_parallel_conversion_keeps_a_bounded_window(tmp_path, monkeypatch) -> None:
+    read = []
+
+    def paths():
+        for i in range(1000):
+            read.append(i)
+            yield Path(f"{i}.md")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        batches = s2tw._map_batches(executor, lambda batch: batch, paths(), 2)
+        first = next(batches)
+        assert first == [Path(f"{i}.md") for i in range(s2tw._PARALLEL_BATCH)]
+        assert len(read) <= 4 * s2tw._PARALLEL_BATCH
+        assert len(first) + sum(map(len, batches)) == 1000
+
+    monkeypatch.setattr(s2tw, "_PARALLEL_BATCH", 2)
+    root = tmp_path / "docs"
+    for i in range(12):
+        (root / f"简体{i % 3}").mkdir(parents=True, exist_ok=True)
+        (root / f"简体{i % 3}" / f"{i}.md").write_text("软件" if i % 2 else "繁體", encoding="utf-8")
+    backup_dir = tmp_path / "backups"
+
+    results, stats = convert_s2tw_recursive(root, backup_dir=backup_dir, backup_mode="tar", jobs=2)
+
+    assert (stats.files_content_modified, stats.files_unchanged, stats.dirs_renamed) == (6, 6, 3)
+    assert {result.backup_path for result in results if result.content_changed} == {next(backup_dir.iterdir())}
+    assert all(path.read_text(encoding="utf-8") in {"軟體", "繁體"} for path in root.rglob("*.md"))
+    with tarfile.open(next(backup_dir.iterdir())) as archive:
+        assert len(archive.getnames()) == 6
+
+
+def test_snapshots_survive_later_runs(tmp_path) -> None:
+    root = tmp_path / "docs"
+    (root / "a").mkdir(parents=True)
+    for backup_dir in (root, None):
+        for jobs in (1, 2):
+            (root / "a" / "x.md").write_text("软件", encoding="utf-8")
+            for _ in range(2):
+                _, stats = convert_s2tw_recursive(
+                    root, backup_dir=backup_dir, backup_mode="link", jobs=jobs, convert_names=False
+                )
+                assert stats.errors == 0
+            assert (root / "a" / "x.md").read_text(encoding="utf-8") == "軟體"
+
+    snapshots = sorted(root.glob("s2tw-*")) + sorted(tmp_path.glob("s2tw-*"))
+    assert len(snapshots) == 4
+    for snapshot in snapshots:
+        assert [p.relative_to(snapshot).as_posix() for p in snapshot.rglob("*.md")] == ["a/x.md"]
+        assert (snapshot / "a" / "x.md").read_text(encoding="utf-8") == "软件"
+
+
+def test_office_documents_convert_text_nodes_only(tmp_path) -> None:
+    word = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    sheet = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    members = {
+        "word/document.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<w:document xmlns:w="{word}"><w:body>'
+            '<w:p><w:r><w:t xml:space="preserve">软件 &amp; 信息</w:t></w:r><w:r><w:t/></w:r></w:p>'
+            '<w:p><w:r><w:rPr><w:rFonts w:ascii="简体"/></w:rPr><w:t>English</w:t></w:r></w:p>'
+            "</w:body></w:document>"
+        ).encode("utf-8"),
+        "word/media/image1.png": bytes(range(256)) * 4,
+        "docProps/core.xml": "<title>简体标题</title>".encode("utf-8"),
+    }
+    document = tmp_path / "docs" / "report.docx"
+    document.parent.mkdir()
+    with zipfile.ZipFile(document, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    workbook = tmp_path / "docs" / "table.xlsx"
+    with zipfile.ZipFile(workbook, "w") as archive:
+        archive.writestr("xl/sharedStrings.xml", f'<sst xmlns="{sheet}"><si><t>内存</t></si></sst>')
+
+    _, stats = convert_s2tw_recursive(tmp_path / "docs", office=True, create_backup_files=False)
+
+    assert stats.files_content_modified == 2 and stats.errors == 0
+    with zipfile.ZipFile(document) as archive:
+        assert archive.namelist() == list(members)
+        xml = archive.read("word/document.xml").decode("utf-8")
+        assert '<w:t xml:space="preserve">軟體 &amp; 資訊</w:t>' in xml
+        assert 'w:ascii="简体"' in xml
+        assert xml.replace("軟體 &amp; 資訊", "软件 &amp; 信息").encode("utf-8") == members["word/document.xml"]
+        assert archive.read("word/media/image1.png") == members["word/media/image1.png"]
+        assert archive.read("docProps/core.xml") == members["docProps/core.xml"]
+    with zipfile.ZipFile(workbook) as archive:
+        assert "<t>記憶體</t>" in archive.read("xl/sharedStrings.xml").decode("utf-8")